@@ -0,0 +1,224 @@
+"""
+# Sequences of time instances stored as 64-bit integers.
+
+# &TimestampArray and &MeasureArray keep their elements in a single `array('q')`
+# or foreign buffer and only create &types.Timestamp or &types.Measure instances
+# when elements are accessed. Both expose their memory through the buffer protocol
+# so that columns can be handed to other libraries or written to disk without
+# conversion.
+
+#!/syntax/python
+	from fault.time import arrays
+	a = arrays.TimestampArray(event_timestamps)
+	hours = a.truncate('hour')
+	recent = a.ge(cutoff) # bytearray mask
+	column = memoryview(a) # Python 3.12+; otherwise a.view
+"""
+import array
+import operator
+
+from . import types
+from .index import key
+
+class Array(object):
+	"""
+	# Base class of the typed arrays.
+
+	# [ Properties ]
+	# /view/
+		# The `memoryview` of the elements formatted as `'q'`.
+	"""
+	__slots__ = ('view',)
+	Type = None
+
+	def __init__(self, items=()):
+		self.view = memoryview(array.array('q', [key(x) for x in items]))
+
+	@classmethod
+	def frombuffer(Class, buffer):
+		"""
+		# Create an array referring to the 64-bit integers in &buffer without copying.
+		"""
+		view = memoryview(buffer)
+		if view.format != 'q':
+			view = view.cast('B').cast('q')
+		a = Class.__new__(Class)
+		a.view = view
+		return a
+
+	@classmethod
+	def fromintegers(Class, integers):
+		"""
+		# Create an array from an iterable of &int with the precision of &Type.
+		"""
+		return Class.frombuffer(array.array('q', integers))
+
+	def __buffer__(self, flags):
+		return self.view.__buffer__(flags)
+
+	def __len__(self):
+		return len(self.view)
+
+	def __repr__(self):
+		return '<%s: %d elements>' %(self.__class__.__name__, len(self.view))
+
+	def __iter__(self):
+		return map(self.Type, self.view)
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			# Slices refer to the same memory.
+			return self.frombuffer(self.view[index])
+		return self.Type(self.view[index])
+
+	def __setitem__(self, index, value):
+		if isinstance(index, slice):
+			# Slice assignment replaces elements; the length can not change.
+			if isinstance(value, Array):
+				values = value.view
+			else:
+				values = memoryview(array.array('q', [key(x) for x in value]))
+			if len(values) != len(range(*index.indices(len(self.view)))):
+				raise ValueError("slice assignment can not change the length of the array")
+			self.view[index] = values
+		else:
+			self.view[index] = key(value)
+
+	def __eq__(self, ob):
+		if isinstance(ob, Array):
+			return self.Type is ob.Type and self.view == ob.view
+		return NotImplemented
+
+	def tobytes(self) -> bytes:
+		"""
+		# Copy the elements into &bytes in native byte order.
+		"""
+		return self.view.tobytes()
+
+	def integers(self) -> array.array:
+		"""
+		# Copy the elements into a new `array('q')`.
+		"""
+		return array.array('q', self.view)
+
+	def _map(self, function):
+		return self.fromintegers(map(function, self.view))
+
+	def _mask(self, op, value):
+		k = key(value)
+		return bytearray([op(x, k) for x in self.view])
+
+	def lt(self, value) -> bytearray:
+		"""
+		# Mask of the elements less than &value.
+		"""
+		return self._mask(operator.lt, value)
+
+	def le(self, value) -> bytearray:
+		"""
+		# Mask of the elements less than or equal to &value.
+		"""
+		return self._mask(operator.le, value)
+
+	def gt(self, value) -> bytearray:
+		"""
+		# Mask of the elements greater than &value.
+		"""
+		return self._mask(operator.gt, value)
+
+	def ge(self, value) -> bytearray:
+		"""
+		# Mask of the elements greater than or equal to &value.
+		"""
+		return self._mask(operator.ge, value)
+
+	def eq(self, value) -> bytearray:
+		"""
+		# Mask of the elements equal to &value.
+		"""
+		return self._mask(operator.eq, value)
+
+	def ne(self, value) -> bytearray:
+		"""
+		# Mask of the elements not equal to &value.
+		"""
+		return self._mask(operator.ne, value)
+
+	def select(self, mask):
+		"""
+		# Create an array of the elements whose position in &mask is true.
+		"""
+		return self.fromintegers([x for x, m in zip(self.view, mask) if m])
+
+	def _delta(self, measure):
+		# The definite nanoseconds of the measure; &None for subjective measures.
+		if getattr(measure, 'kind', 'definite') == 'subjective':
+			return None
+		return key(measure)
+
+	def elapse(self, measure):
+		"""
+		# Create an array with &measure added to each element.
+		"""
+		d = self._delta(measure)
+		if d is None:
+			Type = self.Type
+			return self._map(lambda x: int(Type(x).elapse(measure)))
+		return self._map(lambda x: x + d)
+
+	def rollback(self, measure):
+		"""
+		# Create an array with &measure subtracted from each element.
+		"""
+		d = self._delta(measure)
+		if d is None:
+			Type = self.Type
+			return self._map(lambda x: int(Type(x).rollback(measure)))
+		return self._map(lambda x: x - d)
+
+	def truncate(self, unit):
+		"""
+		# Create an array with each element truncated to the precision of &unit.
+
+		# Units in the same term as the elements are truncated arithmetically;
+		# others, like month and year, are truncated per element with the
+		# results cached by day.
+		"""
+		Type = self.Type
+		context = Type.context
+		if context.terms[unit] == Type.liketerm:
+			p = context.convert(unit, Type.unit, 1)
+			if p != int(p):
+				raise ValueError("unit is smaller than the element precision")
+			p = int(p)
+			return self._map(lambda x: x - (x % p))
+
+		day = int(context.convert('day', Type.unit, 1))
+		cache = {}
+		def truncate(x):
+			d = x // day
+			t = cache.get(d)
+			if t is None:
+				t = cache[d] = int(Type(d * day).truncate(unit))
+			return t
+		return self._map(truncate)
+
+class TimestampArray(Array):
+	"""
+	# Array of &types.Timestamp.
+	"""
+	__slots__ = ()
+	Type = types.Timestamp
+
+class MeasureArray(Array):
+	"""
+	# Array of &types.Measure.
+	"""
+	__slots__ = ()
+	Type = types.Measure
+
+	def _delta(self, measure):
+		# Subjective measures have no fixed length without a point to apply them to.
+		if getattr(measure, 'kind', 'definite') == 'subjective':
+			raise ValueError("subjective measures can not be added to measures")
+		return key(measure)
@@ -0,0 +1,231 @@
+"""
+# Benchmarks for the hot paths of the time types.
+
+# Runs a fixed set of workloads with reproducible inputs and reports the operations
+# per second and the memory allocated by each. Results may be written as JSON for
+# comparison between runs.
+
+#!/syntax/sh
+	python -m fault.time.bench
+	python -m fault.time.bench --json results.json construct select
+"""
+import sys
+import gc
+import json
+import random
+import platform
+import tracemalloc
+import time
+
+from . import types
+from . import format
+from . import gregorian
+from . import views
+
+#: Default size of generated inputs.
+default_size = 2000
+
+#: Seed used to generate the inputs.
+default_seed = 0x7135
+
+def timestamps(rng, count):
+	"""
+	# Generate &count timestamps distributed across 1970 through 2070.
+	"""
+	lower = int(types.Timestamp.of(year=1970))
+	upper = int(types.Timestamp.of(year=2070))
+	return [types.Timestamp(rng.randrange(lower, upper)) for x in range(count)]
+
+def w_construct(rng, count):
+	dates = [
+		(rng.randrange(1900, 2100), rng.randrange(1, 13), rng.randrange(1, 29))
+		for x in range(count)
+	]
+	of = types.Timestamp.of
+	def run():
+		for d in dates:
+			of(date=d, hour=12, minute=30)
+	return run
+
+def w_select(rng, count):
+	pits = timestamps(rng, count)
+	def run():
+		for x in pits:
+			x.select('datetime')
+			x.select('minute', 'hour')
+	return run
+
+def w_truncate(rng, count):
+	pits = timestamps(rng, count)
+	def run():
+		for x in pits:
+			x.truncate('day')
+			x.truncate('month')
+	return run
+
+def w_format(rng, count):
+	pits = timestamps(rng, count)
+	def run():
+		for x in pits:
+			x.select('iso')
+	return run
+
+def w_parse(rng, count):
+	strings = [x.select('iso') for x in timestamps(rng, count)]
+	parse = format.parser('iso8601')
+	def run():
+		for x in strings:
+			parse(x)
+	return run
+
+def w_date_from_days(rng, count):
+	days = [rng.randrange(690000, 770000) for x in range(count)]
+	date_from_days = gregorian.date_from_days
+	def run():
+		for x in days:
+			date_from_days(x)
+	return run
+
+def _zone():
+	try:
+		return views.Zone.open(types.from_unix_timestamp, 'America/Los_Angeles')
+	except (OSError, TypeError):
+		return None
+
+def w_zone_find(rng, count):
+	z = _zone()
+	if z is None:
+		return None
+	pits = timestamps(rng, count)
+	def run():
+		for x in pits:
+			z.find(x)
+	return run
+
+def w_zone_localize(rng, count):
+	z = _zone()
+	if z is None:
+		return None
+	pits = timestamps(rng, count)
+	def run():
+		for x in pits:
+			z.localize(x)
+	return run
+
+#: Workload factories by name. Factories return &None when the workload is unavailable.
+workloads = {
+	'construct': w_construct,
+	'select': w_select,
+	'truncate': w_truncate,
+	'format': w_format,
+	'parse': w_parse,
+	'date_from_days': w_date_from_days,
+	'zone_find': w_zone_find,
+	'zone_localize': w_zone_localize,
+}
+
+def measure(run, count, repeat=3, clock=time.perf_counter_ns):
+	"""
+	# Execute &run &repeat times and once more under &tracemalloc.
+
+	# Returns a dictionary with the best observed operations per second and
+	# the memory allocated by a single execution.
+	"""
+	best = None
+	gc.collect()
+	enabled = gc.isenabled()
+	gc.disable()
+	try:
+		for x in range(repeat):
+			start = clock()
+			run()
+			duration = clock() - start
+			if best is None or duration < best:
+				best = duration
+	finally:
+		if enabled:
+			gc.enable()
+
+	tracemalloc.start()
+	try:
+		before = tracemalloc.take_snapshot()
+		run()
+		current, peak = tracemalloc.get_traced_memory()
+		after = tracemalloc.take_snapshot()
+	finally:
+		tracemalloc.stop()
+
+	stats = after.compare_to(before, 'filename')
+	blocks = sum(x.count_diff for x in stats if x.count_diff > 0)
+
+	return {
+		'operations': count,
+		'nanoseconds': best,
+		'ops_per_second': (count * 1000000000 / best) if best else None,
+		'peak_bytes': peak,
+		'retained_blocks': blocks,
+	}
+
+def execute(names=None, size=default_size, seed=default_seed, repeat=3):
+	"""
+	# Run the identified workloads, or all of them when &names is &None.
+
+	# Returns a dictionary suitable for JSON serialization.
+	"""
+	results = {}
+	for name in (names or workloads):
+		rng = random.Random(seed)
+		run = workloads[name](rng, size)
+		if run is None:
+			results[name] = None
+			continue
+		results[name] = measure(run, size, repeat=repeat)
+
+	return {
+		'python': platform.python_implementation() + ' ' + platform.python_version(),
+		'size': size,
+		'seed': seed,
+		'repeat': repeat,
+		'workloads': results,
+	}
+
+def report(data, file=sys.stdout):
+	"""
+	# Write a table of the results produced by &execute.
+	"""
+	file.write("%-16s %14s %12s %10s\n" %('workload', 'ops/s', 'peak-bytes', 'blocks'))
+	for name, r in data['workloads'].items():
+		if r is None:
+			file.write("%-16s %14s\n" %(name, 'unavailable'))
+			continue
+		file.write("%-16s %14.1f %12d %10d\n" %(
+			name, r['ops_per_second'], r['peak_bytes'], r['retained_blocks']
+		))
+
+def main(args):
+	import argparse
+	p = argparse.ArgumentParser(prog='python -m fault.time.bench')
+	p.add_argument('names', nargs='*', metavar='workload',
+		help="workloads to run: " + ', '.join(workloads))
+	p.add_argument('--size', type=int, default=default_size)
+	p.add_argument('--seed', type=int, default=default_seed)
+	p.add_argument('--repeat', type=int, default=3)
+	p.add_argument('--json', dest='output', default=None,
+		help="write the results as JSON to the given path; '-' for standard output")
+	options = p.parse_args(args)
+	for x in options.names:
+		if x not in workloads:
+			p.error("unknown workload: " + x)
+
+	data = execute(options.names or None, options.size, options.seed, options.repeat)
+	if options.output == '-':
+		json.dump(data, sys.stdout, indent=2)
+		sys.stdout.write('\n')
+	else:
+		report(data)
+		if options.output:
+			with open(options.output, 'w') as f:
+				json.dump(data, f, indent=2)
+
+if __name__ == '__main__':
+	main(sys.argv[1:])
@@ -0,0 +1,39 @@
+"""
+# Publish the current time and local zone offset into shared memory for
+# &.sysclock.Published readers.
+
+# The segment name defaults to &.sysclock.published_name and the zone to the
+# local zone. The segment is removed when interrupted or terminated.
+
+#!/syntax/sh
+	python -m fault.time.bin.clockd
+	python -m fault.time.bin.clockd --zone America/New_York --interval 0.5 clock-ny
+"""
+import sys
+import signal
+from .. import sysclock
+from .. import views
+from .. import types
+
+def publish_local_time(args):
+	import argparse
+	p = argparse.ArgumentParser(prog='python -m fault.time.bin.clockd')
+	p.add_argument('name', nargs='?', default=sysclock.published_name)
+	p.add_argument('--zone', default=None, help="zone to publish the offset of; defaults to the local zone")
+	p.add_argument('--interval', type=float, default=0.064, help="seconds between updates")
+	options = p.parse_args(args)
+
+	zone = views.Zone.open(types.from_unix_timestamp, options.zone)
+	publisher = sysclock.Publisher(options.name, zone)
+
+	# Remove the segment when terminated as well.
+	signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+	try:
+		publisher.run(options.interval)
+	except KeyboardInterrupt:
+		sys.exit(0)
+	finally:
+		publisher.close()
+
+if __name__ == '__main__':
+	publish_local_time(sys.argv[1:])
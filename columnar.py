@@ -0,0 +1,273 @@
+"""
+# Bulk conversion of &types.Timestamp columns to and from Unix epoch integers, and
+# Arrow IPC output.
+
+# &types.Timestamp counts nanoseconds from the project's datum; analytics tools
+# usually expect integers counting from the Unix epoch. The conversion functions here
+# rewrite buffers of 64-bit integers in place at nanosecond, microsecond, millisecond,
+# or second resolution.
+
+#!/syntax/python
+	from fault.time import arrays, columnar
+	a = arrays.TimestampArray(pits)
+	columnar.to_unix(a.view, 'millisecond')
+	with open('events.arrows', 'wb') as f:
+		columnar.write_arrow(f, {'ts': a.view}, 'millisecond')
+
+# &write_arrow uses `pyarrow` when it is installed; otherwise, a builtin writer
+# emits the Arrow IPC streaming format for timestamp columns.
+"""
+import sys
+import array
+import struct
+
+from . import core
+
+#: Resolutions supported by the conversion functions and their Arrow `TimeUnit` codes.
+resolutions = {
+	'second': ('s', 0),
+	'millisecond': ('ms', 1),
+	'microsecond': ('us', 2),
+	'nanosecond': ('ns', 3),
+}
+
+_scale = {
+	'second': 1000000000,
+	'millisecond': 1000000,
+	'microsecond': 1000,
+	'nanosecond': 1,
+}
+
+def _view(buffer):
+	v = memoryview(buffer)
+	if v.format != 'q':
+		v = v.cast('B').cast('q')
+	return v
+
+def to_unix(buffer, resolution='nanosecond', delta=core.unix_epoch_delta * 1000000000):
+	"""
+	# Rewrite the &types.Timestamp integers in &buffer as integers of &resolution
+	# since the Unix epoch. Conversions to coarser resolutions floor the values.
+
+	# Returns the memoryview of &buffer.
+	"""
+	v = _view(buffer)
+	s = _scale[resolution]
+	if s == 1:
+		v[:] = array.array('q', [x + delta for x in v])
+	else:
+		v[:] = array.array('q', [(x + delta) // s for x in v])
+	return v
+
+def from_unix(buffer, resolution='nanosecond', delta=core.unix_epoch_delta * 1000000000):
+	"""
+	# Rewrite the Unix epoch integers of &resolution in &buffer as &types.Timestamp integers.
+
+	# Returns the memoryview of &buffer.
+	"""
+	v = _view(buffer)
+	s = _scale[resolution]
+	if s == 1:
+		v[:] = array.array('q', [x - delta for x in v])
+	else:
+		v[:] = array.array('q', [(x * s) - delta for x in v])
+	return v
+
+class _FlatBuffer(object):
+	"""
+	# Minimal forward writing flatbuffer encoder for the Arrow message tables.
+
+	# Tables are described as lists indexed by field identifier whose entries are &None,
+	# a `(struct_format, value)` scalar, or a `(kind, value)` reference where the kind
+	# is `'table'`, `'string'`, `'tables'`, or `'structs'`. Referenced objects are
+	# written after their referrer so that all offsets are positive.
+	"""
+
+	def __init__(self):
+		self.data = bytearray()
+
+	def _align(self, n, offset=0):
+		while (len(self.data) + offset) % n:
+			self.data.append(0)
+
+	def _patch(self, position, target):
+		struct.pack_into('<I', self.data, position, target - position)
+
+	def finish(self, root):
+		self.data += b'\0\0\0\0'
+		self._patch(0, self._table(root))
+		self._align(8)
+		return bytes(self.data)
+
+	def _table(self, fields):
+		# Layout the inline fields after the vtable offset.
+		layout = []
+		size = 4
+		for i, f in enumerate(fields):
+			if f is None:
+				layout.append(None)
+				continue
+			fmt = f[0] if len(f[0]) == 1 and f[0] not in 'ts' else 'I'
+			width = struct.calcsize('<' + fmt)
+			size += (-size) % width
+			layout.append((size, fmt))
+			size += width
+		size += (-size) % 8
+
+		vtable = struct.pack('<HH', 4 + 2 * len(fields), size)
+		vtable += b''.join(struct.pack('<H', x[0] if x else 0) for x in layout)
+
+		self._align(2)
+		vpos = len(self.data)
+		self.data += vtable
+		self._align(8)
+		tpos = len(self.data)
+		self.data += bytes(size)
+		struct.pack_into('<i', self.data, tpos, tpos - vpos)
+
+		deferred = []
+		for f, l in zip(fields, layout):
+			if f is None:
+				continue
+			offset, fmt = l
+			if fmt == 'I':
+				deferred.append((tpos + offset, f))
+			else:
+				struct.pack_into('<' + fmt, self.data, tpos + offset, f[1])
+
+		for position, (kind, value) in deferred:
+			self._patch(position, self._reference(kind, value))
+		return tpos
+
+	def _reference(self, kind, value):
+		if kind == 'table':
+			return self._table(value)
+		elif kind == 'string':
+			self._align(4)
+			pos = len(self.data)
+			b = value.encode('utf-8')
+			self.data += struct.pack('<I', len(b)) + b + b'\0'
+			return pos
+		elif kind == 'tables':
+			self._align(4)
+			pos = len(self.data)
+			self.data += struct.pack('<I', len(value)) + bytes(4 * len(value))
+			for i, t in enumerate(value):
+				self._patch(pos + 4 + (4 * i), self._table(t))
+			return pos
+		elif kind == 'structs':
+			fmt, items = value
+			self._align(8, 4)
+			pos = len(self.data)
+			self.data += struct.pack('<I', len(items))
+			for x in items:
+				self.data += struct.pack('<' + fmt, *x)
+			return pos
+		raise ValueError("unknown reference kind: " + kind)
+
+def _message(header_type, header, body_length):
+	# Message: version(V5), header_type, header, bodyLength
+	return _FlatBuffer().finish([
+		('h', 4),
+		('B', header_type),
+		('table', header),
+		('q', body_length),
+	])
+
+def _encapsulate(metadata):
+	return struct.pack('<iI', -1, len(metadata)) + metadata
+
+def schema_message(names, resolution='nanosecond', timezone='UTC') -> bytes:
+	"""
+	# Encode the Arrow IPC Schema message for timestamp columns named by &names.
+	"""
+	unit = resolutions[resolution][1]
+	ts = [('h', unit), ('string', timezone) if timezone else None]
+	fields = [
+		[
+			('string', name),
+			('?', True), # nullable; matches the fields written by pyarrow
+			('B', 10), # Type.Timestamp
+			('table', ts),
+			None, # dictionary
+			('tables', []), # children
+		]
+		for name in names
+	]
+	# Schema: endianness(Little), fields
+	schema = [('h', 0), ('tables', fields)]
+	return _encapsulate(_message(1, schema, 0))
+
+def record_batch_message(columns) -> bytes:
+	"""
+	# Encode the Arrow IPC RecordBatch message and body for the given sequence
+	# of 64-bit integer &columns.
+	"""
+	views = [_view(x) for x in columns]
+	length = len(views[0]) if views else 0
+	for v in views:
+		if len(v) != length:
+			raise ValueError("columns must have the same length")
+
+	nodes = []
+	buffers = []
+	body = bytearray()
+	for v in views:
+		nodes.append((length, 0))
+		buffers.append((len(body), 0)) # no validity bitmap
+		if sys.byteorder == 'little':
+			data = v.tobytes()
+		else:
+			a = array.array('q', v)
+			a.byteswap()
+			data = a.tobytes()
+		buffers.append((len(body), len(data)))
+		body += data
+		body += bytes((-len(body)) % 64)
+
+	batch = [
+		('q', length),
+		('structs', ('qq', nodes)),
+		('structs', ('qq', buffers)),
+	]
+	return _encapsulate(_message(3, batch, len(body))) + bytes(body)
+
+#: Arrow IPC end of stream marker.
+end_of_stream = struct.pack('<iI', -1, 0)
+
+def write_arrow(file, columns, resolution='nanosecond', timezone='UTC', unix=False):
+	"""
+	# Write the &columns mapping of names to &types.Timestamp integer buffers to &file
+	# as an Arrow IPC stream of timestamp columns.
+
+	# The buffers are not modified; the values are converted to Unix epoch integers of
+	# &resolution while writing unless &unix is true, indicating that the buffers
+	# already contain converted values.
+	"""
+	names = list(columns)
+	data = []
+	for name in names:
+		v = _view(columns[name])
+		if not unix:
+			v = to_unix(array.array('q', v), resolution)
+		data.append(v)
+
+	try:
+		import pyarrow
+	except ImportError:
+		pyarrow = None
+
+	if pyarrow is not None:
+		unit = resolutions[resolution][0]
+		t = pyarrow.timestamp(unit, tz=timezone)
+		table = pyarrow.table({
+			name: pyarrow.array(v.tolist(), type=t)
+			for name, v in zip(names, data)
+		})
+		with pyarrow.ipc.new_stream(file, table.schema) as w:
+			w.write_table(table)
+		return
+
+	file.write(schema_message(names, resolution, timezone))
+	file.write(record_batch_message(data))
+	file.write(end_of_stream)
@@ -2,6 +2,7 @@
 # Defines the time Context that constructs unit types and manages their
 # relationships to other unit types.
 """
+import os
 import collections
 import fractions
 import functools
@@ -18,6 +19,9 @@ kinds = (
 	'subjective',
 )
 
+# Environment variable enabling &Context.instrument on the standard context.
+instrumentation_environ = 'FAULT_TIME_INSTRUMENT'
+
 # Used to convert system times.
 unix_epoch_delta = (((((2000-1970) * 365) + 7) * (24*60*60)) + (24*60*60))
 
@@ -303,6 +307,27 @@ class Measure(Unit):
 class Point(Unit):
 	__slots__ = ()
 
+	# Offset of the unix epoch from the datum in the point's unit.
+	# Assigned by the context for classes with integer-exact unix conversions.
+	unix_offset = None
+
+	@classmethod
+	def from_unix_ns(Class, nanoseconds):
+		"""
+		# Create an instance from integer nanoseconds since the unix epoch.
+		"""
+		if Class.unit == 'nanosecond':
+			return Class(nanoseconds - Class.unix_offset)
+		return Class.construct((), {'unix_ns': nanoseconds})
+
+	def to_unix_ns(self):
+		"""
+		# Get the integer nanoseconds since the unix epoch.
+		"""
+		if self.unit == 'nanosecond':
+			return int(self) + self.unix_offset
+		return self.select('unix_ns')
+
 	@property
 	def start(self):
 		return self
@@ -382,6 +407,7 @@ class Context(object):
 		self.names = {} # unit names
 		self.constants = {} # constant values used by the context. storage area
 		self.kinds = {} # the kind of term
+		self.statistics = None # instrumentation records; None when disabled
 
 	def declare(self, id, datum, kind = 'definite'):
 		"""
@@ -422,8 +448,101 @@ class Context(object):
 	def container(self, id, pack, unpack):
 		if not id.isidentifier():
 			raise ValueError("container names must be valid identifiers")
+		if self.statistics is not None:
+			pack, unpack = self._instrument_container(id, pack, unpack)
 		self.containers[id] = (pack, unpack)
 
+	def _instrument_container(self, id, pack, unpack):
+		stats = self.statistics
+		clock = self._clock
+
+		def record(key, function):
+			if function is None:
+				return None
+			def instrumented(*args):
+				start = clock()
+				try:
+					return function(*args)
+				finally:
+					s = stats.get(key)
+					if s is None:
+						stats[key] = [1, clock() - start]
+					else:
+						s[0] += 1
+						s[1] += clock() - start
+			instrumented.__wrapped__ = function
+			return instrumented
+
+		return (record(('pack', id, None), pack), record(('unpack', id, None), unpack))
+
+	def instrument(self, clock = None):
+		"""
+		# Count calls and accumulate the time spent in &convert and in the
+		# pack and unpack functions of the &containers.
+
+		# Instrumentation installs wrappers on the instance; when it is not enabled,
+		# the conversion and container paths are unchanged. Times are cumulative,
+		# so nested conversions are included in the time of the outer call.
+
+		# Records can be retrieved with &instrumentation and removed with &deinstrument.
+		"""
+		if self.statistics is not None:
+			return
+
+		if clock is None:
+			import time
+			clock = time.perf_counter_ns
+
+		self.statistics = stats = {}
+		self._clock = clock
+		convert = Context.convert.__get__(self)
+
+		def instrumented_convert(from_unit, to_unit, value, ICE = Inconceivable):
+			start = clock()
+			try:
+				return convert(from_unit, to_unit, value, ICE = ICE)
+			finally:
+				key = ('convert', from_unit, to_unit)
+				s = stats.get(key)
+				if s is None:
+					stats[key] = [1, clock() - start]
+				else:
+					s[0] += 1
+					s[1] += clock() - start
+
+		self.convert = instrumented_convert
+		for id, (pack, unpack) in list(self.containers.items()):
+			self.containers[id] = self._instrument_container(id, pack, unpack)
+
+	def deinstrument(self):
+		"""
+		# Remove the wrappers installed by &instrument and discard the records.
+		"""
+		if self.statistics is None:
+			return
+
+		del self.convert
+		for id, pair in list(self.containers.items()):
+			self.containers[id] = tuple(getattr(x, '__wrapped__', x) for x in pair)
+		self.statistics = None
+		del self._clock
+
+	def instrumentation(self):
+		"""
+		# Get the records collected since &instrument was called.
+
+		# Returns a list of `(operation, source, target, calls, nanoseconds)` tuples
+		# ordered by the cumulative time, greatest first. The operation is one of
+		# `'convert'`, `'pack'`, or `'unpack'`; for the container operations,
+		# the source is the container identifier and the target is &None.
+		"""
+		if self.statistics is None:
+			return []
+
+		rows = [k + tuple(v) for k, v in self.statistics.items()]
+		rows.sort(key = operator.itemgetter(4), reverse = True)
+		return rows
+
 	def constant(self, id, value):
 		self.constants[id] = value
 
@@ -667,7 +786,9 @@ def standard_context(qname):
 	)
 
 	# XXX: pretty much assuming the desired/possible precision of `x` here..
-	def unpack_unix(typ, x, delta = unix_delta):
+	def unpack_unix(typ, x, delta = unix_delta, int = int):
+		if x.__class__ is int:
+			return ('nanosecond', (x * 1000000000) + delta),
 		return ('nanosecond', int(x * 1000000000) + delta),
 
 	def pack_unix(pit, arg, delta = unix_delta):
@@ -676,6 +797,31 @@ def standard_context(qname):
 	context.container('unix', pack_unix, unpack_unix)
 	context.constant('unix', unix_delta)
 
+	# Integer-exact containers for integers of the unit since the unix epoch.
+	def unix_container(id, unit, delta = unix_delta):
+		scale = int(context.convert(unit, 'nanosecond', 1))
+
+		def unpack(typ, x, delta = delta, scale = scale):
+			return (('nanosecond', (x * scale) + delta),)
+
+		def pack(pit, arg, delta = delta, scale = scale):
+			if pit.unit == 'nanosecond':
+				ns = int(pit) + pit.datum
+			else:
+				ns = pit.select('nanosecond')
+			return (ns - delta) // scale
+
+		context.container(id, pack, unpack)
+
+	unix_container('unix_ns', 'nanosecond')
+	unix_container('unix_us', 'microsecond')
+	unix_container('unix_ms', 'millisecond')
+	unix_container('unix_s', 'second')
+	points[0].unix_offset = points[0].datum - unix_delta
+
+	if os.environ.get(instrumentation_environ):
+		context.instrument()
+
 	# Remove the set of modules unlikely to be used after this point.
 	try:
 		import sys
@@ -0,0 +1,286 @@
+"""
+# Cron expression compilation and evaluation.
+
+# Expressions are compiled into a bitmask per field. The next firing time is found
+# by jumping to the next set bit of each field, from months down to minutes, rather
+# than stepping minute by minute.
+
+#!/syntax/python
+	from fault.time import cron
+	e = cron.compile('*/15 9-17 * * mon-fri')
+	ts = e.next(sysclock.now())
+	fires = e.schedule(sysclock.now(), 100) # array('q')
+
+# The five standard fields are supported: minute, hour, day of month, month, and day
+# of week. Fields accept `*`, numbers, names for months and weekdays, ranges, steps,
+# and comma separated lists. When both the day of month and the day of week are
+# restricted, a day matching either is selected.
+"""
+import array
+
+from . import core
+from . import types
+from . import gregorian
+from . import week
+
+_day = types.Context.convert('day', 'nanosecond', 1)
+_minute = types.Context.convert('minute', 'nanosecond', 1)
+_second = types.Context.convert('second', 'nanosecond', 1)
+_datum = types.Date.datum
+
+#: Field names with their inclusive bounds.
+fields = (
+	('minute', 0, 59),
+	('hour', 0, 23),
+	('monthday', 1, 31),
+	('month', 1, 12),
+	('weekday', 0, 7),
+)
+
+#: Expressions substituted for the `@` prefixed aliases.
+aliases = {
+	'@yearly': '0 0 1 1 *',
+	'@annually': '0 0 1 1 *',
+	'@monthly': '0 0 1 * *',
+	'@weekly': '0 0 * * 0',
+	'@daily': '0 0 * * *',
+	'@midnight': '0 0 * * *',
+	'@hourly': '0 * * * *',
+}
+
+_names = {
+	'month': {k: v + 1 for k, v in gregorian.month_name_to_number.items()},
+	'weekday': week.weekday_name_to_number,
+}
+
+def _value(field, text):
+	try:
+		return int(text)
+	except ValueError:
+		return _names[field][text.lower()]
+
+def _field_mask(field, lower, upper, text):
+	mask = 0
+	for part in text.split(','):
+		step = 1
+		if '/' in part:
+			part, step = part.split('/', 1)
+			step = int(step)
+			if step < 1:
+				raise ValueError("step must be positive")
+
+		if part == '*':
+			start, stop = lower, upper
+		elif '-' in part:
+			a, b = part.split('-', 1)
+			start, stop = _value(field, a), _value(field, b)
+		else:
+			start = _value(field, part)
+			stop = upper if step != 1 else start
+
+		if start < lower or stop > upper or start > stop:
+			raise ValueError("%s field out of range: %s" %(field, part))
+
+		for x in range(start, stop + 1, step):
+			mask |= 1 << x
+	return mask
+
+def _next_bit(mask, index):
+	# Least set bit at or above index; None when there is none.
+	m = mask >> index
+	if not m:
+		return None
+	return index + (m & -m).bit_length() - 1
+
+class Expression(object):
+	"""
+	# A compiled cron expression.
+
+	# [ Properties ]
+	# /source/
+		# The expression text.
+	# /masks/
+		# The bitmasks of the minute, hour, day of month, month, and day of week fields.
+	# /zone/
+		# The &views.Zone that the fields are expressed in; &None for UTC.
+	"""
+
+	def __init__(self, source, masks, wildcards, zone=None):
+		self.source = source
+		self.masks = masks
+		self.zone = zone
+		self._minutes, self._hours, self._monthdays, self._months, self._weekdays = masks
+		self._dom_any, self._dow_any = wildcards
+
+	def __repr__(self):
+		return '<%s: %r>' %(self.__class__.__name__, self.source)
+
+	def _day_matches(self, year, month, day, days):
+		dom = (self._monthdays >> day) & 1
+		dow = (self._weekdays >> ((days - _datum) % 7)) & 1
+		if self._dom_any or self._dow_any:
+			return dom and dow
+		return dom or dow
+
+	def _next_local(self, local):
+		# Find the first matching local minute at or after the nanosecond &local.
+		days, rem = divmod(local, _day)
+		days += _datum
+		if rem % _minute:
+			rem += _minute - (rem % _minute)
+			if rem >= _day:
+				days += 1
+				rem = 0
+
+		year, month, day = gregorian.date_from_days(days)
+		hour, minute = divmod(rem // _minute, 60)
+		limit = year + 400
+
+		while year < limit:
+			# Month
+			m = _next_bit(self._months, month)
+			if m is None:
+				year += 1
+				month, day, hour, minute = 1, 1, 0, 0
+				continue
+			if m != month:
+				month, day, hour, minute = m, 1, 0, 0
+
+			# Day
+			length = gregorian.days_in_month(year, month)
+			days = gregorian.days_from_date((year, month, day))
+			while day <= length and not self._day_matches(year, month, day, days):
+				day += 1
+				days += 1
+				hour = minute = 0
+			if day > length:
+				month += 1
+				day, hour, minute = 1, 0, 0
+				if month > 12:
+					year += 1
+					month = 1
+				continue
+
+			# Hour
+			h = _next_bit(self._hours, hour)
+			if h is None:
+				day += 1
+				hour = minute = 0
+				if day > length:
+					month += 1
+					day = 1
+					if month > 12:
+						year += 1
+						month = 1
+				continue
+			if h != hour:
+				hour, minute = h, 0
+
+			# Minute
+			mi = _next_bit(self._minutes, minute)
+			if mi is None:
+				hour += 1
+				minute = 0
+				if hour > 23:
+					day += 1
+					hour = 0
+					if day > length:
+						month += 1
+						day = 1
+						if month > 12:
+							year += 1
+							month = 1
+				continue
+
+			return ((days - _datum) * _day) + (((hour * 60) + mi) * _minute)
+
+		return None
+
+	def _to_utc(self, local, Timestamp=types.Timestamp):
+		z = self.zone
+		if z is None:
+			return local
+		# Times in a gap are moved forward by the size of the gap, and
+		# repeated times resolve to their first occurrence.
+		return int(z.to_utc(Timestamp(local), fold=0))
+
+	def _to_local(self, utc, Timestamp=types.Timestamp):
+		z = self.zone
+		if z is None:
+			return utc
+		return utc + (z.find(Timestamp(utc))[0] * _second)
+
+	def _next(self, after):
+		# The first firing time in UTC nanoseconds strictly after &after.
+		local = self._to_local(after + 1)
+		while True:
+			local = self._next_local(local)
+			if local is None:
+				return None
+			utc = self._to_utc(local)
+			if utc > after:
+				return utc
+			local += _minute
+
+	def next(self, after, Timestamp=types.Timestamp):
+		"""
+		# Get the first firing time after the &after point; &None if the
+		# expression can not be satisfied.
+		"""
+		r = self._next(int(after))
+		if r is None:
+			return None
+		return Timestamp(r)
+
+	def schedule(self, after, count) -> array.array:
+		"""
+		# Get the next &count firing times after &after as an `array('q')` of
+		# &types.Timestamp precision integers.
+		"""
+		r = array.array('q')
+		t = int(after)
+		for i in range(count):
+			t = self._next(t)
+			if t is None:
+				break
+			r.append(t)
+		return r
+
+	def iterate(self, after, Timestamp=types.Timestamp):
+		"""
+		# Generate the firing times after &after.
+		"""
+		t = int(after)
+		while True:
+			t = self._next(t)
+			if t is None:
+				return
+			yield Timestamp(t)
+
+def compile(source, zone=None) -> Expression:
+	"""
+	# Compile the cron expression &source.
+
+	# Raises &core.ParseError when the expression is invalid.
+	"""
+	text = aliases.get(source.strip().lower(), source)
+	parts = text.split()
+	if len(parts) != len(fields):
+		raise core.ParseError(source, format='cron')
+
+	try:
+		masks = [
+			_field_mask(name, lower, upper, part)
+			for (name, lower, upper), part in zip(fields, parts)
+		]
+	except (ValueError, KeyError) as err:
+		pe = core.ParseError(source, format='cron')
+		pe.__cause__ = err
+		raise pe
+
+	# Sunday may be given as zero or seven.
+	if masks[4] & (1 << 7):
+		masks[4] = (masks[4] | 1) & ~(1 << 7)
+
+	wildcards = (parts[2].startswith('*'), parts[4].startswith('*'))
+	return Expression(source, tuple(masks), wildcards, zone=zone)
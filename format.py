@@ -284,13 +284,16 @@ formats = {
 }
 
 def context(context):
+	cache = context.constants['date_cache']
+
 	for k, id in formats.items():
 		fmt = formatter(id)
 		par = parser(id)
 
-		def unpack_and_format(x, arg, fmt=fmt):
+		def unpack_and_format(x, arg, fmt=fmt, resolve=cache.resolve):
 			sub = (x.select(x.unit, 'second'), x.context.convert('second', x.unit, 1))
-			return fmt(x.select('datetime'), sub, x.select('day', 'week'))
+			y, m, d, dow = resolve(x.select('day'))
+			return fmt((y, m, d) + x.select('timeofday'), sub, dow)
 		def parse_and_unpack(typ, txt, par=par):
 			*datetime, subsec = par(txt)
 			return [('datetime', datetime), ('subsecond', subsec)]
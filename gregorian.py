@@ -152,6 +152,125 @@ def days_from_date(date, _resolver=resolve_by_months):
 	cycles, day_of_cycle, moy, _d = _resolver(month + (year * 12))
 	return (cycles * days_in_cycle) + day_of_cycle + day
 
+def days_in_month(year, month):
+	"""
+	# Get the number of days in the one-based &month of the &year.
+	"""
+	if year_is_leap(year):
+		return calendar_leap[month - 1]
+	return calendar_year[month - 1]
+
+def days_from_ymd(year, month, day):
+	"""
+	# Integer arithmetic form of &days_from_date.
+
+	# Years are shifted to start in March so that the leap day is the last day
+	# of the shifted year.
+	"""
+	y = year - (month <= 2)
+	era = y // 400
+	yoe = y - (era * 400)
+	doy = ((153 * (month - 3 if month > 2 else month + 9)) + 2) // 5 + day - 1
+	doe = (yoe * 365) + (yoe // 4) - (yoe // 100) + doy
+	# Day zero is January first of year zero; March first is day 60.
+	return (era * 146097) + doe + 60
+
+def ymd_from_days(days):
+	"""
+	# Integer arithmetic form of &date_from_days.
+	"""
+	z = days - 60
+	era = z // 146097
+	doe = z - (era * 146097)
+	yoe = (doe - (doe // 1460) + (doe // 36524) - (doe // 146096)) // 365
+	doy = doe - ((365 * yoe) + (yoe // 4) - (yoe // 100))
+	mp = ((5 * doy) + 2) // 153
+	day = doy - (((153 * mp) + 2) // 5) + 1
+	month = mp + 3 if mp < 10 else mp - 9
+	return ((era * 400) + yoe + (month <= 2), month, day)
+
+class DateCache(object):
+	"""
+	# Bounded mapping of day numbers to `(year, month, day, weekday)` tuples.
+
+	# Timestamps in event streams are usually clustered on a few days, so resolving
+	# the Gregorian date once per day avoids most of the work done by &date_from_days.
+	# When the cache is full, the oldest entry is evicted.
+
+	# [ Properties ]
+	# /size/
+		# The maximum number of entries held.
+	# /offset/
+		# The day number of a Sunday; used to derive the weekday.
+	# /hits/
+		# Number of lookups satisfied by the cache.
+	# /misses/
+		# Number of lookups that required resolution.
+	"""
+
+	def __init__(self, size=256, offset=0):
+		self.size = size
+		self.offset = offset
+		self.hits = 0
+		self.misses = 0
+		self._entries = {}
+
+	def __len__(self):
+		return len(self._entries)
+
+	def resolve(self, days, _date_from_days=date_from_days):
+		"""
+		# Get the `(year, month, day, weekday)` tuple for the given day number.
+		"""
+		try:
+			r = self._entries[days]
+			self.hits += 1
+			return r
+		except KeyError:
+			pass
+
+		self.misses += 1
+		r = _date_from_days(days) + ((days - self.offset) % 7,)
+		entries = self._entries
+		if len(entries) >= self.size:
+			if self.size <= 0:
+				return r
+			self._evict(entries)
+		entries[days] = r
+		return r
+
+	@staticmethod
+	def _evict(entries):
+		# Remove the oldest entry. Concurrent resolutions may remove the same
+		# entry or change the size of the mapping during iteration.
+		try:
+			entries.pop(next(iter(entries)), None)
+		except (StopIteration, RuntimeError):
+			pass
+
+	def resize(self, size):
+		"""
+		# Change the maximum number of entries; excess entries are evicted.
+		"""
+		self.size = size
+		entries = self._entries
+		while len(entries) > max(size, 0):
+			self._evict(entries)
+
+	def clear(self):
+		"""
+		# Remove all entries and reset the statistics.
+		"""
+		self._entries.clear()
+		self.hits = 0
+		self.misses = 0
+
+	def statistics(self):
+		"""
+		# Get a tuple of `(hits, misses, entries, size)`.
+		"""
+		return (self.hits, self.misses, len(self._entries), self.size)
+
 def context(context):
 	import fractions
 	# Defines
@@ -166,11 +285,15 @@ def context(context):
 	context.bridge('month', 'day', days_from_month)
 	context.bridge('day', 'month', month_from_days)
 
+	# Shared by the date container and the formatters; the day datum is a Sunday.
+	cache = DateCache(offset = context.datums['day'])
+	context.constant('date_cache', cache)
+
 	# Containers
 	def unpack_date_tuple(typ, date):
 		return (('day', days_from_date(date)),)
-	def pack_date_tuple(time, arg):
-		return date_from_days(time.select('day'))
+	def pack_date_tuple(time, arg, resolve = cache.resolve):
+		return resolve(time.select('day'))[:3]
 	context.container('date', pack_date_tuple, unpack_date_tuple)
 
 	def unpack_datetime_tuple(typ, time):
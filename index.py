@@ -0,0 +1,236 @@
+"""
+# Sorted index of points in time for range queries.
+
+# &TimeIndex stores the nanosecond integers of &types.Timestamp instances in an
+# `array('q')` along with a parallel array of payload indexes. Queries accept
+# &types.Segment, &core.Point, and &core.Measure instances, and are answered
+# with binary searches.
+
+#!/syntax/python
+	from fault.time import index
+	idx = index.TimeIndex.build(event_timestamps)
+	positions = idx.select(types.Segment((start, stop)))
+	for i in positions:
+		event = events[i]
+"""
+import array
+import bisect
+import heapq
+
+from . import core
+from . import types
+
+# The nanosecond range of &TimeIndex keys.
+_minimum = -(2**63)
+_maximum = (2**63) - 1
+
+def key(point, Timestamp=types.Timestamp) -> int:
+	"""
+	# Get the &types.Timestamp precision integer of the &point.
+
+	# &core.Measure instances are interpreted as measures from the datum.
+	# Points of the eternal unit are mapped to the bounds of the index's key range;
+	# the indefinite `whenever` point is rejected with a &ValueError.
+	"""
+	if point.__class__ is Timestamp:
+		return int(point)
+
+	if getattr(point, 'liketerm', None) == 'eternal':
+		if point > 0:
+			return _maximum
+		elif point < 0:
+			return _minimum
+		raise ValueError("indefinite point cannot be used as a key")
+
+	if isinstance(point, core.Point):
+		return int(Timestamp.of(point))
+	elif isinstance(point, core.Measure):
+		if point.unit == Timestamp.unit:
+			return int(point)
+		return int(Timestamp.context.convert(point.unit, Timestamp.unit, int(point)))
+	else:
+		return int(point)
+
+def bounds(query, Timestamp=types.Timestamp) -> tuple:
+	"""
+	# Get the inclusive start and exclusive stop keys for the &query.
+
+	# A &types.Segment, or any pair of points, designates its own range.
+	# Points coarser than &types.Timestamp designate the span of their unit,
+	# so a &types.Date selects the whole day; measures and timestamps designate
+	# the range of the exact key.
+	"""
+	if isinstance(query, tuple):
+		start, stop = key(query[0]), key(query[1])
+		if stop < start:
+			start, stop = stop, start
+		return (start, stop)
+
+	k = key(query)
+	if query.__class__ is not Timestamp and isinstance(query, core.Point) \
+			and getattr(query, 'liketerm', None) != 'eternal':
+		return (k, key(query.__class__(int(query) + 1)))
+	return (k, k + 1)
+
+class TimeIndex(object):
+	"""
+	# Array backed sorted index of &types.Timestamp keys with payload indexes.
+
+	# Appends that are not less than the greatest key are placed directly into the
+	# arrays. Out of order appends are held aside and merged in bulk by the next query.
+
+	# [ Properties ]
+	# /keys/
+		# The sorted `array('q')` of nanosecond keys.
+	# /payloads/
+		# The `array('q')` of payload indexes corresponding to &keys.
+	"""
+
+	def __init__(self, keys=None, payloads=None):
+		self.keys = keys if keys is not None else array.array('q')
+		self.payloads = payloads if payloads is not None else array.array('q')
+		self._pending = []
+
+	@classmethod
+	def build(Class, points, payloads=None):
+		"""
+		# Construct an index from an unsorted iterable of &points.
+
+		# When &payloads is not given, the position of each point in &points is used.
+		"""
+		keys = array.array('q', [key(x) for x in points])
+		if payloads is None:
+			payloads = array.array('q', range(len(keys)))
+		else:
+			payloads = array.array('q', payloads)
+			if len(payloads) != len(keys):
+				raise ValueError("points and payloads must have the same length")
+
+		order = sorted(range(len(keys)), key=keys.__getitem__)
+		return Class(
+			array.array('q', [keys[i] for i in order]),
+			array.array('q', [payloads[i] for i in order]),
+		)
+
+	def __len__(self):
+		return len(self.keys) + len(self._pending)
+
+	def __repr__(self):
+		return '<%s: %d keys>' %(self.__class__.__name__, len(self))
+
+	def __iter__(self, Timestamp=types.Timestamp):
+		"""
+		# Iterate over the `(Timestamp, payload)` pairs in order.
+		"""
+		self._merge()
+		for k, p in zip(self.keys, self.payloads):
+			yield (Timestamp(k), p)
+
+	def __getitem__(self, position, Timestamp=types.Timestamp):
+		self._merge()
+		return (Timestamp(self.keys[position]), self.payloads[position])
+
+	def append(self, point, payload=None):
+		"""
+		# Add a &point to the index. When &payload is &None, the current length
+		# of the index is used.
+		"""
+		k = key(point)
+		if payload is None:
+			payload = len(self)
+
+		keys = self.keys
+		if not keys or k >= keys[-1]:
+			keys.append(k)
+			self.payloads.append(payload)
+		else:
+			self._pending.append((k, payload))
+
+	def extend(self, points, payloads=None):
+		"""
+		# Append all the given &points.
+		"""
+		if payloads is None:
+			for x in points:
+				self.append(x)
+		else:
+			for x, p in zip(points, payloads):
+				self.append(x, p)
+
+	def _merge(self):
+		pending = self._pending
+		if not pending:
+			return
+		pending.sort()
+		self._pending = []
+
+		merged = list(heapq.merge(zip(self.keys, self.payloads), pending))
+		self.keys = array.array('q', [x[0] for x in merged])
+		self.payloads = array.array('q', [x[1] for x in merged])
+
+	def range(self, query) -> tuple:
+		"""
+		# Get the `(start, stop)` positions of the keys within the &query.
+		"""
+		self._merge()
+		start, stop = bounds(query)
+		keys = self.keys
+		lo = bisect.bisect_left(keys, start)
+		return (lo, bisect.bisect_left(keys, stop, lo))
+
+	def count(self, query) -> int:
+		"""
+		# Count the keys within the &query.
+		"""
+		lo, hi = self.range(query)
+		return hi - lo
+
+	def select(self, query) -> array.array:
+		"""
+		# Get the payload indexes of the keys within the &query in key order.
+		"""
+		lo, hi = self.range(query)
+		return self.payloads[lo:hi]
+
+	def points(self, query, Timestamp=types.Timestamp):
+		"""
+		# Iterate over the `(Timestamp, payload)` pairs within the &query.
+		"""
+		lo, hi = self.range(query)
+		return zip(map(Timestamp, self.keys[lo:hi]), self.payloads[lo:hi])
+
+	def nearest(self, point, Timestamp=types.Timestamp):
+		"""
+		# Get the `(Timestamp, payload)` pair whose key is closest to &point.
+		# Ties are resolved in favor of the earlier key. &None when the index is empty.
+		"""
+		self._merge()
+		keys = self.keys
+		if not keys:
+			return None
+
+		k = key(point)
+		i = bisect.bisect_left(keys, k)
+		if i == len(keys):
+			i -= 1
+		elif i > 0 and (k - keys[i-1]) <= (keys[i] - k):
+			i -= 1
+		return (Timestamp(keys[i]), self.payloads[i])
+
+	def before(self, point, Timestamp=types.Timestamp):
+		"""
+		# Get the `(Timestamp, payload)` pair with the greatest key less than &point.
+		"""
+		lo, hi = self.range(point)
+		if lo == 0:
+			return None
+		return (Timestamp(self.keys[lo-1]), self.payloads[lo-1])
+
+	def after(self, point, Timestamp=types.Timestamp):
+		"""
+		# Get the `(Timestamp, payload)` pair with the least key greater than &point.
+		"""
+		lo, hi = self.range(point)
+		if hi == len(self.keys):
+			return None
+		return (Timestamp(self.keys[hi]), self.payloads[hi])
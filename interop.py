@@ -0,0 +1,150 @@
+"""
+# Conversion between &types.Timestamp and the standard library's &datetime types.
+
+# Conversions are performed with integer arithmetic relative to the project's
+# datum; no string formatting or parsing is involved.
+
+#!/syntax/python
+	from fault.time import interop
+	ts = interop.from_datetime(datetime.datetime.now(datetime.timezone.utc))
+	dt = interop.to_datetime(ts, zone)
+
+# Aware &datetime.datetime instances are converted to UTC. Naive instances are
+# presumed to be UTC. &views.Zone instances are mapped to &zoneinfo.ZoneInfo
+# instances by name when possible, and to fixed offset &datetime.timezone
+# instances otherwise.
+"""
+import functools
+import datetime
+
+from . import types
+from . import tzif
+
+_utc = datetime.timezone.utc
+
+#: &datetime.datetime at the project's datum.
+datum = datetime.datetime(2000, 1, 2)
+
+#: Aware &datetime.datetime at the project's datum.
+datum_utc = datum.replace(tzinfo=_utc)
+
+_day = types.Context.convert('day', 'nanosecond', 1)
+_second = types.Context.convert('second', 'nanosecond', 1)
+
+def from_datetime(dt, Timestamp=types.Timestamp):
+	"""
+	# Create a &types.Timestamp from the &datetime.datetime, &dt.
+
+	# When &Timestamp is a point class of a coarser unit, such as &types.Date,
+	# the result is an instance of that class containing &dt.
+	"""
+	if dt.tzinfo is None:
+		td = dt - datum
+	else:
+		td = dt - datum_utc
+	ns = (td.days * _day) + (td.seconds * _second) + (td.microseconds * 1000)
+	if Timestamp.unit != 'nanosecond':
+		return Timestamp.of(types.Timestamp(ns))
+	return Timestamp(ns)
+
+def from_date(d, Date=types.Date):
+	"""
+	# Create a &types.Date from the &datetime.date, &d.
+	"""
+	return Date((d - datum.date()).days)
+
+def from_datetimes(sequence, Timestamp=types.Timestamp) -> list:
+	"""
+	# Create a list of &types.Timestamp from the &datetime.datetime instances in &sequence.
+	"""
+	naive = datum
+	aware = datum_utc
+	day = _day
+	second = _second
+	return [
+		Timestamp((td.days * day) + (td.seconds * second) + (td.microseconds * 1000))
+		for td in (x - (naive if x.tzinfo is None else aware) for x in sequence)
+	]
+
+@functools.lru_cache(64)
+def zoneinfo(zone):
+	"""
+	# Get the &zoneinfo.ZoneInfo corresponding to the &views.Zone, &zone.
+	# &None when the zone's name does not identify a zone in the zoneinfo database.
+	"""
+	name = zone.name
+	if not name:
+		return None
+
+	prefix = tzif.tzdir.rstrip('/') + '/'
+	if name.startswith(prefix):
+		name = name[len(prefix):]
+	elif name.startswith('/'):
+		return None
+
+	try:
+		import zoneinfo as zi
+		return zi.ZoneInfo(name)
+	except (ImportError, ValueError, LookupError):
+		return None
+
+def _tzinfo(zone, pit):
+	# The tzinfo to use for the &zone; fixed offsets when no ZoneInfo is available.
+	if zone is None:
+		return _utc
+	if isinstance(zone, datetime.tzinfo):
+		return zone
+	zi = zoneinfo(zone)
+	if zi is not None:
+		return zi
+
+	offset = zone.find(pit)
+	return datetime.timezone(datetime.timedelta(seconds=offset[0]), offset[1])
+
+def to_datetime(pit, zone=None, timedelta=datetime.timedelta):
+	"""
+	# Create an aware &datetime.datetime from the &types.Timestamp, &pit.
+
+	# When &zone, a &views.Zone or &datetime.tzinfo, is given, the result is
+	# expressed in that zone. Precision beyond microseconds is truncated.
+	# Points of other units are converted to &types.Timestamp first.
+	"""
+	if getattr(pit, 'unit', 'nanosecond') != 'nanosecond':
+		pit = types.Timestamp.of(pit)
+	dt = datum_utc + timedelta(microseconds=int(pit) // 1000)
+	if zone is None:
+		return dt
+	return dt.astimezone(_tzinfo(zone, pit))
+
+def to_naive(pit, timedelta=datetime.timedelta):
+	"""
+	# Create a naive &datetime.datetime representing &pit in UTC.
+	"""
+	return datum + timedelta(microseconds=int(pit) // 1000)
+
+def to_datetimes(sequence, zone=None, timedelta=datetime.timedelta) -> list:
+	"""
+	# Create a list of aware &datetime.datetime from the &types.Timestamp instances in &sequence.
+	"""
+	base = datum_utc
+	dts = [base + timedelta(microseconds=int(x) // 1000) for x in sequence]
+	if zone is None:
+		return dts
+
+	if isinstance(zone, datetime.tzinfo) or zoneinfo(zone) is not None:
+		tz = _tzinfo(zone, None)
+		return [x.astimezone(tz) for x in dts]
+
+	# Fixed offsets need to be selected per point.
+	return [x.astimezone(_tzinfo(zone, p)) for x, p in zip(dts, sequence)]
+
+@functools.lru_cache(64)
+def _open(key, construct):
+	from . import views
+	return views.Zone.open(construct, key)
+
+def zone(tzinfo, construct=types.from_unix_timestamp):
+	"""
+	# Get the &views.Zone for the &zoneinfo.ZoneInfo, &tzinfo.
+	"""
+	return _open(tzinfo.key, construct)
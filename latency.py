@@ -0,0 +1,290 @@
+"""
+# Latency instrumentation using the system's monotonic clock.
+
+# Provides &Stopwatch for timing regions of code and &Histogram for accumulating
+# the observed durations. Durations are recorded as plain nanosecond integers;
+# &types.Measure instances are only created when results are queried.
+
+#!/syntax/python
+	from fault.time import latency
+	h = latency.Histogram()
+
+	with latency.Stopwatch(h) as sw:
+		...
+	sw.measure # types.Measure
+
+	@latency.Stopwatch(h)
+	def operation():
+		...
+
+	h.percentile(99.9) # types.Measure
+"""
+import array
+import functools
+
+from . import types
+from . import sysclock
+
+class Histogram(object):
+	"""
+	# Log-bucketed histogram of nanosecond durations.
+
+	# Values below `2**precision` are counted exactly. Larger values are placed into
+	# buckets that keep &precision significant bits, so the relative error of a
+	# reported value is bounded by `2**(1-precision)`.
+
+	# The bucket array is allocated once; &record performs an index calculation
+	# and an increment.
+
+	# [ Properties ]
+	# /precision/
+		# The number of significant bits retained by the buckets.
+	# /count/
+		# The number of recorded values.
+	# /total/
+		# The sum of the recorded values.
+	# /minimum/
+		# The smallest recorded value; &None when empty.
+	# /maximum/
+		# The largest recorded value; &None when empty.
+	"""
+
+	def __init__(self, precision:int=7, limit:int=64):
+		if precision < 2 or precision > limit:
+			raise ValueError("precision must be at least two and at most the limit")
+
+		self.precision = precision
+		self.limit = limit
+		self._half = 1 << (precision - 1)
+		self._exact = 1 << precision
+		self._bound = 1 << limit
+		self.counts = array.array('Q', [0]) * ((limit - precision + 2) << (precision - 1))
+		self.count = 0
+		self.total = 0
+		self.minimum = None
+		self.maximum = None
+
+	def __len__(self):
+		return self.count
+
+	def __repr__(self):
+		return '<%s: %d values, precision %d>' %(
+			self.__class__.__name__, self.count, self.precision
+		)
+
+	def index(self, value:int) -> int:
+		"""
+		# The bucket index that &value is counted in.
+		"""
+		if value < self._exact:
+			return value
+		shift = value.bit_length() - self.precision
+		return (shift << (self.precision - 1)) + (value >> shift)
+
+	def lower(self, index:int) -> int:
+		"""
+		# The smallest value counted by the bucket at &index.
+		"""
+		if index < self._exact:
+			return index
+		shift = (index >> (self.precision - 1)) - 1
+		return (index - (shift << (self.precision - 1))) << shift
+
+	def upper(self, index:int) -> int:
+		"""
+		# The largest value counted by the bucket at &index.
+		"""
+		if index < self._exact:
+			return index
+		shift = (index >> (self.precision - 1)) - 1
+		return self.lower(index) + (1 << shift) - 1
+
+	def record(self, value:int, count:int=1):
+		"""
+		# Count the nanosecond &value. Negative values and values of `2**limit`
+		# or more raise &ValueError.
+		"""
+		if value < 0:
+			raise ValueError("negative durations cannot be recorded")
+		if value >= self._bound:
+			raise ValueError("duration exceeds the histogram's limit")
+
+		if value < self._exact:
+			self.counts[value] += count
+		else:
+			shift = value.bit_length() - self.precision
+			self.counts[(shift << (self.precision - 1)) + (value >> shift)] += count
+
+		self.count += count
+		self.total += value * count
+		if self.minimum is None or value < self.minimum:
+			self.minimum = value
+		if self.maximum is None or value > self.maximum:
+			self.maximum = value
+
+	def snapshot(self):
+		"""
+		# Create an independent copy of the histogram's current state.
+		"""
+		h = self.__class__.__new__(self.__class__)
+		h.__dict__.update(self.__dict__)
+		h.counts = array.array('Q', self.counts)
+		return h
+
+	def merge(self, other):
+		"""
+		# Add the counts of &other into this histogram.
+		# Both histograms must have the same &precision and &limit.
+		"""
+		if other.precision != self.precision or other.limit != self.limit:
+			raise ValueError("histograms must have the same precision and limit")
+
+		counts = self.counts
+		for i, c in enumerate(other.counts):
+			if c:
+				counts[i] += c
+
+		self.count += other.count
+		self.total += other.total
+		if other.minimum is not None:
+			if self.minimum is None or other.minimum < self.minimum:
+				self.minimum = other.minimum
+			if self.maximum is None or other.maximum > self.maximum:
+				self.maximum = other.maximum
+		return self
+
+	def clear(self):
+		"""
+		# Remove all recorded values.
+		"""
+		self.counts = array.array('Q', [0]) * len(self.counts)
+		self.count = 0
+		self.total = 0
+		self.minimum = None
+		self.maximum = None
+
+	def quantile(self, fraction) -> int:
+		"""
+		# The nanosecond value at or below which &fraction of the recorded values fall.
+		# The upper bound of the selected bucket is returned, clamped to &maximum.
+		"""
+		if not self.count:
+			raise ValueError("no values have been recorded")
+		if fraction < 0 or fraction > 1:
+			raise ValueError("fraction must be within zero and one")
+
+		# Ceiling of the rank without leaving integer arithmetic for Fractions.
+		rank = max(1, -((-fraction * self.count) // 1))
+		seen = 0
+		for i, c in enumerate(self.counts):
+			seen += c
+			if seen >= rank:
+				return min(self.upper(i), self.maximum)
+		return self.maximum
+
+	def percentile(self, percent, Measure=types.Measure) -> types.Measure:
+		"""
+		# The &types.Measure at or below which &percent of the recorded values fall.
+		"""
+		return Measure(self.quantile(percent / 100))
+
+	def percentiles(self, percents, Measure=types.Measure) -> list:
+		"""
+		# Query multiple percentiles using a single pass over the buckets.
+		"""
+		if not self.count:
+			raise ValueError("no values have been recorded")
+
+		ranks = sorted(
+			(max(1, -((-(p / 100) * self.count) // 1)), i)
+			for i, p in enumerate(percents)
+		)
+		results = [None] * len(ranks)
+		seen = 0
+		r = 0
+		for i, c in enumerate(self.counts):
+			if not c:
+				continue
+			seen += c
+			while r < len(ranks) and seen >= ranks[r][0]:
+				results[ranks[r][1]] = Measure(min(self.upper(i), self.maximum))
+				r += 1
+			if r == len(ranks):
+				break
+		return results
+
+	def mean(self, Measure=types.Measure) -> types.Measure:
+		"""
+		# The average of the recorded values.
+		"""
+		if not self.count:
+			raise ValueError("no values have been recorded")
+		return Measure(self.total // self.count)
+
+	def buckets(self):
+		"""
+		# Iterate over the non-empty buckets as `(lower, upper, count)` triples.
+		"""
+		for i, c in enumerate(self.counts):
+			if c:
+				yield (self.lower(i), self.upper(i), c)
+
+class Stopwatch(object):
+	"""
+	# Context manager and decorator measuring elapsed time with the monotonic clock.
+
+	# When a &Histogram is given, each completed measurement is recorded into it
+	# as a nanosecond integer.
+
+	# [ Properties ]
+	# /histogram/
+		# The &Histogram that completed measurements are recorded into, or &None.
+	# /duration/
+		# The nanoseconds of the latest completed measurement as an &int.
+	"""
+
+	def __init__(self, histogram:Histogram=None, clock=sysclock._monotonic_clock_read):
+		self.histogram = histogram
+		self.clock = clock
+		self.duration = None
+		self._start = None
+
+	def __enter__(self):
+		self._start = self.clock()
+		return self
+
+	def __exit__(self, typ, val, tb):
+		self.duration = d = self.clock() - self._start
+		if self.histogram is not None:
+			self.histogram.record(d)
+
+	def __call__(self, function):
+		clock = self.clock
+		histogram = self.histogram
+		if histogram is None:
+			raise ValueError("decoration requires a histogram to record into")
+
+		@functools.wraps(function)
+		def timed(*args, **kw):
+			start = clock()
+			try:
+				return function(*args, **kw)
+			finally:
+				histogram.record(clock() - start)
+
+		return timed
+
+	@property
+	def measure(self, Measure=types.Measure) -> types.Measure:
+		"""
+		# The latest completed measurement as a &types.Measure.
+		"""
+		if self.duration is None:
+			return None
+		return Measure(self.duration)
+
+	def split(self, Measure=types.Measure) -> types.Measure:
+		"""
+		# The time elapsed since the stopwatch was entered without stopping it.
+		"""
+		return Measure(self.clock() - self._start)
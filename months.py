@@ -0,0 +1,110 @@
+"""
+# Month arithmetic with explicit end of month policies.
+
+# &types.Timestamp.elapse with a month measure resolves the point through the
+# calendar bridges, and days past the end of the target month overflow into the
+# following month. The functions here split the point into its Gregorian date
+# with integer arithmetic, adjust the year and month directly, and apply one of
+# the &policies to days that do not exist in the target month.
+
+#!/syntax/python
+	from fault.time import months
+	months.add(types.Timestamp.of(date=(2001, 1, 31)), 1) # 2001-02-28
+	months.add(pit, 1, 'overflow') # 2001-03-03
+	months.add_array(timestamp_array, -1)
+"""
+from . import gregorian
+
+#: The supported end of month policies.
+#: /`'clamp'`/
+	#: Use the last day of the target month.
+#: /`'overflow'`/
+	#: Continue counting the excess days into the following month;
+	#: consistent with &types.Timestamp.elapse.
+#: /`'error'`/
+	#: Raise a &ValueError.
+policies = ('clamp', 'overflow', 'error')
+
+def _shift(days, count, policy,
+		_ymd=gregorian.ymd_from_days,
+		_days=gregorian.days_from_ymd,
+		_length=gregorian.days_in_month,
+	):
+	# Shift the absolute day number by &count months.
+	y, m, d = _ymd(days)
+	y, m = divmod((y * 12) + (m - 1) + count, 12)
+	m += 1
+
+	if d > 28:
+		last = _length(y, m)
+		if d > last:
+			if policy == 'clamp':
+				d = last
+			elif policy == 'error':
+				raise ValueError("day %d does not exist in %04d-%02d" %(d, y, m))
+	return _days(y, m, d)
+
+def _resolution(Class, policy):
+	# The number of &Class units in a day.
+	if policy not in policies:
+		raise ValueError("unknown end of month policy: " + repr(policy))
+
+	context = Class.context
+	if context.terms[Class.unit] != context.terms['day']:
+		raise ValueError("month arithmetic requires day or finer points, not " + repr(Class.unit))
+	per_day = context.compose('day', Class.unit)
+	if per_day != int(per_day):
+		raise ValueError("month arithmetic requires day or finer points, not " + repr(Class.unit))
+	return int(per_day)
+
+def add(pit, count, policy='clamp'):
+	"""
+	# Add &count months to &pit, a point of day or finer precision.
+	# The time of day is preserved.
+
+	# [ Parameters ]
+	# /pit/
+		# The point in time to adjust.
+	# /count/
+		# The number of months to add; negative to subtract.
+	# /policy/
+		# The treatment of days that do not exist in the target month; see &policies.
+	"""
+	Class = pit.__class__
+	per_day = _resolution(Class, policy)
+	day, tod = divmod(int(pit) + Class.datum, per_day)
+	return Class((_shift(day, count, policy) * per_day) + tod - Class.datum)
+
+def subtract(pit, count, policy='clamp'):
+	"""
+	# Subtract &count months from &pit. Equivalent to `add(pit, -count, policy)`.
+	"""
+	return add(pit, -count, policy)
+
+def add_array(array, count, policy='clamp'):
+	"""
+	# Add &count months to each point of the &.arrays.TimestampArray, &array.
+	# Returns a new array.
+
+	# Points on the same day share the date resolution.
+	"""
+	Class = array.Type
+	per_day = _resolution(Class, policy)
+	datum = Class.datum
+
+	shifted = {}
+	def adjust(x):
+		day, tod = divmod(x + datum, per_day)
+		try:
+			target = shifted[day]
+		except KeyError:
+			target = shifted[day] = _shift(day, count, policy)
+		return (target * per_day) + tod - datum
+
+	return array.fromintegers(map(adjust, array.view))
+
+def subtract_array(array, count, policy='clamp'):
+	"""
+	# Subtract &count months from each point of &array.
+	"""
+	return add_array(array, -count, policy)
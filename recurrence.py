@@ -0,0 +1,310 @@
+"""
+# Recurrence rules producing occurrences lazily.
+
+# &Rule describes a recurring schedule in terms of a frequency, an interval, and
+# filters on the months, days of the month, and days of the week. Occurrences are
+# produced by a generator that can start at an arbitrary point without iterating
+# from the rule's origin.
+
+#!/syntax/python
+	from fault.time import recurrence
+	# Every second Tuesday of the month at 09:00 local time.
+	r = recurrence.Rule('monthly', origin, weekdays=[('tuesday', 2)], times=[(9, 0, 0)], zone=la)
+	for ts in r.occurrences(sysclock.now()):
+		...
+
+	# The last day of every month.
+	r = recurrence.Rule('monthly', origin, monthdays=[-1])
+
+# Rules work with local day numbers and the integer Gregorian functions, so subjective
+# units, months and years, are handled exactly. When a &views.Zone is given, the times
+# are wall-clock times in that zone and occurrences are converted to UTC.
+"""
+import itertools
+
+from . import types
+from . import gregorian
+from . import week
+
+#: The frequencies supported by &Rule.
+frequencies = ('yearly', 'monthly', 'weekly', 'daily')
+
+_day = types.Context.convert('day', 'nanosecond', 1)
+_second = types.Context.convert('second', 'nanosecond', 1)
+_datum = types.Date.datum
+
+#: The number of periods of each frequency in a Gregorian cycle, after which
+#: the selected days repeat.
+cycle_periods = {
+	'yearly': gregorian.centuries_in_cycle * gregorian.years_in_century,
+	'monthly': gregorian.months_in_cycle,
+	'weekly': gregorian.days_in_cycle // 7,
+	'daily': gregorian.days_in_cycle,
+}
+
+def _weekday(w):
+	if isinstance(w, str):
+		return week.weekday_name_to_number[w.lower()]
+	return int(w)
+
+def month_days(month_index) -> tuple:
+	"""
+	# Get the day number of the first day of the month and the number of days in it.
+	# &month_index is `year * 12 + (month - 1)`.
+	"""
+	year, moy = divmod(month_index, 12)
+	first = gregorian.days_from_date((year, moy + 1, 1))
+	return (first, gregorian.days_in_month(year, moy + 1))
+
+class Rule(object):
+	"""
+	# A recurrence rule.
+
+	# [ Properties ]
+	# /frequency/
+		# One of &frequencies; the size of the periods being repeated.
+	# /interval/
+		# The number of frequency periods between each expanded period.
+	# /origin/
+		# The first possible occurrence; the anchor of the periods.
+	# /months/
+		# The months, `1` through `12`, that occurrences are restricted to.
+	# /monthdays/
+		# Days of the month that occurrences are restricted to.
+		# Negative numbers count from the end of the month; `-1` being the last day.
+	# /weekdays/
+		# The `(weekday, nth)` pairs that occurrences are restricted to.
+		# An `nth` of zero selects every matching weekday in the month; negative
+		# values count from the end of the month.
+	# /times/
+		# The `(hour, minute, second)` times of day of each occurrence.
+	# /zone/
+		# The &views.Zone that the times are expressed in, or &None for UTC.
+	"""
+
+	def __init__(self, frequency, origin,
+			interval=1, months=(), monthdays=(), weekdays=(), times=None, zone=None,
+			cache_size=256,
+		):
+		if frequency not in frequencies:
+			raise ValueError("unknown frequency: " + repr(frequency))
+		if interval < 1:
+			raise ValueError("interval must be a positive integer")
+
+		self.frequency = frequency
+		self.interval = interval
+		self.origin = origin
+		self.zone = zone
+		self.months = tuple(sorted(set(months)))
+		self.monthdays = tuple(monthdays)
+		self.weekdays = tuple(
+			(_weekday(x), 0) if not isinstance(x, tuple) else (_weekday(x[0]), x[1])
+			for x in weekdays
+		)
+
+		o = int(origin)
+		self._origin_day = _datum + (o // _day)
+		if times is None:
+			self._times = (o % _day,)
+		else:
+			self._times = tuple(sorted(
+				((h * 60 + m) * 60 * _second) + int(s * _second)
+				for h, m, s in times
+			))
+
+		y, m, d = gregorian.date_from_days(self._origin_day)
+		self._origin_month = (y * 12) + (m - 1)
+		self._origin_monthday = d
+		self._origin_weekday = (self._origin_day - _datum) % 7
+
+		self._cache = {}
+		self._cache_size = cache_size
+
+	@classmethod
+	def from_period(Class, period, origin, **parameters):
+		"""
+		# Create a rule from a &types.Months, &types.Weeks, or &types.Days &period.
+		"""
+		if isinstance(period, types.Months):
+			n = int(period)
+			if n % 12 == 0:
+				return Class('yearly', origin, interval=n // 12, **parameters)
+			return Class('monthly', origin, interval=n, **parameters)
+		elif isinstance(period, types.Weeks):
+			return Class('weekly', origin, interval=int(period), **parameters)
+		elif isinstance(period, types.Days):
+			return Class('daily', origin, interval=int(period), **parameters)
+		raise ValueError("period must be a measure of months, weeks, or days")
+
+	def __repr__(self):
+		return '<%s: %s/%d>' %(self.__class__.__name__, self.frequency, self.interval)
+
+	def _filter_day(self, day):
+		# Restrictions used by the daily and weekly frequencies.
+		if self.months or self.monthdays or self.weekdays:
+			y, m, d = gregorian.date_from_days(day)
+			if self.months and m not in self.months:
+				return False
+			if self.monthdays:
+				first, length = month_days((y * 12) + (m - 1))
+				if not any(d == x or (x < 0 and d == length + x + 1) for x in self.monthdays):
+					return False
+			if self.weekdays and self.frequency == 'daily':
+				wd = (day - _datum) % 7
+				if not any(wd == x[0] for x in self.weekdays):
+					return False
+		return True
+
+	def expand_month(self, month_index) -> tuple:
+		"""
+		# Get the sorted day numbers selected by the rule in the identified month.
+		# Results are cached.
+		"""
+		try:
+			return self._cache[month_index]
+		except KeyError:
+			pass
+
+		first, length = month_days(month_index)
+		selection = None
+
+		if self.monthdays:
+			selection = set()
+			for x in self.monthdays:
+				d = x if x > 0 else length + x + 1
+				if 1 <= d <= length:
+					selection.add(first + d - 1)
+
+		if self.weekdays:
+			wdays = set()
+			first_wd = (first - _datum) % 7
+			for wd, nth in self.weekdays:
+				start = first + ((wd - first_wd) % 7)
+				matches = list(range(start, first + length, 7))
+				if nth == 0:
+					wdays.update(matches)
+				elif -len(matches) <= nth <= len(matches) and nth:
+					wdays.add(matches[nth - 1 if nth > 0 else nth])
+			selection = wdays if selection is None else (selection & wdays)
+
+		if selection is None:
+			d = self._origin_monthday
+			selection = (first + d - 1,) if d <= length else ()
+
+		r = tuple(sorted(selection))
+		cache = self._cache
+		if len(cache) >= self._cache_size:
+			cache.clear()
+		cache[month_index] = r
+		return r
+
+	def _period_start(self, day):
+		# Get the index of the period containing the local &day.
+		f = self.frequency
+		if f == 'daily':
+			delta = day - self._origin_day
+		elif f == 'weekly':
+			delta = ((day - _datum) // 7) - ((self._origin_day - _datum) // 7)
+		else:
+			y, m, d = gregorian.date_from_days(day)
+			delta = ((y * 12) + (m - 1)) - self._origin_month
+			if f == 'yearly':
+				delta //= 12
+		return max(0, delta // self.interval)
+
+	def _period_days(self, period):
+		# Get the sorted local day numbers of the given period.
+		f = self.frequency
+		n = period * self.interval
+
+		if f == 'daily':
+			day = self._origin_day + n
+			return (day,) if self._filter_day(day) else ()
+		elif f == 'weekly':
+			sunday = self._origin_day - self._origin_weekday + (n * 7)
+			wds = [x[0] for x in self.weekdays] or [self._origin_weekday]
+			return tuple(
+				d for d in (sunday + x for x in sorted(set(wds)))
+				if self._filter_day(d)
+			)
+		elif f == 'monthly':
+			mi = self._origin_month + n
+			if self.months and (mi % 12) + 1 not in self.months:
+				return ()
+			return self.expand_month(mi)
+		else:
+			year = (self._origin_month // 12) + n
+			months = self.months or ((self._origin_month % 12) + 1,)
+			return tuple(itertools.chain.from_iterable(
+				self.expand_month((year * 12) + (m - 1)) for m in months
+			))
+
+	def _to_utc(self, local):
+		z = self.zone
+		if z is None:
+			return local
+		# Times in a gap are moved forward by the size of the gap, and
+		# repeated times resolve to their first occurrence.
+		return int(z.to_utc(types.Timestamp(local), fold=0))
+
+	def _to_local(self, utc):
+		z = self.zone
+		if z is None:
+			return utc
+		return utc + (z.find(types.Timestamp(utc))[0] * _second)
+
+	def occurrences(self, start=None, stop=None, Timestamp=types.Timestamp):
+		"""
+		# Generate the occurrences at or after &start and before &stop.
+
+		# When &start is &None, the &origin is used. The first period considered is
+		# computed directly from &start rather than by iterating from the &origin.
+		"""
+		origin = int(self.origin)
+		lower = self._to_utc(origin) if start is None else max(int(start), self._to_utc(origin))
+		upper = None if stop is None else int(stop)
+
+		# Begin a day early so that zone offsets can not exclude the first occurrence.
+		day = _datum + ((self._to_local(lower) // _day) - 1)
+		period = self._period_start(day)
+		times = self._times
+
+		# Guard against rules that can never match, like the 31st of February.
+		# The selected days repeat every Gregorian cycle, so a cycle of empty
+		# periods means there are no further occurrences.
+		limit = cycle_periods[self.frequency]
+		empty = 0
+		while empty < limit:
+			days = self._period_days(period)
+			period += 1
+			if not days:
+				empty += 1
+				continue
+			empty = 0
+
+			for d in days:
+				base = (d - _datum) * _day
+				for t in times:
+					local = base + t
+					if local < origin:
+						continue
+					utc = self._to_utc(local)
+					if utc < lower:
+						continue
+					if upper is not None and utc >= upper:
+						return
+					yield Timestamp(utc)
+
+	def following(self, pit, Timestamp=types.Timestamp):
+		"""
+		# Get the first occurrence after &pit, or &None when there are none.
+		"""
+		for x in self.occurrences(Timestamp(int(pit) + 1)):
+			return x
+		return None
+
+	def between(self, segment) -> list:
+		"""
+		# Get the occurrences within the &types.Segment.
+		"""
+		return list(self.occurrences(segment.start, segment.stop))
@@ -0,0 +1,264 @@
+"""
+# Collections of &types.Segment instances.
+
+# &SegmentSet is a normalized set of disjoint segments supporting union,
+# intersection, and difference. &IntervalTree holds possibly overlapping segments
+# and answers which of them contain a given point.
+
+# Endpoints are stored as &types.Timestamp precision integers. The eternal points,
+# &constants.always and &constants.never, are accepted as unbounded endpoints and
+# are restored when segments are produced.
+
+#!/syntax/python
+	from fault.time import segments
+	blackouts = segments.SegmentSet(blackout_segments)
+	available = segments.SegmentSet([window]) - blackouts
+	if timestamp in available:
+		...
+"""
+import bisect
+import heapq
+
+from . import types
+from . import constants
+from .index import key, _minimum, _maximum
+
+def endpoint(k, Timestamp=types.Timestamp):
+	"""
+	# Convert the integer key, &k, back into a point.
+	"""
+	if k == _minimum:
+		return constants.always
+	elif k == _maximum:
+		return constants.never
+	return Timestamp(k)
+
+def keys(segment) -> tuple:
+	"""
+	# Get the ordered `(start, stop)` integers of the &segment.
+	"""
+	start, stop = key(segment[0]), key(segment[1])
+	if stop < start:
+		return (stop, start)
+	return (start, stop)
+
+def coalesce(pairs) -> list:
+	"""
+	# Merge overlapping and adjacent `(start, stop)` pairs.
+	# The &pairs must be sorted by their start.
+	"""
+	merged = []
+	for start, stop in pairs:
+		if start == stop:
+			continue
+		if merged and start <= merged[-1][1]:
+			if stop > merged[-1][1]:
+				merged[-1][1] = stop
+		else:
+			merged.append([start, stop])
+	return [tuple(x) for x in merged]
+
+class SegmentSet(object):
+	"""
+	# A set of points in time represented by sorted, disjoint, half-open segments.
+
+	# Construction coalesces the given segments in `O(n log n)`; the set operations
+	# are linear merges of the two normalized sequences, and point membership
+	# is a binary search.
+	"""
+	__slots__ = ('starts', 'stops')
+
+	def __init__(self, segments=()):
+		pairs = sorted(keys(x) for x in segments)
+		self._assign(coalesce(pairs))
+
+	@classmethod
+	def _from_pairs(Class, pairs):
+		s = Class.__new__(Class)
+		s._assign(pairs)
+		return s
+
+	def _assign(self, pairs):
+		self.starts = [x[0] for x in pairs]
+		self.stops = [x[1] for x in pairs]
+
+	def _pairs(self):
+		return zip(self.starts, self.stops)
+
+	def __len__(self):
+		return len(self.starts)
+
+	def __bool__(self):
+		return bool(self.starts)
+
+	def __repr__(self):
+		return '<%s: %d segments>' %(self.__class__.__name__, len(self))
+
+	def __eq__(self, ob):
+		if not isinstance(ob, SegmentSet):
+			return NotImplemented
+		return self.starts == ob.starts and self.stops == ob.stops
+
+	def __iter__(self, Segment=types.Segment):
+		for start, stop in self._pairs():
+			yield Segment((endpoint(start), endpoint(stop)))
+
+	def __contains__(self, point):
+		k = key(point)
+		i = bisect.bisect_right(self.starts, k) - 1
+		return i >= 0 and k < self.stops[i]
+
+	def find(self, point, Segment=types.Segment):
+		"""
+		# Get the segment of the set containing &point or &None.
+		"""
+		k = key(point)
+		i = bisect.bisect_right(self.starts, k) - 1
+		if i >= 0 and k < self.stops[i]:
+			return Segment((endpoint(self.starts[i]), endpoint(self.stops[i])))
+		return None
+
+	def union(self, other):
+		"""
+		# Create a set containing the points of both sets.
+		"""
+		return self._from_pairs(coalesce(heapq.merge(self._pairs(), other._pairs())))
+	__or__ = union
+
+	def intersection(self, other):
+		"""
+		# Create a set containing the points present in both sets.
+		"""
+		result = []
+		a = list(self._pairs())
+		b = list(other._pairs())
+		i = j = 0
+		while i < len(a) and j < len(b):
+			start = max(a[i][0], b[j][0])
+			stop = min(a[i][1], b[j][1])
+			if start < stop:
+				result.append((start, stop))
+			if a[i][1] < b[j][1]:
+				i += 1
+			else:
+				j += 1
+		return self._from_pairs(result)
+	__and__ = intersection
+
+	def difference(self, other):
+		"""
+		# Create a set containing the points of this set that are not in &other.
+		"""
+		result = []
+		b = list(other._pairs())
+		j = 0
+		for start, stop in self._pairs():
+			# Skip the subtrahends ending before this segment.
+			while j < len(b) and b[j][1] <= start:
+				j += 1
+
+			k = j
+			while k < len(b) and b[k][0] < stop:
+				if b[k][0] > start:
+					result.append((start, b[k][0]))
+				start = max(start, b[k][1])
+				if start >= stop:
+					break
+				k += 1
+
+			if start < stop:
+				result.append((start, stop))
+		return self._from_pairs(result)
+	__sub__ = difference
+
+	def complement(self):
+		"""
+		# Create a set containing all the points not in this set.
+		"""
+		return self._from_pairs([(_minimum, _maximum)]).difference(self)
+	__invert__ = complement
+
+	def overlaps(self, segment) -> bool:
+		"""
+		# Whether any point in &segment is in the set.
+		"""
+		start, stop = keys(segment)
+		i = bisect.bisect_right(self.starts, start) - 1
+		if i >= 0 and start < self.stops[i]:
+			return True
+		return i + 1 < len(self.starts) and self.starts[i+1] < stop
+
+class IntervalTree(object):
+	"""
+	# Static centered interval tree over possibly overlapping segments.
+
+	# Built in `O(n log n)`; &stab finds the segments containing a point in
+	# `O(log n + k)` where `k` is the number of matches.
+
+	# [ Properties ]
+	# /segments/
+		# The sequence of segments given to the constructor; &stab returns
+		# indexes into this sequence.
+	"""
+
+	def __init__(self, segments):
+		self.segments = list(segments)
+		items = [keys(x) + (i,) for i, x in enumerate(self.segments)]
+		self._root = self._build([x for x in items if x[0] < x[1]])
+
+	def __len__(self):
+		return len(self.segments)
+
+	@classmethod
+	def _build(Class, items):
+		if not items:
+			return None
+
+		# The median start is always contained by its own segment,
+		# so each node holds at least one item.
+		starts = sorted([x[0] for x in items])
+		center = starts[len(starts) // 2]
+
+		left = []
+		right = []
+		here = []
+		for x in items:
+			if x[1] <= center:
+				left.append(x)
+			elif x[0] > center:
+				right.append(x)
+			else:
+				here.append(x)
+
+		by_start = sorted(here, key=lambda x: x[0])
+		by_stop = sorted(here, key=lambda x: x[1], reverse=True)
+		return (center, by_start, by_stop, Class._build(left), Class._build(right))
+
+	def stab(self, point) -> list:
+		"""
+		# Get the indexes of the segments containing &point.
+		"""
+		k = key(point)
+		result = []
+		node = self._root
+		while node is not None:
+			center, by_start, by_stop, left, right = node
+			if k < center:
+				for x in by_start:
+					if x[0] > k:
+						break
+					result.append(x[2])
+				node = left
+			else:
+				for x in by_stop:
+					if x[1] <= k:
+						break
+					result.append(x[2])
+				node = right if k > center else None
+		return result
+
+	def containing(self, point) -> list:
+		"""
+		# Get the segments containing &point.
+		"""
+		return [self.segments[i] for i in self.stab(point)]
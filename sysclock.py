@@ -1,6 +1,7 @@
 """
 # Typed System Clock access.
 """
+import struct
 from . import types
 
 try:
@@ -13,12 +14,8 @@ try:
 except ImportError:
 	import time
 
-	def _real_clock_read(time=time.time, delta=types.core.unix_epoch_delta):
-		t = time()
-		i = t.__int__()
-		s = (t - i) * 1000000000
-		i -= delta
-		return (i + s)
+	def _real_clock_read(time=time.time_ns, delta=types.core.unix_epoch_delta * 1000000000):
+		return time() - delta
 
 	try:
 		_monotonic_clock_read = time.monotonic_ns
@@ -39,3 +36,305 @@ def elapsed(Measure=types.Measure) -> types.Measure:
 	# Snapshot of the system's monotonic clock. Returns a &types.Measure.
 	"""
 	return Measure(_monotonic_clock_read())
+
+class Correlation(object):
+	"""
+	# Relate monotonic clock readings to real clock time.
+
+	# Samples both clocks and maintains an offset and drift estimate so that
+	# &elapsed snapshots, or the plain integers read from the monotonic clock,
+	# can be resolved into &types.Timestamp instances after the fact.
+
+	#!/syntax/python
+		c = sysclock.Correlation()
+		marks = [sysclock.elapsed() for x in range(1000)]
+		stamps = c.timestamps(marks)
+
+	# [ Properties ]
+	# /interval/
+		# The number of monotonic nanoseconds that may pass before
+		# &update takes a new sample.
+	# /reference/
+		# The latest `(monotonic, real)` sample pair.
+	# /drift/
+		# The estimated rate difference of the real clock relative to the monotonic
+		# clock in parts per billion.
+	"""
+
+	def __init__(self, interval=1000000000,
+			real=_real_clock_read, monotonic=_monotonic_clock_read
+		):
+		self.interval = int(interval)
+		self._real = real
+		self._monotonic = monotonic
+		self.reference = None
+		self.drift = 0
+		self._baseline = None
+		self.sample()
+
+	def sample(self):
+		"""
+		# Read both clocks and update the offset estimate. The drift estimate
+		# is only updated when at least an &interval has passed since the sample
+		# that the prior estimate was measured from.
+
+		# The real clock read is bracketed by two monotonic reads and
+		# the midpoint is used as the corresponding monotonic reading.
+
+		# Returns the new reference pair.
+		"""
+		m0 = self._monotonic()
+		r = int(self._real())
+		m1 = self._monotonic()
+		sample = ((m0 + m1) // 2, r)
+
+		prior = self._baseline
+		if prior is None:
+			self._baseline = sample
+		else:
+			# Short spans only measure the jitter of the reads, so
+			# leave the drift estimate and its baseline alone until an interval has passed.
+			mdelta = sample[0] - prior[0]
+			if mdelta >= self.interval:
+				rdelta = sample[1] - prior[1]
+				self.drift = ((rdelta - mdelta) * 1000000000) // mdelta
+				self._baseline = sample
+
+		self.reference = sample
+		return sample
+
+	def update(self):
+		"""
+		# Take a new &sample if the &interval has passed since the last one.
+
+		# Returns &True when a sample was taken.
+		"""
+		if self._monotonic() - self.reference[0] >= self.interval:
+			self.sample()
+			return True
+		return False
+
+	@property
+	def offset(self) -> int:
+		"""
+		# The difference between the real clock and the monotonic clock in nanoseconds
+		# at the time of the latest sample.
+		"""
+		m, r = self.reference
+		return r - m
+
+	def resolve(self, reading:int) -> int:
+		"""
+		# Convert the monotonic &reading into the real clock's nanoseconds since
+		# the project's datum. Returns a plain integer.
+		"""
+		m, r = self.reference
+		delta = reading - m
+		return r + delta + ((delta * self.drift) // 1000000000)
+
+	def timestamp(self, reading, Timestamp=types.Timestamp) -> types.Timestamp:
+		"""
+		# Convert a monotonic &reading, usually a &types.Measure from &elapsed,
+		# into a &types.Timestamp.
+		"""
+		return Timestamp(self.resolve(reading))
+
+	def timestamps(self, readings, Timestamp=types.Timestamp) -> list:
+		"""
+		# Convert a sequence of monotonic &readings into a list of &types.Timestamp.
+
+		# The estimates are read once for the entire batch.
+		"""
+		m, r = self.reference
+		drift = self.drift
+		return [
+			Timestamp(r + d + ((d * drift) // 1000000000))
+			for d in [x - m for x in readings]
+		]
+
+#: Default name of the shared memory segment written by &Publisher.
+published_name = 'fault-time-clock'
+
+#: Layout of the published clock: sequence, timestamp, monotonic reading,
+#: offset in seconds, daylight savings flag, and the offset's abbreviation.
+published_struct = struct.Struct('=QqqiB7s')
+_sequence_struct = struct.Struct('=Q')
+
+# Names of the segments created by this process's publishers.
+_created = set()
+
+def _attach(name, create=False, size=0):
+	from multiprocessing import shared_memory
+	if create:
+		m = shared_memory.SharedMemory(name, create=True, size=size)
+		_created.add(name)
+		return m
+
+	try:
+		return shared_memory.SharedMemory(name, track=False)
+	except TypeError:
+		# Python before 3.13; keep the resource tracker from
+		# unlinking the publisher's segment when this process exits.
+		import os
+		from multiprocessing import resource_tracker
+		m = shared_memory.SharedMemory(name)
+		if os.name == 'posix' and name not in _created:
+			# Segments are registered by their POSIX name.
+			resource_tracker.unregister('/' + name.lstrip('/'), 'shared_memory')
+		return m
+
+class Publisher(object):
+	"""
+	# Write the current time and zone offset into a shared memory segment so that
+	# local processes can read it with &Published without system calls or zone lookups.
+
+	# Updates are guarded by a sequence lock: the sequence is odd while a write is
+	# in progress, and readers retry when it is odd or changes during their read.
+
+	# [ Properties ]
+	# /memory/
+		# The &multiprocessing.shared_memory.SharedMemory segment.
+	# /zone/
+		# The &.views.Zone whose offset is published; &None for UTC.
+	# /sequence/
+		# The sequence number of the latest update.
+	"""
+
+	def __init__(self, name=published_name, zone=None,
+			real=_real_clock_read, monotonic=_monotonic_clock_read
+		):
+		self.zone = zone
+		self._cursor = zone.cursor() if zone is not None else None
+		self._real = real
+		self._monotonic = monotonic
+		self._name = name
+		self.memory = _attach(name, create=True, size=published_struct.size)
+		self.sequence = 0
+		self.update()
+
+	@property
+	def name(self):
+		return self.memory.name
+
+	def update(self, Timestamp=types.Timestamp):
+		"""
+		# Publish the current time and offset.
+		"""
+		ts = self._real()
+		if self._cursor is not None:
+			offset = self._cursor.find(Timestamp(ts))
+			magnitude = offset[0]
+			dst = offset.is_dst
+			abbreviation = offset[1].encode('ascii')
+		else:
+			magnitude = 0
+			dst = False
+			abbreviation = b'UTC'
+
+		buf = self.memory.buf
+		seq = self.sequence + 1
+		_sequence_struct.pack_into(buf, 0, seq)
+		published_struct.pack_into(buf, 0, seq, ts, self._monotonic(), magnitude, dst, abbreviation)
+		seq += 1
+		_sequence_struct.pack_into(buf, 0, seq)
+		self.sequence = seq
+
+	def run(self, interval=0.064, sleep=None):
+		"""
+		# Update the segment every &interval seconds until interrupted.
+		"""
+		if sleep is None:
+			import time
+			sleep = time.sleep
+
+		while True:
+			self.update()
+			sleep(interval)
+
+	def close(self, unlink=True):
+		"""
+		# Release the segment, and remove it unless &unlink is &False.
+		"""
+		self.memory.close()
+		if unlink:
+			self.memory.unlink()
+			_created.discard(self._name)
+
+class Published(object):
+	"""
+	# Reader of the time published by a &Publisher.
+
+	#!/syntax/python
+		clock = sysclock.Published()
+		ts = clock.now()
+		local, offset = clock.localize()
+
+	# Readings have the granularity of the publisher's update interval.
+
+	# [ Properties ]
+	# /memory/
+		# The &multiprocessing.shared_memory.SharedMemory segment.
+	"""
+
+	def __init__(self, name=published_name):
+		self.memory = _attach(name)
+		self._buffer = self.memory.buf
+		self._offsets = {}
+
+	def read(self, retries=100000):
+		"""
+		# Get a consistent copy of the published fields.
+
+		# Returns a tuple of the sequence, the timestamp and monotonic integers,
+		# the offset in seconds, the daylight savings flag, and the abbreviation.
+
+		# Raises &RuntimeError when no consistent copy could be read after &retries
+		# attempts; normally, a publisher that exited during an update.
+		"""
+		buf = self._buffer
+		seq = _sequence_struct.unpack_from
+		read = published_struct.unpack_from
+		for i in range(retries):
+			s = seq(buf, 0)[0]
+			if s & 1:
+				continue
+			r = read(buf, 0)
+			if r[0] == s and seq(buf, 0)[0] == s:
+				return r
+
+		raise RuntimeError("published clock was not consistent after %d reads" %(retries,))
+
+	def now(self, Timestamp=types.Timestamp) -> types.Timestamp:
+		"""
+		# Get the published time as a &types.Timestamp.
+		"""
+		return Timestamp(self.read()[1])
+
+	def localize(self, Timestamp=types.Timestamp):
+		"""
+		# Get the published time adjusted by the published offset.
+
+		# Returns a pair of the local &types.Timestamp and the &.views.Zone.Offset;
+		# the same form as &.views.Zone.localize.
+		"""
+		seq, ts, m, magnitude, dst, abbreviation = self.read()
+		key = (magnitude, dst, abbreviation)
+		try:
+			offset = self._offsets[key]
+		except KeyError:
+			from .views import Zone
+			offset = Zone.Offset((
+				magnitude,
+				abbreviation.rstrip(b'\0').decode('ascii'),
+				'dst' if dst else 'std',
+			))
+			self._offsets[key] = offset
+
+		return (Timestamp(ts + magnitude * 1000000000), offset)
+
+	def close(self):
+		"""
+		# Detach from the segment.
+		"""
+		self._buffer.release()
+		self.memory.close()
@@ -0,0 +1,67 @@
+import array
+from .. import types
+from .. import arrays as module
+
+def iso(s):
+	return types.Timestamp.of(iso=s)
+
+def test_TimestampArray(test):
+	pits = [iso('2020-01-01T10:10:10'), iso('2020-02-15T00:00:01'), iso('1999-12-31T23:59:59')]
+	a = module.TimestampArray(pits)
+	test/len(a) == 3
+	test/list(a) == pits
+	test.isinstance(a[0], types.Timestamp)
+	test/a[-1] == pits[-1]
+
+	# Slices share memory.
+	s = a[1:]
+	test/len(s) == 2
+	a[1] = pits[0]
+	test/s[0] == pits[0]
+
+	raw = a.tobytes()
+	test/module.TimestampArray.frombuffer(raw) == a
+	test/list(a.view) == [int(x) for x in a]
+
+def test_TimestampArray_operations(test):
+	pits = [iso('2020-01-01T10:10:10'), iso('2020-02-15T00:00:01')]
+	a = module.TimestampArray(pits)
+
+	test/list(a.elapse(types.Measure.of(hour=1))) == [x.elapse(hour=1) for x in pits]
+	test/list(a.rollback(types.Measure.of(hour=1))) == [x.rollback(hour=1) for x in pits]
+	test/list(a.elapse(types.Months.of(month=1))) == [x.elapse(month=1) for x in pits]
+	test/list(a.truncate('hour')) == [x.truncate('hour') for x in pits]
+	test/list(a.truncate('day')) == [x.truncate('day') for x in pits]
+	test/list(a.truncate('month')) == [x.truncate('month') for x in pits]
+
+	test/a.ge(pits[1]) == bytearray([0, 1])
+	test/a.lt(pits[1]) == bytearray([1, 0])
+	test/list(a.select(a.eq(pits[0]))) == [pits[0]]
+
+def test_MeasureArray(test):
+	a = module.MeasureArray([types.Measure.of(second=1), types.Measure.of(second=2)])
+	test.isinstance(a[0], types.Measure)
+	test/list(a.elapse(types.Measure.of(second=1))) == [types.Measure.of(second=2), types.Measure.of(second=3)]
+	test/module.MeasureArray.frombuffer(array.array('q', [1, 2]))[1] == types.Measure(2)
+
+	# Months have no fixed length.
+	with test/ValueError as exc:
+		a.elapse(types.Months.of(month=1))
+	with test/ValueError as exc:
+		a.rollback(types.Months.of(month=1))
+
+def test_Array_slice_assignment(test):
+	pits = [iso('2020-01-0%dT00:00:00' %(x,)) for x in range(1, 6)]
+	a = module.TimestampArray(pits)
+	a[1:3] = pits[3:5]
+	test/list(a) == [pits[0], pits[3], pits[4], pits[3], pits[4]]
+	a[::2] = module.TimestampArray(pits[:3])
+	test/list(a) == [pits[0], pits[3], pits[1], pits[3], pits[2]]
+
+	with test/ValueError as exc:
+		a[0:2] = pits[:1]
+	test/list(a)[:2] == [pits[0], pits[3]]
+
+if __name__ == '__main__':
+	import sys; from ...test import library as libtest
+	libtest.execute(sys.modules[__name__])
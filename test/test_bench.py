@@ -0,0 +1,34 @@
+import io
+import json
+from .. import bench as module
+
+def test_execute(test):
+	data = module.execute(size=4, repeat=1)
+	test/data['size'] == 4
+	test/data['repeat'] == 1
+	test/data['seed'] == module.default_seed
+	test/set(data['workloads']) == set(module.workloads)
+
+	fields = {'operations', 'nanoseconds', 'ops_per_second', 'peak_bytes', 'retained_blocks'}
+	for name, r in data['workloads'].items():
+		if r is None:
+			# Unavailable; zone workloads without a zoneinfo database.
+			test/name.startswith('zone_') == True
+			continue
+		test/set(r) == fields
+		test/r['operations'] == 4
+		test/r['nanoseconds'] / int
+
+	# The report is serializable and printable.
+	test/json.loads(json.dumps(data)) == data
+	out = io.StringIO()
+	module.report(data, file=out)
+	test/len(out.getvalue().splitlines()) == len(module.workloads) + 1
+
+def test_execute_names(test):
+	data = module.execute(['construct', 'parse'], size=2, repeat=1)
+	test/list(data['workloads']) == ['construct', 'parse']
+
+if __name__ == '__main__':
+	import sys; from ...test import library as libtest
+	libtest.execute(sys.modules[__name__])
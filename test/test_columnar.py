@@ -0,0 +1,75 @@
+import array
+import struct
+from .. import types
+from .. import columnar as module
+
+def test_unix_conversion(test):
+	pits = [
+		types.Timestamp.of(iso='1970-01-01T00:00:01'),
+		types.Timestamp.of(iso='2020-05-06T07:08:09.123456789'),
+		types.Timestamp.of(iso='1969-12-31T23:59:59.5'),
+	]
+	for resolution, expected in [
+			('nanosecond', [1000000000, 1588748889123456789, -500000000]),
+			('microsecond', [1000000, 1588748889123456, -500000]),
+			('millisecond', [1000, 1588748889123, -500]),
+			('second', [1, 1588748889, -1]),
+		]:
+		a = array.array('q', [int(x) for x in pits])
+		v = module.to_unix(a, resolution)
+		test/list(a) == expected
+		test/list(v) == expected
+
+	a = array.array('q', [0, 1588748889123])
+	module.from_unix(a, 'millisecond')
+	test/list(map(types.Timestamp, a)) == [
+		types.from_unix_timestamp(0),
+		types.Timestamp.of(iso='2020-05-06T07:08:09.123'),
+	]
+
+	# Buffers of bytes are viewed as 64-bit integers.
+	b = bytearray(array.array('q', [0]).tobytes())
+	module.to_unix(b)
+	test/array.array('q', bytes(b))[0] == int(types.from_unix_timestamp(0).measure(types.Timestamp(0)))
+
+def field(data, table, index):
+	# The position of the &index field of the flatbuffer &table; &None when absent.
+	vtable = table - struct.unpack_from('<i', data, table)[0]
+	vsize = struct.unpack_from('<H', data, vtable)[0]
+	if 4 + (2 * index) >= vsize:
+		return None
+	offset = struct.unpack_from('<H', data, vtable + 4 + (2 * index))[0]
+	return table + offset if offset else None
+
+def follow(data, position):
+	return position + struct.unpack_from('<I', data, position)[0]
+
+def test_schema_nullable(test):
+	data = module.schema_message(['ts'])[8:]
+	message = follow(data, 0)
+	schema = follow(data, field(data, message, 2))
+	fields = follow(data, field(data, schema, 1))
+	test/struct.unpack_from('<I', data, fields)[0] == 1
+	f = follow(data, fields + 4)
+	test/data[field(data, f, 1)] == 1
+
+def test_ipc_messages(test):
+	schema = module.schema_message(['ts'], 'millisecond')
+	cont, size = struct.unpack_from('<iI', schema)
+	test/cont == -1
+	test/(size % 8) == 0
+	test/len(schema) == size + 8
+
+	batch = module.record_batch_message([array.array('q', [1, 2, 3])])
+	cont, size = struct.unpack_from('<iI', batch)
+	test/cont == -1
+	# Metadata followed by the 64-byte padded data buffer.
+	test/len(batch) == 8 + size + 64
+	test/batch[8 + size:8 + size + 24] == array.array('q', [1, 2, 3]).tobytes()
+
+	with test/ValueError as exc:
+		module.record_batch_message([array.array('q', [1]), array.array('q', [1, 2])])
+
+if __name__ == '__main__':
+	import sys; from ...test import library as libtest
+	libtest.execute(sys.modules[__name__])
@@ -0,0 +1,96 @@
+from .. import core
+from .. import types
+from .. import cron as module
+
+def iso(s):
+	return types.Timestamp.of(iso=s)
+
+def test_compile(test):
+	e = module.compile('*/15 9-17 * * mon-fri')
+	test/e.masks[0] == (1 << 0) | (1 << 15) | (1 << 30) | (1 << 45)
+	test/e.masks[4] == sum(1 << x for x in range(1, 6))
+
+	test/module.compile('0 0 * * 7').masks[4] == 1
+	test/module.compile('@daily').masks == module.compile('0 0 * * *').masks
+
+	for x in ('* * *', '60 * * * *', '* * * foo *', '*/0 * * * *'):
+		with test/core.ParseError as exc:
+			module.compile(x)
+
+def test_next(test):
+	e = module.compile('*/15 9-17 * * mon-fri')
+	# 2020-01-03 is a Friday.
+	test/e.next(iso('2020-01-03T08:00:00')) == iso('2020-01-03T09:00:00')
+	test/e.next(iso('2020-01-03T09:00:00')) == iso('2020-01-03T09:15:00')
+	test/e.next(iso('2020-01-03T09:01:30')) == iso('2020-01-03T09:15:00')
+	test/e.next(iso('2020-01-03T17:45:00')) == iso('2020-01-06T09:00:00')
+
+	e = module.compile('30 2 29 2 *')
+	test/e.next(iso('2021-01-01T00:00:00')) == iso('2024-02-29T02:30:00')
+
+	# Either the day of month or the weekday.
+	e = module.compile('0 0 13 * fri')
+	test/e.next(iso('2020-01-01T00:00:00')) == iso('2020-01-03T00:00:00')
+	test/e.next(iso('2020-01-10T00:00:00')) == iso('2020-01-13T00:00:00')
+
+	test/module.compile('0 0 30 2 *').next(iso('2020-01-01T00:00:00')) == None
+
+def test_schedule(test):
+	e = module.compile('0 0 1 * *')
+	s = e.schedule(iso('2020-01-15T00:00:00'), 3)
+	test/list(s) == [
+		int(iso('2020-02-01T00:00:00')),
+		int(iso('2020-03-01T00:00:00')),
+		int(iso('2020-04-01T00:00:00')),
+	]
+	test/list(s) == [int(x) for x, i in zip(e.iterate(iso('2020-01-15T00:00:00')), range(3))]
+
+def la_zone(test):
+	from .. import views
+	try:
+		return views.Zone.open(types.from_unix_timestamp, 'America/Los_Angeles')
+	except Exception:
+		test.skip("zoneinfo database not available")
+
+def test_zone_gap(test):
+	z = la_zone(test)
+	# 2020-03-08 02:00 PST is skipped to 03:00 PDT (10:00Z).
+	e = module.compile('0 * * * *', zone=z)
+	fires = [types.Timestamp(x) for x in e.schedule(iso('2020-03-08T08:30:00'), 5)]
+	test/fires == [
+		iso('2020-03-08T09:00:00'), # 01:00 PST
+		iso('2020-03-08T10:00:00'), # 03:00 PDT; 02:00 moved forward
+		iso('2020-03-08T11:00:00'),
+		iso('2020-03-08T12:00:00'),
+		iso('2020-03-08T13:00:00'),
+	]
+
+	e = module.compile('*/30 1-3 * * *', zone=z)
+	fires = [types.Timestamp(x) for x in e.schedule(iso('2020-03-08T08:00:00'), 6)]
+	test/fires == [
+		iso('2020-03-08T09:00:00'), # 01:00 PST
+		iso('2020-03-08T09:30:00'), # 01:30 PST
+		iso('2020-03-08T10:00:00'), # 02:00 -> 03:00 PDT
+		iso('2020-03-08T10:30:00'), # 02:30 -> 03:30 PDT
+		iso('2020-03-09T08:00:00'), # 01:00 PDT
+		iso('2020-03-09T08:30:00'),
+	]
+
+def test_zone_overlap(test):
+	z = la_zone(test)
+	# 2020-11-01 01:00-02:00 occurs in PDT and again in PST.
+	e = module.compile('0 * * * *', zone=z)
+	fires = [types.Timestamp(x) for x in e.schedule(iso('2020-11-01T07:30:00'), 3)]
+	test/fires == [
+		iso('2020-11-01T08:00:00'), # 01:00 PDT
+		iso('2020-11-01T10:00:00'), # 02:00 PST; 01:00 PST is not repeated
+		iso('2020-11-01T11:00:00'),
+	]
+
+	e = module.compile('30 2 * * *', zone=z)
+	test/e.next(iso('2020-11-01T00:00:00')) == iso('2020-11-01T10:30:00') # 02:30 PST
+	test/e.next(iso('2020-03-08T00:00:00')) == iso('2020-03-08T10:30:00') # 03:30 PDT
+
+if __name__ == '__main__':
+	import sys; from ...test import library as libtest
+	libtest.execute(sys.modules[__name__])
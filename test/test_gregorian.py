@@ -105,6 +105,60 @@ def test_days_from_date(test):
 		date, days = x
 		test/days == gregorian.days_from_date(date)
 
+def test_DateCache(test):
+	c = gregorian.DateCache(size=2, offset=0)
+	for date, days in date_io_samples:
+		test/c.resolve(days)[:3] == date
+		test/c.resolve(days)[3] == days % 7
+
+	test/len(c) == 2
+	hits, misses, entries, size = c.statistics()
+	test/hits == len(date_io_samples)
+	test/misses == len(date_io_samples)
+
+	c.resize(1)
+	test/len(c) == 1
+	c.clear()
+	test/c.statistics() == (0, 0, 0, 1)
+
+def test_ymd(test):
+	for date, days in date_io_samples:
+		test/gregorian.ymd_from_days(days) == date
+		test/gregorian.days_from_ymd(*date) == days
+
+	for days in range(-1000, 150000, 97):
+		test/gregorian.ymd_from_days(days) == gregorian.date_from_days(days)
+
+def test_days_in_month(test):
+	test/gregorian.days_in_month(2001, 2) == 28
+	test/gregorian.days_in_month(2000, 2) == 29
+	test/gregorian.days_in_month(1900, 2) == 28
+	test/gregorian.days_in_month(2001, 12) == 31
+	test/[gregorian.days_in_month(2001, x) for x in range(1, 13)] == list(gregorian.calendar_year)
+
+def test_DateCache_threads(test):
+	import threading
+	c = gregorian.DateCache(size=16, offset=0)
+	failures = []
+
+	def run(start):
+		try:
+			for x in range(start, start + 20000):
+				d = x % 512
+				c.resolve(d)
+		except Exception as err:
+			failures.append(err)
+
+	threads = [threading.Thread(target=run, args=(i * 37,)) for i in range(8)]
+	for t in threads:
+		t.start()
+	for t in threads:
+		t.join()
+
+	test/failures == []
+	test/(len(c) <= 16 + len(threads)) == True
+	test/c.resolve(730486) == gregorian.date_from_days(730486) + (730486 % 7,)
+
 if __name__ == '__main__':
 	import sys; from ...test import library as libtest
 	libtest.execute(sys.modules[__name__])
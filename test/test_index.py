@@ -0,0 +1,50 @@
+from .. import types
+from .. import constants
+from .. import index as module
+
+def ts(day, hour=0):
+	return types.Timestamp.of(date=(2020, 1, day), hour=hour)
+
+def test_TimeIndex_build(test):
+	points = [ts(5), ts(1), ts(3), ts(2), ts(4)]
+	idx = module.TimeIndex.build(points)
+	test/len(idx) == 5
+	test/list(idx.keys) == sorted(int(x) for x in points)
+	test/list(idx.payloads) == [1, 3, 2, 4, 0]
+	test/idx[0] == (ts(1), 1)
+
+def test_TimeIndex_append(test):
+	idx = module.TimeIndex()
+	for d in (1, 2, 4, 3, 5):
+		idx.append(ts(d))
+
+	test/len(idx) == 5
+	test/[p for t, p in idx] == [0, 1, 3, 2, 4]
+	test/list(idx.keys) == sorted(idx.keys)
+
+def test_TimeIndex_queries(test):
+	idx = module.TimeIndex.build([ts(d, h) for d in range(1, 11) for h in (0, 12)])
+
+	seg = types.Segment((ts(3), ts(5)))
+	test/idx.count(seg) == 4
+	test/list(idx.select(seg)) == [4, 5, 6, 7]
+	test/[t for t, p in idx.points(seg)] == [ts(3), ts(3, 12), ts(4), ts(4, 12)]
+
+	# Points of other precisions and measures.
+	test/idx.count(types.Date.of(date=(2020, 1, 2))) == 2
+	test/[t for t, p in idx.points(types.Date.of(date=(2020, 1, 2)))] == [ts(2), ts(2, 12)]
+	test/idx.count(ts(2)) == 1
+	test/idx.count(types.Measure(int(ts(2)))) == 1
+	test/idx.count(constants.continuum) == 20
+	test/idx.count(types.Segment((constants.always, ts(2)))) == 2
+
+	test/idx.nearest(ts(3, 5)) == (ts(3), 4)
+	test/idx.nearest(ts(3, 7)) == (ts(3, 12), 5)
+	test/idx.nearest(ts(20)) == (ts(10, 12), 19)
+	test/idx.before(ts(3)) == (ts(2, 12), 3)
+	test/idx.after(ts(3)) == (ts(3, 12), 5)
+	test/idx.before(ts(1)) == None
+
+if __name__ == '__main__':
+	import sys; from ...test import library as libtest
+	libtest.execute(sys.modules[__name__])
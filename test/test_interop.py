@@ -0,0 +1,65 @@
+import datetime
+from .. import types
+from .. import interop as module
+
+utc = datetime.timezone.utc
+
+def test_from_datetime(test):
+	dt = datetime.datetime(2020, 5, 6, 7, 8, 9, 123456)
+	ts = module.from_datetime(dt)
+	test/ts == types.Timestamp.of(iso='2020-05-06T07:08:09.123456')
+	test/module.from_datetime(dt.replace(tzinfo=utc)) == ts
+
+	# Aware instances are converted to UTC.
+	est = datetime.timezone(datetime.timedelta(hours=-5))
+	test/module.from_datetime(dt.replace(tzinfo=est)) == ts.elapse(hour=5)
+
+	test/module.from_datetime(datetime.datetime(1970, 1, 1)) == types.from_unix_timestamp(0)
+	test/module.from_datetime(datetime.datetime(1, 1, 1)) == types.Timestamp.of(iso='0001-01-01T00:00:00')
+	test/module.from_date(datetime.date(2000, 1, 2)) == types.Date(0)
+	test/module.from_datetime(dt, types.Date) == types.Date.of(year=2020, month=4, day=5)
+
+def test_to_datetime(test):
+	ts = types.Timestamp.of(iso='2020-05-06T07:08:09.123456789')
+	dt = module.to_datetime(ts)
+	test/dt == datetime.datetime(2020, 5, 6, 7, 8, 9, 123456, tzinfo=utc)
+	test/dt.tzinfo == utc
+	test/module.to_naive(ts) == datetime.datetime(2020, 5, 6, 7, 8, 9, 123456)
+	test/module.to_datetime(types.Date.of(year=2020, month=4, day=5)) == datetime.datetime(2020, 5, 6, tzinfo=utc)
+
+	# Truncation is toward the past.
+	pre = types.Timestamp.of(iso='1969-12-31T23:59:59.9999995')
+	test/module.to_datetime(pre) == datetime.datetime(1969, 12, 31, 23, 59, 59, 999999, tzinfo=utc)
+
+	pits = [ts, pre, types.Timestamp(0)]
+	test/module.to_datetimes(pits) == [module.to_datetime(x) for x in pits]
+	test/module.from_datetimes(module.to_datetimes([ts])) == [ts.truncate('microsecond')]
+
+	est = datetime.timezone(datetime.timedelta(hours=-5))
+	local = module.to_datetime(ts, est)
+	test/local.hour == 2
+	test/local == dt
+
+def test_zone_mapping(test):
+	from .. import views
+	try:
+		zone = views.Zone.open(types.from_unix_timestamp, 'America/Los_Angeles')
+	except Exception:
+		test.skip("zoneinfo database not available")
+
+	zi = module.zoneinfo(zone)
+	if zi is None:
+		test.skip("zoneinfo module not available")
+	test/zi.key == 'America/Los_Angeles'
+	test/(module.zone(zi) is module.zone(zi)) == True
+
+	summer = types.Timestamp.of(iso='2020-07-01T12:00:00')
+	winter = types.Timestamp.of(iso='2020-01-01T12:00:00')
+	test/module.to_datetime(summer, zone).utcoffset() == datetime.timedelta(hours=-7)
+	test/module.to_datetime(winter, zone).utcoffset() == datetime.timedelta(hours=-8)
+	test/[x.hour for x in module.to_datetimes([summer, winter], zone)] == [5, 4]
+	test/module.from_datetime(module.to_datetime(summer, zone)) == summer
+
+if __name__ == '__main__':
+	import sys; from ...test import library as libtest
+	libtest.execute(sys.modules[__name__])
@@ -0,0 +1,88 @@
+from .. import types
+from .. import latency as module
+
+def test_Histogram_buckets(test):
+	h = module.Histogram(precision=4)
+
+	# Exact below 2**precision.
+	for x in range(16):
+		test/h.index(x) == x
+		test/h.lower(x) == x
+
+	# Bucket bounds must enclose the value and be within the precision.
+	for x in (16, 17, 31, 32, 33, 1000, 123456789, 2**40 + 12345):
+		i = h.index(x)
+		test/h.lower(i) <= x
+		test/h.upper(i) >= x
+		test/(h.upper(i) - h.lower(i)) < ((x >> 3) or 1)
+
+	# Monotonic ordering of bucket indexes.
+	test/h.index(31) < h.index(32)
+	test/h.index(32) <= h.index(33)
+
+def test_Histogram_record(test):
+	h = module.Histogram()
+	for x in range(1, 1001):
+		h.record(x * 1000)
+
+	test/h.count == 1000
+	test/h.minimum == 1000
+	test/h.maximum == 1000000
+	test.isinstance(h.percentile(50), types.Measure)
+
+	p50 = int(h.percentile(50))
+	test/p50 >= 500000
+	test/p50 < 500000 * 1.02
+	test/int(h.percentile(100)) == 1000000
+	test/h.mean() == types.Measure(500500)
+
+	test/h.percentiles([99, 50]) == [h.percentile(99), h.percentile(50)]
+
+	with test/ValueError as exc:
+		h.record(-1)
+
+	# The largest value below the limit fits in the last bucket.
+	small = module.Histogram(precision=4, limit=8)
+	small.record(255)
+	test/small.maximum == 255
+	with test/ValueError as exc:
+		small.record(256)
+	test/small.count == 1
+
+	module.Histogram(precision=8, limit=8).record(255)
+	with test/ValueError as exc:
+		module.Histogram(precision=9, limit=8)
+
+def test_Histogram_merge(test):
+	a = module.Histogram()
+	b = module.Histogram()
+	a.record(10)
+	b.record(20)
+	b.record(30)
+
+	s = a.snapshot()
+	a.merge(b)
+	test/a.count == 3
+	test/a.maximum == 30
+	test/s.count == 1
+	test/s.maximum == 10
+
+	with test/ValueError as exc:
+		a.merge(module.Histogram(precision=5))
+
+def test_Stopwatch(test):
+	h = module.Histogram()
+	with module.Stopwatch(h) as sw:
+		pass
+	test.isinstance(sw.measure, types.Measure)
+	test/h.count == 1
+
+	@module.Stopwatch(h)
+	def f(x):
+		return x + 1
+	test/f(1) == 2
+	test/h.count == 2
+
+if __name__ == '__main__':
+	import sys; from ...test import library as libtest
+	libtest.execute(sys.modules[__name__])
@@ -0,0 +1,59 @@
+from .. import types
+from .. import arrays
+from .. import months as module
+
+iso = (lambda x: types.Timestamp.of(iso=x))
+
+def test_add(test):
+	t = iso('2001-01-31T10:00:00.5')
+	test/module.add(t, 1) == iso('2001-02-28T10:00:00.5')
+	test/module.add(t, 1, 'overflow') == iso('2001-03-03T10:00:00.5')
+	test/module.add(t, 1, 'overflow') == t.elapse(month=1)
+	test/module.add(t, 13) == iso('2002-02-28T10:00:00.5')
+	test/module.add(t, 37) == iso('2004-02-29T10:00:00.5')
+	test/module.add(t, -11) == iso('2000-02-29T10:00:00.5')
+	test/module.subtract(t, 2) == iso('2000-11-30T10:00:00.5')
+	test/module.add(t, 0) == t
+
+	# Days that exist in the target month are unaffected by the policy.
+	for policy in module.policies:
+		test/module.add(iso('2001-01-15T00:00:00'), 1, policy) == iso('2001-02-15T00:00:00')
+
+	# Before the datum and the unix epoch.
+	test/module.add(iso('1960-03-31T23:59:59.999'), -1) == iso('1960-02-29T23:59:59.999')
+
+	# Dates.
+	d = types.Date.of(date=(2000, 3, 31))
+	test/module.add(d, -1) == types.Date.of(date=(2000, 2, 29))
+	test/module.add(d, 1) == types.Date.of(date=(2000, 4, 30))
+
+def test_add_errors(test):
+	t = iso('2001-01-31T00:00:00')
+	with test/ValueError as exc:
+		module.add(t, 1, 'error')
+	with test/ValueError as exc:
+		module.add(t, 1, 'unknown')
+	with test/ValueError as exc:
+		module.add(types.Week(1), 1)
+
+def test_add_array(test):
+	pits = [
+		iso('2001-01-31T10:00:00'),
+		iso('2001-01-31T11:00:00'),
+		iso('2000-02-29T00:00:00'),
+		iso('1999-12-01T00:00:00'),
+	]
+	a = arrays.TimestampArray(pits)
+	for count in (1, -1, 12):
+		for policy in ('clamp', 'overflow'):
+			r = module.add_array(a, count, policy)
+			test/r / arrays.TimestampArray
+			test/list(r) == [module.add(x, count, policy) for x in pits]
+
+	test/list(module.subtract_array(a, 1)) == [module.subtract(x, 1) for x in pits]
+	with test/ValueError as exc:
+		module.add_array(a, 1, 'error')
+
+if __name__ == '__main__':
+	import sys; from ...test import library as libtest
+	libtest.execute(sys.modules[__name__])
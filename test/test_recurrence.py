@@ -0,0 +1,104 @@
+from .. import types
+from .. import recurrence as module
+
+def iso(s):
+	return types.Timestamp.of(iso=s)
+
+def take(n, g):
+	return [x for x, i in zip(g, range(n))]
+
+def test_Rule_weekday_nth(test):
+	origin = iso('2020-01-01T00:00:00')
+	r = module.Rule('monthly', origin, weekdays=[('tuesday', 2)], times=[(9, 0, 0)])
+	test/take(3, r.occurrences()) == [
+		iso('2020-01-14T09:00:00'),
+		iso('2020-02-11T09:00:00'),
+		iso('2020-03-10T09:00:00'),
+	]
+
+	# Skip ahead to a far point.
+	test/take(1, r.occurrences(iso('2031-06-01T00:00:00'))) == [iso('2031-06-10T09:00:00')]
+	test/r.following(iso('2020-01-14T09:00:00')) == iso('2020-02-11T09:00:00')
+
+def test_Rule_last_day(test):
+	r = module.Rule('monthly', iso('2020-01-31T12:00:00'), monthdays=[-1])
+	test/take(4, r.occurrences()) == [
+		iso('2020-01-31T12:00:00'),
+		iso('2020-02-29T12:00:00'),
+		iso('2020-03-31T12:00:00'),
+		iso('2020-04-30T12:00:00'),
+	]
+
+	# The origin's day of month is skipped in months that are too short.
+	r = module.Rule('monthly', iso('2020-01-31T00:00:00'))
+	test/take(3, r.occurrences()) == [
+		iso('2020-01-31T00:00:00'),
+		iso('2020-03-31T00:00:00'),
+		iso('2020-05-31T00:00:00'),
+	]
+
+def test_Rule_weekly(test):
+	origin = iso('2020-01-01T08:30:00') # wednesday
+	r = module.Rule('weekly', origin, interval=2, weekdays=['monday', 'wednesday'])
+	test/take(4, r.occurrences()) == [
+		iso('2020-01-01T08:30:00'),
+		iso('2020-01-13T08:30:00'),
+		iso('2020-01-15T08:30:00'),
+		iso('2020-01-27T08:30:00'),
+	]
+
+def test_Rule_yearly_daily(test):
+	r = module.Rule.from_period(types.Months.of(year=1), iso('2020-02-29T00:00:00'))
+	test/take(2, r.occurrences()) == [iso('2020-02-29T00:00:00'), iso('2024-02-29T00:00:00')]
+
+	r = module.Rule.from_period(types.Days.of(day=3), iso('2020-01-01T00:00:00'))
+	seg = types.Segment((iso('2020-01-02T00:00:00'), iso('2020-01-11T00:00:00')))
+	test/r.between(seg) == [
+		iso('2020-01-04T00:00:00'),
+		iso('2020-01-07T00:00:00'),
+		iso('2020-01-10T00:00:00'),
+	]
+
+	# No possible occurrences.
+	r = module.Rule('yearly', iso('2020-01-01T00:00:00'), months=[2], monthdays=[30])
+	test/list(r.occurrences()) == []
+
+def test_Rule_sparse(test):
+	# Matches are decades apart; a monday on the 29th of February.
+	r = module.Rule('daily', iso('2020-01-01T00:00:00'),
+		months=[2], monthdays=[29], weekdays=['monday'])
+	test/take(2, r.occurrences()) == [
+		iso('2044-02-29T00:00:00'),
+		iso('2072-02-29T00:00:00'),
+	]
+
+def la_zone(test):
+	from .. import views
+	try:
+		return views.Zone.open(types.from_unix_timestamp, 'America/Los_Angeles')
+	except Exception:
+		test.skip("zoneinfo database not available")
+
+def test_Rule_zone_gap(test):
+	z = la_zone(test)
+	# 2020-03-08 02:30 does not exist in Los Angeles; moved forward to 03:30 PDT.
+	r = module.Rule('daily', iso('2020-03-07T00:00:00'), times=[(2, 30, 0)], zone=z)
+	test/take(3, r.occurrences()) == [
+		iso('2020-03-07T10:30:00'), # PST
+		iso('2020-03-08T10:30:00'), # 03:30 PDT
+		iso('2020-03-09T09:30:00'), # PDT
+	]
+
+def test_Rule_zone_overlap(test):
+	z = la_zone(test)
+	# 2020-11-01 01:30 occurs twice in Los Angeles; the first, PDT, is used.
+	r = module.Rule('daily', iso('2020-10-31T00:00:00'), times=[(1, 30, 0)], zone=z)
+	test/take(3, r.occurrences()) == [
+		iso('2020-10-31T08:30:00'), # PDT
+		iso('2020-11-01T08:30:00'), # PDT
+		iso('2020-11-02T09:30:00'), # PST
+	]
+
+if __name__ == '__main__':
+	import sys; from ...test import library as libtest
+	libtest.execute(sys.modules[__name__])
@@ -0,0 +1,61 @@
+from .. import types
+from .. import constants
+from .. import segments as module
+
+def ts(day):
+	return types.Timestamp.of(date=(2020, 1, day))
+
+def seg(start, stop):
+	return types.Segment((ts(start), ts(stop)))
+
+def test_SegmentSet_coalesce(test):
+	s = module.SegmentSet([seg(5, 7), seg(1, 3), seg(2, 4), seg(7, 8)])
+	test/list(s) == [seg(1, 4), seg(5, 8)]
+	test/len(s) == 2
+
+	test/(ts(1) in s) == True
+	test/(ts(4) in s) == False
+	test/(ts(7) in s) == True
+	test/s.find(ts(6)) == seg(5, 8)
+	test/s.find(ts(9)) == None
+
+def test_SegmentSet_algebra(test):
+	a = module.SegmentSet([seg(1, 5), seg(10, 15)])
+	b = module.SegmentSet([seg(3, 12), seg(14, 20)])
+
+	test/list(a | b) == [seg(1, 20)]
+	test/list(a & b) == [seg(3, 5), seg(10, 12), seg(14, 15)]
+	test/list(a - b) == [seg(1, 3), seg(12, 14)]
+	test/list(b - a) == [seg(5, 10), seg(15, 20)]
+	test/(a - a) == module.SegmentSet()
+
+	test/a.overlaps(seg(5, 10)) == False
+	test/a.overlaps(seg(4, 10)) == True
+	test/a.overlaps(seg(6, 11)) == True
+
+def test_SegmentSet_unbounded(test):
+	a = module.SegmentSet([types.Segment((constants.always, ts(5)))])
+	test/(constants.always in a) == True
+	test/(ts(1) in a) == True
+
+	c = ~a
+	test/list(c) == [types.Segment((ts(5), constants.never))]
+	test/list(a | c) == [constants.continuum]
+
+def test_IntervalTree(test):
+	segs = [seg(1, 5), seg(3, 8), seg(6, 9), seg(10, 11), types.Segment((constants.always, ts(2)))]
+	t = module.IntervalTree(segs)
+	test/sorted(t.stab(ts(4))) == [0, 1]
+	test/sorted(t.stab(ts(1))) == [0, 4]
+	test/sorted(t.stab(ts(8))) == [2]
+	test/t.stab(ts(9)) == []
+	test/t.containing(ts(10)) == [seg(10, 11)]
+
+	# Compare with a scan.
+	for d in range(1, 12):
+		expected = [i for i, x in enumerate(segs) if ts(d) in x and ts(d) != x.stop]
+		test/sorted(t.stab(ts(d))) == expected
+
+if __name__ == '__main__':
+	import sys; from ...test import library as libtest
+	libtest.execute(sys.modules[__name__])
@@ -6,3 +6,110 @@ def test_now(test):
 
 def test_elapsed(test):
 	test.isinstance(module.elapsed(), types.Measure)
+
+def test_Correlation(test):
+	c = module.Correlation()
+	m = module.elapsed()
+	ts = c.timestamp(m)
+	test.isinstance(ts, types.Timestamp)
+
+	# Should be well within a second of the real clock.
+	test/abs(int(module.now()) - int(ts)) < 1000000000
+
+	c.sample()
+	test/c.drift == 0
+	stamps = c.timestamps([m, m + 1000, m + 2000])
+	test/len(stamps) == 3
+	test/(stamps[1] - stamps[0]) == 1000
+	test/stamps[2] >= stamps[1]
+
+def test_Correlation_resolve(test):
+	"""
+	# - &module.Correlation.resolve
+	"""
+	readings = iter([10, 1000, 12, 2000000010, 2000003000, 2000000012])
+	c = module.Correlation(real=readings.__next__, monotonic=readings.__next__)
+	test/c.reference == (11, 1000)
+	test/c.offset == 989
+	test/c.resolve(111) == 1100
+
+	# real advanced 2000 more nanoseconds than monotonic over two seconds.
+	c.sample()
+	test/c.reference == (2000000011, 2000003000)
+	test/c.drift == 1000
+	test/c.resolve(2000000011 + 1000000000) == 2000003000 + 1000000000 + 1000
+
+def test_Correlation_frequent(test):
+	"""
+	# - &module.Correlation.sample
+	"""
+	# Samples taken more often than the interval still measure drift.
+	step = 600000000
+	readings = []
+	for i in range(4):
+		m = i * step
+		readings.extend([m, m + (i * 1200), m])
+	readings = iter(readings)
+	c = module.Correlation(real=readings.__next__, monotonic=readings.__next__)
+
+	c.sample()
+	test/c.reference == (step, step + 1200)
+	test/c.drift == 0
+
+	# The third sample is an interval past the first.
+	c.sample()
+	test/c.drift == 2000
+
+	# Measured from the third sample; not yet an interval.
+	c.sample()
+	test/c.reference == (3 * step, (3 * step) + 3600)
+	test/c.drift == 2000
+
+def test_Published(test):
+	import os
+	from .. import views
+	std = views.Zone.Offset((-28800, 'PST', 'std'))
+	dst = views.Zone.Offset((-25200, 'PDT', 'dst'))
+	zone = views.Zone([types.Timestamp.of(iso='2000-01-01T00:00:00')], [dst], std, [], 'contrived')
+
+	readings = iter([1000000000, 2000000000])
+	name = 'fault-time-test-%d' %(os.getpid(),)
+	try:
+		p = module.Publisher(name, zone, real=readings.__next__, monotonic=(lambda: 5))
+	except (ImportError, OSError):
+		test.skip("shared memory not available")
+
+	try:
+		test/p.sequence == 2
+		r = module.Published(name)
+		try:
+			test/r.read() == (2, 1000000000, 5, -25200, 1, b'PDT\0\0\0\0')
+			test/r.now() == types.Timestamp(1000000000)
+			test/r.localize() == (types.Timestamp(1000000000).elapse(dst), dst)
+
+			p.update()
+			test/p.sequence == 4
+			test/r.now() == types.Timestamp(2000000000)
+			test/(r.localize()[1] is r.localize()[1]) == True
+
+			# A publisher that stopped in the middle of an update.
+			module._sequence_struct.pack_into(p.memory.buf, 0, 5)
+			with test/RuntimeError as exc:
+				r.read(retries=10)
+			module._sequence_struct.pack_into(p.memory.buf, 0, 4)
+			test/r.read()[0] == 4
+		finally:
+			r.close()
+	finally:
+		p.close()
+
+	# Without a zone, UTC is published.
+	p = module.Publisher(name)
+	try:
+		r = module.Published(name)
+		local, offset = r.localize()
+		test/offset == views.Zone.Offset((0, 'UTC', 'std'))
+		test/abs(int(local) - int(module.now())) < 60000000000
+		r.close()
+	finally:
+		p.close()
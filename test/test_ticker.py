@@ -0,0 +1,140 @@
+import asyncio
+from .. import types
+from .. import sysclock
+from .. import ticker as module
+
+def iso(s):
+	return types.Timestamp.of(iso=s)
+
+def test_boundary(test):
+	pit = iso('2020-01-31T10:10:10')
+	test/module.boundary(pit, types.Measure.of(minute=1)) == iso('2020-01-31T10:11:00')
+	test/module.boundary(pit, types.Measure.of(hour=6)) == iso('2020-01-31T12:00:00')
+	test/module.boundary(pit, types.Days.of(day=1)) == iso('2020-02-01T00:00:00')
+	test/module.boundary(pit, types.Weeks.of(week=1)) == iso('2020-02-02T00:00:00')
+	test/module.boundary(pit, types.Months.of(month=1)) == iso('2020-02-01T00:00:00')
+
+	# Exactly on a boundary selects the following one.
+	test/module.boundary(iso('2020-01-31T10:11:00'), types.Measure.of(minute=1)) == iso('2020-01-31T10:12:00')
+
+def test_Ticker(test):
+	results = []
+
+	async def main():
+		t = module.Ticker(types.Measure.of(millisecond=20))
+		t.subscribe(results.append)
+		a, b = await asyncio.gather(t.wait(), t.wait())
+		test/a == b
+		test/(int(sysclock.now()) >= int(a)) == True
+		await t.wait()
+		t.unsubscribe(results.append)
+
+	asyncio.run(main())
+	test/len(results) == 2
+	test/(results[1] - results[0]) == int(types.Measure.of(millisecond=20))
+
+def test_sleep_until(test):
+	target = sysclock.now().elapse(millisecond=10)
+	asyncio.run(module.sleep_until(target))
+	test/(int(sysclock.now()) >= int(target)) == True
+
+def test_boundary_zone(test):
+	from .. import views
+	try:
+		z = views.Zone.open(types.from_unix_timestamp, 'America/Los_Angeles')
+	except Exception:
+		test.skip("zoneinfo database not available")
+
+	hour = types.Measure.of(hour=1)
+	minute = types.Measure.of(minute=1)
+	day = types.Days.of(day=1)
+
+	# 2020-03-08 02:00 PST is skipped to 03:00 PDT (10:00Z).
+	test/module.boundary(iso('2020-03-08T09:30:00'), hour, z) == iso('2020-03-08T10:00:00')
+	test/module.boundary(iso('2020-03-08T09:59:30'), minute, z) == iso('2020-03-08T10:00:00')
+	test/module.boundary(iso('2020-03-08T10:00:00'), hour, z) == iso('2020-03-08T11:00:00')
+	test/module.boundary(iso('2020-03-08T00:00:00'), day, z) == iso('2020-03-08T08:00:00')
+	test/module.boundary(iso('2020-03-08T08:00:00'), day, z) == iso('2020-03-09T07:00:00')
+
+	# 2020-11-01 01:00-02:00 is repeated; the second pass still advances.
+	test/module.boundary(iso('2020-11-01T08:30:00'), hour, z) == iso('2020-11-01T10:00:00')
+	test/module.boundary(iso('2020-11-01T09:15:00'), minute, z) == iso('2020-11-01T09:16:00')
+	test/module.boundary(iso('2020-11-01T09:30:00'), hour, z) == iso('2020-11-01T10:00:00')
+
+	# Boundaries always follow the given point.
+	pit = iso('2020-03-08T08:00:00')
+	for x in range(0, 4 * 60, 7):
+		p = pit.elapse(minute=x)
+		for period in (minute, hour, types.Measure.of(minute=15)):
+			test/module.boundary(p, period, z) > p
+	pit = iso('2020-11-01T07:00:00')
+	for x in range(0, 4 * 60, 7):
+		p = pit.elapse(minute=x)
+		for period in (minute, hour, types.Measure.of(minute=15)):
+			test/module.boundary(p, period, z) > p
+
+def test_Ticker_wait_cancel(test):
+	async def main():
+		t = module.Ticker(types.Measure.of(millisecond=20))
+		a = t.wait()
+		b = t.wait()
+		a.cancel()
+		test/(await b) / types.Timestamp
+
+		# A timed out waiter does not cancel the others.
+		c = asyncio.ensure_future(t.wait())
+		with test/asyncio.TimeoutError as exc:
+			await asyncio.wait_for(t.wait(), 0.001)
+		test/(await c) / types.Timestamp
+
+	asyncio.run(main())
+
+def test_Ticker_callback_error(test):
+	results = []
+	errors = []
+
+	def fail(ts):
+		raise ValueError("subscriber failure")
+
+	async def main():
+		asyncio.get_running_loop().set_exception_handler(lambda l, c: errors.append(c))
+		t = module.Ticker(types.Measure.of(millisecond=10))
+		t.subscribe(fail)
+		t.subscribe(results.append)
+		await t.wait()
+		await t.wait()
+		t.unsubscribe(fail)
+		t.unsubscribe(results.append)
+		test/t._handle == None
+
+	asyncio.run(main())
+	test/len(results) == 2
+	test/len(errors) >= 2
+	test/errors[0]['exception'] / ValueError
+
+def test_shared(test):
+	period = types.Measure.of(millisecond=10)
+	ignore = (lambda ts: None)
+
+	async def main():
+		t = module.shared(period)
+		test/(module.shared(period) is t) == True
+		t.subscribe(ignore)
+		await t.wait()
+		test/len(module._shared) == 1
+
+		# Released when the last subscriber leaves.
+		t.unsubscribe(ignore)
+		test/len(module._shared) == 0
+		t.subscribe(ignore)
+		test/(module.shared(period) is t) == True
+
+	# Tickers left subscribed are discarded with their loop.
+	for i in range(3):
+		asyncio.run(main())
+		test/len(module._shared) <= 1
+	module._shared.clear()
+
+if __name__ == '__main__':
+	import sys; from ...test import library as libtest
+	libtest.execute(sys.modules[__name__])
@@ -0,0 +1,90 @@
+import os.path
+from .. import types
+from .. import arrays
+from .. import tzif
+from .. import timescale as module
+
+iso = (lambda x: types.Timestamp.of(iso=x))
+
+def test_tai_offset(test):
+	test/module.tai_offset(iso('1960-01-01T00:00:00')) == 10
+	test/module.tai_offset(iso('1972-06-30T23:59:59')) == 10
+	test/module.tai_offset(iso('1972-07-01T00:00:00')) == 11
+	test/module.tai_offset(iso('2016-12-31T23:59:59.999999999')) == 36
+	test/module.tai_offset(iso('2017-01-01T00:00:00')) == 37
+	test/module.tai_offset(iso('2030-01-01T00:00:00')) == 37
+
+def test_conversions(test):
+	utc = iso('2020-05-06T07:08:09.5')
+	test/module.utc_to_tai(utc) == iso('2020-05-06T07:08:46.5')
+	test/module.utc_to_gps(utc) == iso('2020-05-06T07:08:27.5')
+	test/module.tai_to_utc(module.utc_to_tai(utc)) == utc
+	test/module.gps_to_utc(module.utc_to_gps(utc)) == utc
+
+	# GPS and UTC coincided at the GPS epoch.
+	test/module.utc_to_gps(iso('1980-01-06T00:00:00')) == iso('1980-01-06T00:00:00')
+
+	# The inserted second maps onto the first second of the following day.
+	test/module.tai_to_utc(iso('2017-01-01T00:00:35')) == iso('2016-12-31T23:59:59')
+	test/module.tai_to_utc(iso('2017-01-01T00:00:36.5')) == iso('2017-01-01T00:00:00.5')
+	test/module.tai_to_utc(iso('2017-01-01T00:00:37')) == iso('2017-01-01T00:00:00')
+
+def test_arrays(test):
+	pits = [
+		iso('1970-01-01T00:00:00'),
+		iso('1999-12-31T23:59:59'),
+		iso('2016-12-31T23:59:59'),
+		iso('2017-01-01T00:00:00'),
+		iso('2017-01-01T00:00:36.5'),
+	]
+	a = arrays.TimestampArray(pits)
+	for scalar, vector in [
+			(module.utc_to_tai, module.utc_to_tai_array),
+			(module.tai_to_utc, module.tai_to_utc_array),
+			(module.utc_to_gps, module.utc_to_gps_array),
+			(module.gps_to_utc, module.gps_to_utc_array),
+		]:
+		r = vector(a)
+		test/r / arrays.TimestampArray
+		test/list(r) == [scalar(x) for x in pits]
+
+def test_from_tzif(test):
+	path = os.path.join(tzif.tzdir, 'right', 'UTC')
+	if not os.path.exists(path):
+		test.skip("right/ zones not available")
+
+	t = module.Table.from_tzif(path)
+	count = len(t.utc)
+	test/t.utc == module.standard.utc[:count]
+	test/t.offsets == module.standard.offsets[:count]
+	test/count > 20
+
+def tzif_data(leaps, version=b'2'):
+	import struct
+	# A slim file: an empty version 1 block followed by the 64-bit block.
+	ident = tzif.magic + version + (b'\0' * 15)
+	v1 = ident + struct.pack('!6l', 0, 0, 0, 0, 1, 4) + struct.pack('!lbb', 0, 0, 0) + b'UTC\0'
+	v2 = ident + struct.pack('!6l', 0, 0, len(leaps), 0, 1, 4)
+	v2 += struct.pack('!lbb', 0, 0, 0) + b'UTC\0'
+	v2 += b''.join(struct.pack('!ql', *x) for x in leaps)
+	return v1 + v2 + b'\n\n'
+
+def test_from_tzif_slim(test):
+	import tempfile
+	leaps = [(78796800, 1), (94694401, 2)]
+	with tempfile.TemporaryDirectory() as d:
+		path = os.path.join(d, 'leaps')
+		with open(path, 'wb') as f:
+			f.write(tzif_data(leaps))
+		t = module.Table.from_tzif(path)
+		test/t.utc == module.standard.utc[:3]
+		test/t.offsets == module.standard.offsets[:3]
+
+		with open(path, 'wb') as f:
+			f.write(tzif_data([]))
+		with test/ValueError as exc:
+			module.Table.from_tzif(path)
+
+if __name__ == '__main__':
+	import sys; from ...test import library as libtest
+	libtest.execute(sys.modules[__name__])
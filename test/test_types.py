@@ -305,6 +305,29 @@ def test_unix(test):
 	test/unix_epoch == module.from_unix_timestamp(0)
 	test/ts.select('unix') == 0
 
+def test_unix_exact(test):
+	ts = module.Timestamp.of(iso="2020-05-06T07:08:09.123456789")
+	ns = 1588748889123456789
+
+	test/ts.select('unix_ns') == ns
+	test/ts.select('unix_us') == ns // 1000
+	test/ts.select('unix_ms') == ns // 1000000
+	test/ts.select('unix_s') == ns // 1000000000
+	test/module.Timestamp.of(unix_ns=ns) == ts
+	test/module.Timestamp.of(unix_ms=ns // 1000000) == ts.truncate('millisecond')
+
+	test/ts.to_unix_ns() == ns
+	test/module.Timestamp.from_unix_ns(ns) == ts
+	test/module.Timestamp.from_unix_ns(0) == module.from_unix_timestamp(0)
+
+	# Precision beyond a double's mantissa is retained.
+	test/module.Timestamp.of(unix_s=2**60).select('unix_s') == 2**60
+
+	# Points of other units use the containers.
+	d = module.Date.of(date=(1970, 1, 2))
+	test/d.to_unix_ns() == 86400 * 1000000000
+	test/module.Date.from_unix_ns(86400 * 1000000000) == d
+
 def test_hashing(test):
 	us0 = module.Measure(0)
 	ts0 = module.Timestamp(0)
@@ -398,6 +421,35 @@ def test_Segment_points(test):
 	)
 	test/[y2k, y2k1] == seg2
 
+def test_Context_instrument(test):
+	"""
+	# - &module.core.Context.instrument
+	"""
+	ctx = module.core.Context()
+	ctx.declare('day', 0)
+	ctx.define('hour', 'day', 1, base = fractions.Fraction(1, 24))
+	ctx.container('hours', (lambda x, arg: x), (lambda typ, x: (('hour', x),)))
+
+	test/ctx.instrumentation() == []
+	original = ctx.containers['hours']
+
+	ctx.instrument()
+	try:
+		test/ctx.convert('day', 'hour', 2) == 48
+		test/ctx.convert('day', 'hour', 1) == 24
+		list(ctx.containers['hours'][1](None, 3))
+
+		rows = {(x[0], x[1], x[2]): x[3] for x in ctx.instrumentation()}
+		test/rows[('convert', 'day', 'hour')] == 2
+		test/rows[('unpack', 'hours', None)] == 1
+		test/(('pack', 'hours', None) in rows) == False
+	finally:
+		ctx.deinstrument()
+
+	test/ctx.instrumentation() == []
+	test/ctx.containers['hours'] == original
+	test/('convert' in vars(ctx)) == False
+
 if __name__ == '__main__':
 	import sys; from ...test import library as libtest
 	libtest.execute(sys.modules[__name__])
@@ -0,0 +1,31 @@
+from .. import types
+from .. import warmup as module
+
+def test_ratios(test):
+	test/module.ratios(units=('second', 'hour', 'month')) == 5
+	before = types.Context.compose.cache_info().hits
+	types.Context.compose('second', 'hour')
+	test/types.Context.compose.cache_info().hits == before + 1
+
+def test_dates(test):
+	cache = types.Context.constants['date_cache']
+	test/module.dates(8) == 8
+	today = types.Timestamp(0).select('day')
+	module.dates(3, now=(lambda: types.Timestamp(0)))
+	hits = cache.hits
+	cache.resolve(today - 1)
+	cache.resolve(today)
+	cache.resolve(today + 1)
+	test/cache.hits == hits + 3
+
+def test_warm(test):
+	report = module.warm(zones=())
+	test/[x[0] for x in report] == ['ratios', 'dates', 'formats', 'zones']
+	for name, count, size in report:
+		test/size / int
+
+	test/dict((x[0], x[1]) for x in report)['zones'] == 0
+
+if __name__ == '__main__':
+	import sys; from ...test import library as libtest
+	libtest.execute(sys.modules[__name__])
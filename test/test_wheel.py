@@ -0,0 +1,47 @@
+import random
+from .. import types
+from .. import wheel as module
+
+def test_Wheel_expiry(test):
+	w = module.Wheel(types.Measure.of(microsecond=1), bits=2, levels=3)
+	rng = random.Random(7)
+	deadlines = [rng.randrange(1, 5000) * 1000 for x in range(500)]
+	for i, d in enumerate(deadlines):
+		w.schedule(types.Measure(d), i)
+	test/len(w) == 500
+
+	# Advance in irregular steps; each batch must contain exactly the due timers.
+	now = 0
+	seen = set()
+	while now < 6000000:
+		now += rng.randrange(1, 400) * 1000
+		for i in w.advance(types.Measure(now)):
+			test/(deadlines[i] <= now) == True
+			seen.add(i)
+		test/all(deadlines[i] > now for i in range(500) if i not in seen) == True
+
+	test/len(seen) == 500
+	test/len(w) == 0
+
+def test_Wheel_cancel(test):
+	w = module.Wheel('millisecond')
+	a = w.schedule(types.Measure.of(millisecond=10), 'a')
+	b = w.schedule(types.Measure.of(second=100), 'b')
+	c = w.schedule(types.Measure.of(millisecond=5), 'c')
+	test/w.cancel(a) == True
+	test/w.cancel(a) == False
+	test/w.cancel(b) == True
+	test/len(w) == 1
+
+	test/w.horizon() == int(types.Measure.of(millisecond=5))
+	test/w.advance(types.Measure.of(second=200)) == ['c']
+	test/w.horizon() == None
+
+def test_Wheel_past(test):
+	w = module.Wheel('millisecond', origin=types.Measure.of(second=1))
+	w.schedule(types.Measure(0), 'past')
+	test/w.advance(types.Measure.of(second=1)) == ['past']
+
+if __name__ == '__main__':
+	import sys; from ...test import library as libtest
+	libtest.execute(sys.modules[__name__])
@@ -0,0 +1,50 @@
+import os.path
+from .. import types
+from .. import tzif
+from .. import zonedb as module
+
+def test_build(test):
+	a = tzif.magic + b'\x00' * 40
+	b = tzif.magic + b'\x01' * 12
+	data = module.build([('Zone/A', a), ('Zone/Link', a), ('B', b)])
+	db = module.Database(data)
+
+	test/len(db) == 3
+	test/list(db) == ['B', 'Zone/A', 'Zone/Link']
+	test/('Zone/A' in db) == True
+	test/('Zone/C' in db) == False
+	test/bytes(db.data('Zone/A')) == a
+	test/bytes(db.data('B')) == b
+
+	# Identical payloads are stored once.
+	test/db.index['Zone/A'] == db.index['Zone/Link']
+	test/len(data) < (len(a) * 2) + len(b) + 64
+
+	with test/ValueError as exc:
+		module.Database(b'XXXX' + data[4:])
+
+def test_open(test):
+	names = ['America/Los_Angeles', 'US/Pacific', 'America/New_York']
+	paths = [os.path.join(tzif.tzdir, x) for x in names]
+	if not all(map(os.path.exists, paths)):
+		test.skip("zoneinfo database not available")
+
+	zones = []
+	for name, path in zip(names, paths):
+		with open(path, 'rb') as f:
+			zones.append((name, f.read()))
+	db = module.Database(module.build(zones))
+
+	la = db.open(types.from_unix_timestamp, 'America/Los_Angeles')
+	pacific = db.open(types.from_unix_timestamp, 'US/Pacific')
+	test/la.name == 'America/Los_Angeles'
+	test/pacific.name == 'US/Pacific'
+	test/(la.transitions is pacific.transitions) == True
+
+	pit = types.Timestamp.of(iso='2019-07-01T12:00:00')
+	test/la.find(pit).magnitude == -25200
+	test/db.open(types.from_unix_timestamp, 'America/New_York').find(pit).magnitude == -14400
+
+if __name__ == '__main__':
+	import sys; from ...test import library as libtest
+	libtest.execute(sys.modules[__name__])
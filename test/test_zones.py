@@ -88,6 +88,177 @@ def test_zone_slice(test):
 	]
 	test/list(zone('MST').slice(start, stop)) == []
 
+def contrived(count):
+	offsets = [views.Zone.Offset((i * 60, 'Z%d' % i, 'std')) for i in range(count)]
+	transitions = [types.Timestamp(i * 1000) for i in range(count)]
+	return views.Zone(transitions, offsets, views.Zone.Offset((0, 'Z', 'std')), [], 'contrived')
+
+def test_zone_cursor(test):
+	import random
+	z = contrived(50)
+	pits = [types.Timestamp(x) for x in range(-2000, 52000, 250)]
+
+	# Sorted, reversed, and random orders must all agree with find.
+	for seq in (pits, pits[::-1], random.sample(pits, len(pits))):
+		c = z.cursor()
+		test/[c.find(x) for x in seq] == [z.find(x) for x in seq]
+
+	c = z.cursor()
+	test/c.localize(pits[10]) == z.localize(pits[10])
+
+	# Stateless variant returns the hint for the next lookup.
+	index, offset = z.find_from(-1, types.Timestamp(5500))
+	test/index == 5
+	test/offset == z.find(types.Timestamp(5500))
+	test/z.find_from(index, types.Timestamp(5999)) == (5, offset)
+	test/z.find_from(index, types.Timestamp(49000))[0] == 49
+	test/z.find_from(49, types.Timestamp(-1)) == (-1, z.find(types.Timestamp(-1)))
+
+	# No transitions.
+	empty = views.Zone([], [], views.Zone.Offset((0, 'UTC', 'std')), [], 'empty')
+	test/empty.cursor().find(types.Timestamp(0)) == empty.default
+
+def test_zone_to_utc(test):
+	std = views.Zone.Offset((-28800, 'PST', 'std'))
+	dst = views.Zone.Offset((-25200, 'PDT', 'dst'))
+	spring = types.Timestamp.of(iso='2019-03-10T10:00:00')
+	autumn = types.Timestamp.of(iso='2019-11-03T09:00:00')
+	z = views.Zone([spring, autumn], [dst, std], std, [], 'contrived')
+	local = (lambda x: types.Timestamp.of(iso=x))
+
+	# Unambiguous times.
+	for iso in ('2019-01-01T12:00:00', '2019-06-01T12:00:00', '2019-12-01T12:00:00'):
+		utc = z.to_utc(local(iso))
+		test/z.localize(utc)[0] == local(iso)
+		test/z.to_utc(local(iso), fold=1) == utc
+
+	# Gap: 02:30 does not exist; fold selects the offset before or after.
+	test/z.to_utc(local('2019-03-10T02:30:00')) == local('2019-03-10T10:30:00')
+	test/z.to_utc(local('2019-03-10T02:30:00'), fold=1) == local('2019-03-10T09:30:00')
+	test/z.to_utc(local('2019-03-10T03:00:00')) == spring
+
+	# Overlap: 01:30 occurs twice.
+	test/z.to_utc(local('2019-11-03T01:30:00')) == local('2019-11-03T08:30:00')
+	test/z.to_utc(local('2019-11-03T01:30:00'), fold=1) == local('2019-11-03T09:30:00')
+	test/z.to_utc(local('2019-11-03T00:59:59')) == local('2019-11-03T07:59:59')
+	test/z.to_utc(local('2019-11-03T02:00:00')) == local('2019-11-03T10:00:00')
+
+	pits = [local('2019-03-10T02:30:00'), local('2019-11-03T01:30:00'), local('2019-07-01T00:00:00')]
+	for fold in (0, 1):
+		test/z.to_utc_many(pits, fold) == [z.to_utc(x, fold) for x in pits]
+
+	empty = views.Zone([], [], views.Zone.Offset((3600, 'CET', 'std')), [], 'empty')
+	test/empty.to_utc(local('2019-01-01T01:00:00')) == local('2019-01-01T00:00:00')
+	test/empty.to_utc_many([local('2019-01-01T01:00:00')]) == [local('2019-01-01T00:00:00')]
+
+def test_zone_units(test):
+	std = views.Zone.Offset((-28800, 'PST', 'std'))
+	dst = views.Zone.Offset((-25200, 'PDT', 'dst'))
+	iso = types.Timestamp.of
+	transitions = [
+		iso(iso='2019-03-10T10:00:00'),
+		iso(iso='2019-11-03T09:00:00'),
+		iso(iso='2020-03-01T00:00:00'),
+		iso(iso='2020-03-08T10:00:00'),
+	]
+	z = views.Zone(transitions, [dst, std, std, dst], std, [], 'contrived')
+
+	# Points select the offset in effect at their start.
+	for Class in (types.Date, types.Week, types.GregorianMonth):
+		for x in (iso(iso='2019-01-15T00:00:00'), iso(iso='2019-03-10T00:00:00'),
+				iso(iso='2019-03-11T00:00:00'), iso(iso='2019-11-03T00:00:00'),
+				iso(iso='2019-11-04T00:00:00'), iso(iso='2020-03-01T00:00:00'), iso(iso='2020-06-01T00:00:00')):
+			p = Class.of(date=x.select('date'))
+			start = iso(date=p.select('date'))
+			test/z.find(p) == z.find(start)
+			test/z.cursor().find(p) == z.find(start)
+			test/z.localize(p) == (p.elapse(z.find(start)), z.find(start))
+
+	test/z.transitions_for(types.Date) == (
+		types.Date.of(date=(2019, 3, 11)),
+		types.Date.of(date=(2019, 11, 4)),
+		types.Date.of(date=(2020, 3, 1)),
+		types.Date.of(date=(2020, 3, 9)),
+	)
+	test/(z.transitions_for(types.Date) is z.transitions_for(types.Date)) == True
+	test/(z.transitions_for(types.Timestamp) is z.transitions) == True
+
+	days = list(z.slice(types.Date.of(date=(2019, 6, 1)), types.Date.of(date=(2020, 1, 1))))
+	test/days == [(types.Date.of(date=(2019, 3, 11)), dst), (types.Date.of(date=(2019, 11, 4)), std)]
+
+	# A cursor switching between point types.
+	c = z.cursor()
+	d = types.Date.of(date=(2019, 11, 3))
+	test/c.find(iso(iso='2019-11-03T12:00:00')) == std
+	test/c.find(d) == dst
+	test/c.find(iso(iso='2019-11-03T12:00:00')) == std
+
+	# Plain integers are timestamps.
+	n = int(iso(iso='2019-06-01T00:00:00'))
+	test/z.find(n) == dst
+	test/z.find_from(-1, n) == (0, dst)
+	test/c.find(n) == dst
+	test/c.find(d) == dst
+	test/list(z.slice(n, n + 1)) == [(transitions[0], dst)]
+
+def test_zoneset(test):
+	zones = [contrived(5), contrived(3), views.Zone([], [], views.Zone.Offset((0, 'UTC', 'std')), [], 'utc')]
+	shifted = views.Zone(
+		[types.Timestamp(x * 1000 + 500) for x in range(4)],
+		[views.Zone.Offset((-x * 60, 'S%d' % x, 'std')) for x in range(4)],
+		views.Zone.Offset((0, 'S', 'std')), [], 'shifted'
+	)
+	zones.append(shifted)
+	zs = views.ZoneSet(zones)
+	test/len(zs) == 4
+	test/zs.transitions == sorted(set(zones[0].transitions + shifted.transitions))
+
+	pits = [types.Timestamp(x) for x in range(-1000, 6000, 125)]
+	for pit in pits:
+		test/zs.find(pit) == tuple(z.find(pit) for z in zones)
+		test/zs.localize(pit) == [z.localize(pit) for z in zones]
+
+	test/zs.localize_many(pits[:3]) == [zs.localize(x) for x in pits[:3]]
+
+	try:
+		la = zone('America/Los_Angeles')
+		ny = zone('America/New_York')
+	except Exception:
+		return
+	zs = views.ZoneSet([la, ny])
+	at = types.Timestamp.of(iso='2019-11-03T09:00:00')
+	for pit in (at, at.rollback(second=1), at.elapse(hour=-4), types.Timestamp.of(iso='1850-01-01T00:00:00')):
+		test/zs.find(pit) == (la.find(pit), ny.find(pit))
+
+def test_zone_shared_data(test):
+	import os.path
+	import shutil
+	import tempfile
+	from .. import tzif
+	source = os.path.join(tzif.tzdir, 'America/Los_Angeles')
+	if not os.path.exists(source):
+		test.skip("zoneinfo database not available")
+
+	with tempfile.TemporaryDirectory() as d:
+		first = os.path.join(d, 'first')
+		second = os.path.join(d, 'second')
+		shutil.copyfile(source, first)
+		shutil.copyfile(source, second)
+
+		a = views.Zone.from_file(types.from_unix_timestamp, first)
+		b = views.Zone.from_file(types.from_unix_timestamp, second)
+
+	test/a.name == first
+	test/b.name == second
+	test/(a.transitions is b.transitions) == True
+	test/(a.offsets is b.offsets) == True
+	test/(a.transitions_for(types.Date) is b.transitions_for(types.Date)) == True
+	test/a.transitions / tuple
+
+	# Different data is not shared.
+	ny = zone('America/New_York')
+	test/(ny.transitions is a.transitions) == False
+
 if __name__ == '__main__':
 	import sys; from ...test import library as libtest
 	libtest.execute(sys.modules[__name__])
@@ -0,0 +1,229 @@
+"""
+# asyncio helpers for waiting on points in time and periodic boundaries.
+
+# &sleep_until waits for a &types.Timestamp according to the real clock.
+# &Ticker fires at the boundaries of a period, like the top of every minute or
+# local midnight, sharing one loop timer across all of its subscribers.
+
+#!/syntax/python
+	from fault.time import ticker, types
+
+	await ticker.sleep_until(types.Timestamp.of(iso='2030-01-01T00:00:00'))
+
+	minutes = ticker.shared(types.Measure.of(minute=1))
+	async for ts in minutes:
+		...
+
+# Delays are scheduled on the event loop's monotonic clock and corrected against
+# the real clock when the timer fires, so drift between the clocks does not cause
+# early wakeups.
+"""
+import asyncio
+
+from . import types
+from . import sysclock
+
+_second = types.Context.convert('second', 'nanosecond', 1)
+
+def _offset(zone, pit):
+	if zone is None:
+		return 0
+	return zone.find(pit)[0] * _second
+
+def boundary(pit, period, zone=None, Timestamp=types.Timestamp) -> types.Timestamp:
+	"""
+	# Get the first boundary of &period after &pit.
+
+	# Boundaries of definite periods are multiples of the period since the datum,
+	# which is midnight of a Sunday. &types.Months periods are aligned to the start of
+	# the month. When a &zone is given, boundaries are aligned to its local time.
+	"""
+	offset = _offset(zone, pit)
+	local = int(pit) + offset
+
+	if isinstance(period, types.Months):
+		advance = (lambda x: int(Timestamp(x).elapse(period)))
+		nxt = int(Timestamp(local).truncate('month'))
+	else:
+		p = int(types.Context.convert(period.unit, 'nanosecond', int(period)))
+		if p <= 0:
+			raise ValueError("period must be positive")
+		advance = (lambda x: x + p)
+		nxt = (local // p) * p
+
+	nxt = advance(nxt)
+	while nxt <= local:
+		nxt = advance(nxt)
+
+	if zone is None:
+		return Timestamp(nxt)
+
+	# Local boundaries in a gap resolve forward and repeated boundaries to their
+	# first occurrence unless it precedes &pit.
+	while True:
+		for fold in (0, 1):
+			r = zone.to_utc(Timestamp(nxt), fold=fold)
+			if r > pit:
+				return r
+		nxt = advance(nxt)
+
+async def sleep_until(pit, now=sysclock.now, tolerance=0):
+	"""
+	# Sleep until the real clock reaches &pit.
+
+	# The remaining delay is recomputed after each wakeup, so adjustments of the real
+	# clock and drift against the loop's clock are corrected for.
+	"""
+	target = int(pit)
+	while True:
+		remaining = target - int(now())
+		if remaining <= tolerance:
+			return pit
+		await asyncio.sleep(remaining / 1000000000)
+
+class Ticker(object):
+	"""
+	# Periodic boundary notifications sharing a single loop timer.
+
+	# Subscribers are either callbacks given to &subscribe, called with the boundary
+	# &types.Timestamp, or coroutines awaiting &wait or iterating the ticker.
+
+	# [ Properties ]
+	# /period/
+		# The &core.Measure between boundaries.
+	# /zone/
+		# The &views.Zone that boundaries are aligned in, or &None for UTC.
+	"""
+
+	def __init__(self, period, zone=None, loop=None, now=sysclock.now):
+		self.period = period
+		self.zone = zone
+		self.now = now
+		self._loop = loop
+		self._callbacks = []
+		self._waiters = []
+		self._handle = None
+		self._next = None
+		self._key = None
+
+	def __repr__(self):
+		return '<%s: %r>' %(self.__class__.__name__, self.period)
+
+	@property
+	def loop(self):
+		if self._loop is None:
+			self._loop = asyncio.get_running_loop()
+		return self._loop
+
+	def next(self, pit=None) -> types.Timestamp:
+		"""
+		# The first boundary after &pit, or after the current time.
+		"""
+		return boundary(self.now() if pit is None else pit, self.period, self.zone)
+
+	def _arm(self):
+		if self._handle is not None:
+			return
+		if self._key is not None:
+			_shared.setdefault(self._key, self)
+		if self._next is None:
+			self._next = self.next()
+		delay = max(0, int(self._next) - int(self.now()))
+		self._handle = self.loop.call_later(delay / 1000000000, self._fire)
+
+	def _fire(self):
+		self._handle = None
+		current = self._next
+		if int(self.now()) < int(current):
+			# Woke early relative to the real clock; wait for the remainder.
+			self._arm()
+			return
+
+		self._next = None
+		waiters = self._waiters
+		self._waiters = []
+
+		# Arm the timer before dispatching so that a failing callback
+		# can not stop the ticks of the other subscribers.
+		callbacks = list(self._callbacks)
+		if callbacks:
+			self._arm()
+		else:
+			self._release()
+
+		for future in waiters:
+			if not future.done():
+				future.set_result(current)
+
+		for cb in callbacks:
+			try:
+				cb(current)
+			except Exception as exc:
+				self.loop.call_exception_handler({
+					'message': "ticker callback raised an exception",
+					'exception': exc,
+					'callback': cb,
+					'ticker': self,
+				})
+
+	def _release(self):
+		# Forget the shared instance once nothing is subscribed; &_arm restores it.
+		k = self._key
+		if k is not None and _shared.get(k) is self:
+			del _shared[k]
+
+	def subscribe(self, callback):
+		"""
+		# Call &callback with each boundary until it is unsubscribed.
+		"""
+		self._callbacks.append(callback)
+		self._arm()
+
+	def unsubscribe(self, callback):
+		"""
+		# Stop calling &callback. The loop timer is cancelled when nothing is waiting.
+		"""
+		self._callbacks.remove(callback)
+		if not self._callbacks and not self._waiters:
+			if self._handle is not None:
+				self._handle.cancel()
+				self._handle = None
+				self._next = None
+			self._release()
+
+	def wait(self):
+		"""
+		# Get an awaitable resolving to the next boundary. Each waiter is given
+		# its own future, so cancelling one does not affect the others.
+		"""
+		future = self.loop.create_future()
+		self._waiters.append(future)
+		self._arm()
+		return future
+
+	def __aiter__(self):
+		return self
+
+	async def __anext__(self):
+		return await self.wait()
+
+_shared = {}
+
+def shared(period, zone=None) -> Ticker:
+	"""
+	# Get the &Ticker for &period and &zone shared by all the callers within the
+	# current event loop.
+
+	# Tickers are only retained while they have subscribers, and those of closed
+	# loops are discarded.
+	"""
+	loop = asyncio.get_running_loop()
+	for x in [x for x in _shared if x[0].is_closed()]:
+		del _shared[x]
+
+	k = (loop, period.__class__, int(period), zone)
+	t = _shared.get(k)
+	if t is None:
+		t = _shared[k] = Ticker(period, zone=zone, loop=loop)
+		t._key = k
+	return t
@@ -0,0 +1,212 @@
+"""
+# Leap second tables and conversions between the UTC, TAI, and GPS timescales.
+
+# &types.Timestamp instances are normally UTC points whose days are all
+# 86400 seconds long; leap seconds are not represented. The conversions here
+# shift points onto the TAI and GPS timescales, which count every elapsed second,
+# by the cumulative leap second offset in effect at the point.
+
+#!/syntax/python
+	from fault.time import timescale
+	gps = timescale.utc_to_gps(ts)
+	utc = timescale.gps_to_utc(gps)
+
+# Conversion from TAI or GPS maps the inserted leap second onto the first second
+# of the following UTC day; the same representation used by POSIX clocks.
+"""
+import bisect
+
+from . import types
+from . import tzif
+
+#: The UTC dates on which the difference between TAI and UTC changed, and the
+#: difference in seconds that took effect at the start of that date.
+#: Sourced from IERS Bulletin C; no leap second has been scheduled after 2017.
+leap_seconds = (
+	((1972, 1, 1), 10),
+	((1972, 7, 1), 11),
+	((1973, 1, 1), 12),
+	((1974, 1, 1), 13),
+	((1975, 1, 1), 14),
+	((1976, 1, 1), 15),
+	((1977, 1, 1), 16),
+	((1978, 1, 1), 17),
+	((1979, 1, 1), 18),
+	((1980, 1, 1), 19),
+	((1981, 7, 1), 20),
+	((1982, 7, 1), 21),
+	((1983, 7, 1), 22),
+	((1985, 7, 1), 23),
+	((1988, 1, 1), 24),
+	((1990, 1, 1), 25),
+	((1991, 1, 1), 26),
+	((1992, 7, 1), 27),
+	((1993, 7, 1), 28),
+	((1994, 7, 1), 29),
+	((1996, 1, 1), 30),
+	((1997, 7, 1), 31),
+	((1999, 1, 1), 32),
+	((2006, 1, 1), 33),
+	((2009, 1, 1), 34),
+	((2012, 7, 1), 35),
+	((2015, 7, 1), 36),
+	((2017, 1, 1), 37),
+)
+
+#: Seconds that TAI is ahead of GPS time.
+gps_offset = 19
+
+_second = types.Context.convert('second', 'nanosecond', 1)
+_gps = gps_offset * _second
+
+class Table(object):
+	"""
+	# A sorted leap second table.
+
+	# Points before the first entry use the first entry's offset.
+
+	# [ Properties ]
+	# /utc/
+		# The tuple of UTC &types.Timestamp instances at which the offsets take effect.
+	# /offsets/
+		# The tuple of TAI-UTC differences in seconds corresponding to &utc.
+	"""
+
+	def __init__(self, changes):
+		changes = sorted(changes)
+		self.utc = tuple(x[0] for x in changes)
+		self.offsets = tuple(x[1] for x in changes)
+
+		# Integer tables for searching; the TAI boundaries are placed
+		# after the inserted seconds.
+		self._utc = [int(x) for x in self.utc]
+		self._deltas = [x * _second for x in self.offsets]
+		self._tai = [x + d for x, d in zip(self._utc, self._deltas)]
+
+	def __repr__(self):
+		return '<%s: %d entries>' %(self.__class__.__name__, len(self.utc))
+
+	@classmethod
+	def from_dates(Class, dates=leap_seconds, Timestamp=types.Timestamp):
+		"""
+		# Create a table from a sequence of `((year, month, day), offset)` pairs.
+		"""
+		return Class([(Timestamp.of(date=d), o) for d, o in dates])
+
+	@classmethod
+	def from_tzif(Class, path=tzif.tzdir + '/right/UTC', Timestamp=types.Timestamp):
+		"""
+		# Create a table from the leap second records of a TZif file
+		# compiled with leap seconds; usually one of the `right/` zones.
+
+		# The 64-bit block of version 2 and later files is used when present.
+		# Raises &ValueError when the file has no leap second records.
+		"""
+		with open(path, 'rb') as f:
+			data = f.read()
+		if data[:4] != tzif.magic:
+			raise ValueError("not a TZif file: " + repr(path))
+
+		if data[4:5] >= b'2':
+			d = tzif.parse_version_2(data[20:])
+		else:
+			d = tzif.parse_version_1(data[20:])
+		if not d[2]:
+			raise ValueError("no leap second records in TZif file: " + repr(path))
+
+		# Leap records are in the file's timescale which counts
+		# the prior corrections; the first leap occurred when TAI-UTC was 10.
+		epoch = leap_seconds[0]
+		changes = [(Timestamp.of(date=epoch[0]), epoch[1])]
+		prior = 0
+		for occurrence, correction in d[2]:
+			if correction == prior:
+				# Expiration marker.
+				continue
+			changes.append((types.from_unix_timestamp(occurrence - prior), epoch[1] + correction))
+			prior = correction
+
+		return Class(changes)
+
+	def tai_offset(self, pit, search=bisect.bisect):
+		"""
+		# Get the TAI-UTC difference in seconds at the UTC point in time, &pit.
+		"""
+		idx = search(self._utc, int(pit)) - 1
+		return self.offsets[max(idx, 0)]
+
+	def _shift(self, i, table, sign, before, after, search=bisect.bisect):
+		i += before
+		return i + (sign * self._deltas[max(search(table, i) - 1, 0)]) + after
+
+	def utc_to_tai(self, pit):
+		"""
+		# Convert the UTC point in time, &pit, to TAI.
+		"""
+		return pit.__class__(self._shift(int(pit), self._utc, 1, 0, 0))
+
+	def tai_to_utc(self, pit):
+		"""
+		# Convert the TAI point in time, &pit, to UTC.
+		"""
+		return pit.__class__(self._shift(int(pit), self._tai, -1, 0, 0))
+
+	def utc_to_gps(self, pit):
+		"""
+		# Convert the UTC point in time, &pit, to GPS time.
+		"""
+		return pit.__class__(self._shift(int(pit), self._utc, 1, 0, -_gps))
+
+	def gps_to_utc(self, pit):
+		"""
+		# Convert the GPS point in time, &pit, to UTC.
+		"""
+		return pit.__class__(self._shift(int(pit), self._tai, -1, _gps, 0))
+
+	def _convert(self, array, table, sign, before, after, search=bisect.bisect):
+		deltas = self._deltas
+		return array.fromintegers(
+			x + (sign * deltas[max(search(table, x) - 1, 0)]) + after
+			for x in (y + before for y in array.view)
+		)
+
+	def utc_to_tai_array(self, array):
+		"""
+		# Convert the UTC points in the &.arrays.TimestampArray, &array, to TAI.
+		# Returns a new array.
+		"""
+		return self._convert(array, self._utc, 1, 0, 0)
+
+	def tai_to_utc_array(self, array):
+		"""
+		# Convert the TAI points in the &.arrays.TimestampArray, &array, to UTC.
+		# Returns a new array.
+		"""
+		return self._convert(array, self._tai, -1, 0, 0)
+
+	def utc_to_gps_array(self, array):
+		"""
+		# Convert the UTC points in the &.arrays.TimestampArray, &array, to GPS time.
+		# Returns a new array.
+		"""
+		return self._convert(array, self._utc, 1, 0, -_gps)
+
+	def gps_to_utc_array(self, array):
+		"""
+		# Convert the GPS points in the &.arrays.TimestampArray, &array, to UTC.
+		# Returns a new array.
+		"""
+		return self._convert(array, self._tai, -1, _gps, 0)
+
+#: The table built from &leap_seconds.
+standard = Table.from_dates()
+
+tai_offset = standard.tai_offset
+utc_to_tai = standard.utc_to_tai
+tai_to_utc = standard.tai_to_utc
+utc_to_gps = standard.utc_to_gps
+gps_to_utc = standard.gps_to_utc
+utc_to_tai_array = standard.utc_to_tai_array
+tai_to_utc_array = standard.tai_to_utc_array
+utc_to_gps_array = standard.utc_to_gps_array
+gps_to_utc_array = standard.gps_to_utc_array
@@ -79,6 +79,8 @@ def from_unix_timestamp(unix_timestamp, Timestamp=Timestamp.of):
 		x = types.from_unix_timestamp(nsecs)
 		x = x.elapse(microsecond=us)
 	"""
+	if unix_timestamp.__class__ is int:
+		return Timestamp(unix_s=unix_timestamp)
 	return Timestamp(unix=unix_timestamp)
 
 # Select an appropriate &core.Measure class for the given unit name.
@@ -25,7 +25,8 @@ header_fields = (
 )
 tzinfo_header = collections.namedtuple('tzinfo_header', header_fields)
 header_struct_v1 = struct.Struct("!" + (len(header_fields) * "l"))
-header_struct_v2 = struct.Struct("!" + (len(header_fields) * "q"))
+# The counts of the version 2 header remain four bytes.
+header_struct_v2 = header_struct_v1
 
 ttinfo_fields = (
 	'tt_gmtoff',
@@ -34,13 +35,13 @@ ttinfo_fields = (
 )
 tzinfo_ttinfo = collections.namedtuple('tzinfo_ttinfo', ttinfo_fields)
 ttinfo_struct_v1 = struct.Struct("!lbb")
-ttinfo_struct_v2 = struct.Struct("!qbb")
+ttinfo_struct_v2 = ttinfo_struct_v1
 
 transtime_struct_v1 = struct.Struct("!l")
 leappairs_struct_v1 = struct.Struct("!ll")
 
 transtime_struct_v2 = struct.Struct("!q")
-leappairs_struct_v2 = struct.Struct("!qq")
+leappairs_struct_v2 = struct.Struct("!ql")
 
 tzinfo = collections.namedtuple('tzinfo', (
 	'header',
@@ -79,6 +80,9 @@ def parse_version_1(data):
 	]
 	y = y[end:]
 
+	abbr = bytes(y[:header.tzh_charcnt])
+	y = y[header.tzh_charcnt:]
+
 	end = leappairs_struct_v1.size * header.tzh_leapcnt
 	leaps = tuple([
 		leappairs_struct_v1.unpack(y[x:x+leappairs_struct_v1.size])
@@ -86,9 +90,6 @@ def parse_version_1(data):
 	])
 	y = y[end:]
 
-	abbr = bytes(y[:header.tzh_charcnt])
-	y = y[header.tzh_charcnt:]
-
 	isstd = tuple(bytes(y[:header.tzh_ttisstdcnt]))
 	y = y[header.tzh_ttisstdcnt:]
 
@@ -108,16 +109,35 @@ def parse_version_1(data):
 
 def parse_version_2(data):
 	"""
-	# parse the raw data from a version 2 TZif file. 8-byte longs.
+	# parse the raw data from a version 2 or later TZif file. 8-byte longs.
+
+	# The version 1 block is skipped and the 64-bit block that follows it is read;
+	# slim files leave the version 1 block empty.
+	# &data is the content following the first header's ident.
 
 	# Returns tuple of: (transtimes, types, timetypinfo, leaps, isstd, isgmt, abbr)
 	# See &tzfile(5) for information about the fields.
 	"""
+	header = tzinfo_header(*header_struct_v1.unpack(data[:header_struct_v1.size]))
+	skip = header_struct_v1.size + sum((
+		header.tzh_timecnt * (transtime_struct_v1.size + 1),
+		header.tzh_typecnt * ttinfo_struct_v1.size,
+		header.tzh_charcnt,
+		header.tzh_leapcnt * leappairs_struct_v1.size,
+		header.tzh_ttisstdcnt,
+		header.tzh_ttisgmtcnt,
+	))
+
+	ident = data[skip:skip+20]
+	if ident[:4] != magic:
+		raise ValueError("version 2 data block not found")
+	data = data[skip+20:]
+
 	x = data[:header_struct_v2.size]
 	y = data[header_struct_v2.size:]
 	header = tzinfo_header(*header_struct_v2.unpack(x))
 
-	end = header.tzh_timecnt * 4
+	end = header.tzh_timecnt * transtime_struct_v2.size
 	size = transtime_struct_v2.size
 	transtimes = tuple([
 		transtime_struct_v2.unpack(y[x:x+size])[0]
@@ -136,16 +156,16 @@ def parse_version_2(data):
 	]
 	y = y[end:]
 
+	abbr = bytes(y[:header.tzh_charcnt])
+	y = y[header.tzh_charcnt:]
+
 	end = leappairs_struct_v2.size * header.tzh_leapcnt
 	leaps = tuple([
-		leappairs_struct_v2.unpack(y[x:x+leappairs.size])
+		leappairs_struct_v2.unpack(y[x:x+leappairs_struct_v2.size])
 		for x in range(0, end, leappairs_struct_v2.size)
 	])
 	y = y[end:]
 
-	abbr = bytes(y[:header.tzh_charcnt])
-	y = y[header.tzh_charcnt:]
-
 	isstd = tuple(bytes(y[:header.tzh_ttisstdcnt]))
 	y = y[header.tzh_ttisstdcnt:]
 
@@ -194,8 +214,9 @@ def structure(tzif):
 			tz_abbrev = x[0],
 			tz_offset = x[1],
 			tz_isdst = bool(x[2]),
-			tz_isstd = bool(isstd[i]),
-			tz_isgmt = bool(isgmt[i])
+			# Indicator counts may be zero; see tzfile(5).
+			tz_isstd = bool(isstd[i]) if i < len(isstd) else False,
+			tz_isgmt = bool(isgmt[i]) if i < len(isgmt) else False,
 		)
 		ltt.append(ttyp)
 
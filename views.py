@@ -10,6 +10,7 @@
 import os
 import os.path
 import functools
+import hashlib
 from . import tzif
 from . import abstract
 
@@ -21,6 +22,8 @@ class Zone(object):
 	# [ Properties ]
 	# /default/
 		# The default &Offset of the &Zone.
+	# /unit/
+		# The unit of the &transitions; &None when there are no transitions.
 	"""
 
 	class Offset(tuple):
@@ -108,11 +111,22 @@ class Zone(object):
 
 	def __init__(self, transitions, offsets, default, leaps, name):
 		self.transitions = transitions
+		self.unit = transitions[0].unit if transitions else None
+		self._tables = {}
 		self.offsets = offsets
 		self.default = default
 		self.leaps = leaps
 		self.name = name
 
+	def rename(self, name):
+		"""
+		# Create a &Zone with the given &name sharing the transitions, offsets,
+		# and derived tables of this zone.
+		"""
+		z = self.__class__(self.transitions, self.offsets, self.default, self.leaps, name)
+		z._tables = self._tables
+		return z
+
 	def __repr__(self):
 		return '<%s: %s[%d/%d]>' %(
 			self.__class__.__name__,
@@ -132,14 +146,178 @@ class Zone(object):
 		# [ Parameters ]
 		# /pit/
 			# The &.library.Timestamp to use to find an offset with.
+			# Points of other units are searched using &transitions_for, and
+			# values without a unit are treated as timestamps.
 		"""
-		idx = search(self.transitions, pit) - 1
+		t = self._table(pit)
+		idx = search(t, pit) - 1
 		try:
 			z = self.offsets[idx]
 		except IndexError:
 			z = self.default
 		return z
 
+	def find_from(self, index, pit, search=bisect.bisect):
+		"""
+		# Get the offset for &pit starting the search from the transition &index
+		# identified by a prior lookup.
+
+		# Returns a pair, `(index, offset)`, where `index` is the hint to use for
+		# the subsequent lookup. No state is kept by the zone, so the method
+		# is safe to use with &Zone instances shared across threads.
+
+		# [ Parameters ]
+		# /index/
+			# The transition index of a prior lookup; `-1` when there is none.
+		# /pit/
+			# The &.library.Timestamp to use to find an offset with.
+		"""
+		t = self._table(pit)
+		n = len(t)
+
+		if index + 1 < n and not pit < t[index + 1]:
+			# Gallop forwards from the known lower bound.
+			lo = index + 1
+			step = 1
+			probe = lo + step
+			while probe < n and not pit < t[probe]:
+				lo = probe
+				step <<= 1
+				probe = lo + step
+			index = search(t, pit, lo, min(probe, n)) - 1
+		elif index >= 0 and pit < t[index]:
+			# Gallop backwards from the known upper bound.
+			hi = index
+			step = 1
+			probe = hi - step
+			while probe >= 0 and pit < t[probe]:
+				hi = probe
+				step <<= 1
+				probe = hi - step
+			index = search(t, pit, max(probe, 0), hi) - 1
+
+		try:
+			z = self.offsets[index]
+		except IndexError:
+			z = self.default
+		return (index, z)
+
+	def _table(self, pit):
+		# The transitions to search with &pit; plain integers use the zone's own.
+		unit = getattr(pit, 'unit', None)
+		if unit is None or unit == self.unit:
+			return self.transitions
+		return self.transitions_for(pit.__class__)
+
+	def transitions_for(self, Class):
+		"""
+		# Get the transition points expressed as instances of the Point class, &Class.
+
+		# Each transition is represented by the first &Class point starting at or
+		# after it, so searching the table with a point selects the offset in effect
+		# at the start of that point. The tables are built on first use and retained
+		# by the zone.
+		"""
+		t = self.transitions
+		if not t or Class.unit == self.unit:
+			return t
+
+		try:
+			return self._tables[Class]
+		except KeyError:
+			pass
+
+		table = []
+		for x in t:
+			date = x.select('date')
+			exact = x.truncate('day') == x
+			p = Class.of(date=date)
+			start = p.select('date')
+			while start < date or (start == date and not exact):
+				p = Class(p + 1)
+				start = p.select('date')
+			table.append(p)
+
+		table = self._tables[Class] = tuple(table)
+		return table
+
+	def local_transitions(self, fold = 0):
+		"""
+		# Get the transition points expressed in local time for resolving
+		# wall clock times with &to_utc.
+
+		# When the offset increases, the local times skipped by the transition
+		# form a gap; when it decreases, the repeated local times form an overlap.
+		# With a &fold of `0`, the boundary is placed at the end of the gap or overlap
+		# so that the offset before the transition is selected for those local times.
+		# With a &fold of `1`, the boundary is placed at the start so that the offset
+		# after the transition is selected. This corresponds to the semantics
+		# of &datetime.datetime.fold defined by PEP 495.
+
+		# The tables are built on first use and retained by the zone.
+		"""
+		try:
+			return self._tables[('local', fold)]
+		except KeyError:
+			pass
+
+		offsets = self.offsets
+		prior = offsets[-1][0] if offsets else self.default[0]
+		first = []
+		second = []
+		for t, o in zip(self.transitions, offsets):
+			after = o[0]
+			first.append(t.elapse(second=max(prior, after)))
+			second.append(t.elapse(second=min(prior, after)))
+			prior = after
+
+		tables = (tuple(first), tuple(second))
+		self._tables[('local', 0)], self._tables[('local', 1)] = tables
+		return tables[fold]
+
+	def to_utc(self, pit, fold = 0, search=bisect.bisect):
+		"""
+		# Get the UTC point in time corresponding to the local point in time, &pit.
+
+		# Local times that were skipped or repeated by a transition are resolved
+		# using &fold; see &local_transitions. Localizing the result with &localize
+		# reproduces &pit except when it falls within a gap.
+
+		# [ Parameters ]
+		# /pit/
+			# The wall clock time to convert.
+		# /fold/
+			# `0` to select the offset in effect before an ambiguous or skipped
+			# local time, `1` to select the offset in effect after.
+		"""
+		idx = search(self.local_transitions(fold), pit) - 1
+		try:
+			z = self.offsets[idx]
+		except IndexError:
+			z = self.default
+		return pit.rollback(z)
+
+	def to_utc_many(self, pits, fold = 0, search=bisect.bisect):
+		"""
+		# Get the UTC points in time corresponding to the local points in time, &pits.
+		# Equivalent to calling &to_utc for each item.
+
+		# Returns a list of points in time.
+		"""
+		table = self.local_transitions(fold)
+		offsets = self.offsets
+		default = self.default
+		if not offsets:
+			return [x.rollback(default) for x in pits]
+		return [x.rollback(offsets[search(table, x) - 1]) for x in pits]
+
+	def cursor(self):
+		"""
+		# Create a &Cursor for performing a series of lookups that are likely
+		# to fall within the same transition interval.
+		"""
+		return Cursor(self)
+
 	def slice(self, start, stop, search=bisect.bisect):
 		"""
 		# Get a slice of transition points and time zone offsets
@@ -154,10 +332,11 @@ class Zone(object):
 		# /stop/
 			# The end of the period.
 		"""
-		first_offset = search(self.transitions, start) - 1
-		last_offset = search(self.transitions, stop)
+		t = self._table(start)
+		first_offset = search(t, start) - 1
+		last_offset = search(t, stop)
 
-		trans = self.transitions[first_offset:last_offset]
+		trans = t[first_offset:last_offset]
 		offs = self.offsets[first_offset:last_offset]
 
 		return zip(trans, offs)
@@ -212,29 +391,217 @@ class Zone(object):
 		# convert the unix epoch timestamps in seconds to Y2K+1 in nanoseconds
 		offsets, transitions, leaps = tzd
 
-		transition_offsets = [zb(x[1]) for x in transitions]
-		transition_points = [construct(x[0]) for x in transitions]
+		transition_offsets = tuple([zb(x[1]) for x in transitions])
+		transition_points = tuple([construct(x[0]) for x in transitions])
 
 		default = offsets[0]
 
 		return Class(transition_points, transition_offsets, zb(default), leaps, name)
 
+	# Zones loaded by &from_bytes indexed by the digest of their TZif data.
+	_loaded = {}
+
 	@classmethod
-	def from_file(Class, construct, filepath):
-		return Class.from_tzif_data(
+	def from_bytes(Class, construct, data, name = None, digest=hashlib.sha256):
+		"""
+		# Construct a zone from the TZif &data.
+
+		# Identical data, such as that of links and backward compatible names,
+		# shares the transitions, offsets, and derived tables of the first zone
+		# loaded from it; only the &name differs.
+		"""
+		key = (Class, construct, digest(data).digest())
+		z = Class._loaded.get(key)
+		if z is not None:
+			return z.rename(name)
+
+		z = Class.from_tzif_data(
 			construct,
-			tzif.get_timezone_data(filepath),
-			name = filepath
+			tzif.structure(tzif.parse(data)),
+			name = name
 		)
+		Class._loaded[key] = z
+		return z
+
+	@classmethod
+	def from_file(Class, construct, filepath):
+		"""
+		# Construct a zone from the TZif file at &filepath.
+		"""
+		with open(filepath, 'rb') as f:
+			data = f.read()
+		return Class.from_bytes(construct, data, name = filepath)
 
 	@classmethod
 	def open(Class, construct, fp=None, _fsjoin=os.path.join):
+		"""
+		# Open the zone identified by &fp, the `TZ` environment variable, or the
+		# system's local time in that order.
+
+		# When the file is not present, the zone is loaded from the bundled
+		# database, &.zonedb, if one was built. A missing local time file
+		# selects the bundled `UTC` zone.
+		"""
 		if not fp:
 			fp = os.environ.get(tzif.tzenviron)
 
 		if not fp:
+			name = 'UTC'
 			fp = tzif.tzdefault
 		else:
+			name = fp
 			fp  = _fsjoin(tzif.tzdir, fp)
 
-		return Class.from_file(construct, fp)
+		try:
+			return Class.from_file(construct, fp)
+		except FileNotFoundError:
+			from . import zonedb
+			db = zonedb.bundled()
+			if db is None or name not in db:
+				raise
+			return db.open(construct, name, Zone=Class)
+
+class Cursor(object):
+	"""
+	# A lookup cursor over a &Zone that retains the transition interval of the
+	# last lookup. Lookups within the same interval are resolved with two comparisons;
+	# others gallop from the retained position using &Zone.find_from.
+
+	# The cursor's state is replaced with a single assignment, so sharing a cursor
+	# across threads yields correct offsets, but the retained interval is only
+	# useful when the lookups of a single thread are temporally local.
+
+	# [ Properties ]
+	# /zone/
+		# The &Zone being searched.
+	"""
+	__slots__ = ('zone', '_state',)
+
+	def __init__(self, zone):
+		self.zone = zone
+		self._state = None
+
+	def _interval(self, pit, index, offset):
+		t = self.zone._table(pit)
+		start = t[index] if index >= 0 else None
+		stop = t[index + 1] if index + 1 < len(t) else None
+		return (start, stop, index, offset, getattr(pit, 'unit', None))
+
+	def find(self, pit):
+		"""
+		# Get the appropriate offset in the zone for the given Point In Time, &pit.
+		# Equivalent to &Zone.find.
+		"""
+		state = self._state
+		if state is not None and state[4] == getattr(pit, 'unit', None):
+			start, stop, index, offset, unit = state
+			if (start is None or not pit < start) and (stop is None or pit < stop):
+				return offset
+		else:
+			index = -1
+
+		state = self._interval(pit, *self.zone.find_from(index, pit))
+		self._state = state
+		return state[3]
+
+	def localize(self, pit):
+		"""
+		# Given &pit, return the localized version according to the zone's transitions.
+		# Equivalent to &Zone.localize.
+		"""
+		offset = self.find(pit)
+		return (pit.elapse(offset), offset)
+
+class ZoneSet(object):
+	"""
+	# A collection of &Zone instances sharing a merged transition timeline so
+	# that a point in time can be localized into all of the zones with a single search.
+
+	# [ Properties ]
+	# /zones/
+		# The tuple of &Zone instances in the set.
+	# /transitions/
+		# The sorted union of the transitions of all the &zones.
+	# /offsets/
+		# The tuple of offsets, in &zones order, in effect at the corresponding
+		# &transitions entry.
+	# /initial/
+		# The tuple of offsets in effect before the first transition.
+	"""
+
+	def __init__(self, zones):
+		self.zones = tuple(zones)
+		self.transitions = sorted(set().union(*(z.transitions for z in self.zones)))
+		self.initial = tuple(z.offsets[-1] if z.offsets else z.default for z in self.zones)
+
+		# Walk the zones' transitions alongside the merged timeline.
+		indexes = [-1] * len(self.zones)
+		current = list(self.initial)
+		offsets = []
+		for t in self.transitions:
+			for i, z in enumerate(self.zones):
+				zt = z.transitions
+				n = indexes[i] + 1
+				while n < len(zt) and not t < zt[n]:
+					n += 1
+				n -= 1
+				if n != indexes[i]:
+					indexes[i] = n
+					current[i] = z.offsets[n]
+			offsets.append(tuple(current))
+		self.offsets = offsets
+
+	def __repr__(self):
+		return '<%s[%d zones/%d transitions]>' %(
+			self.__class__.__name__,
+			len(self.zones),
+			len(self.transitions),
+		)
+
+	def __len__(self):
+		return len(self.zones)
+
+	def __iter__(self):
+		return iter(self.zones)
+
+	import bisect
+	def find(self, pit, search=bisect.bisect):
+		"""
+		# Get the offsets of all the zones for the given Point In Time, &pit.
+
+		# Returns a tuple of &Zone.Offset instances in &zones order; each item is
+		# equal to the result of &Zone.find for the corresponding zone.
+		"""
+		idx = search(self.transitions, pit) - 1
+		if idx < 0:
+			return self.initial
+		return self.offsets[idx]
+
+	def localize(self, pit, search=bisect.bisect):
+		"""
+		# Given &pit, return the localized version for each of the zones.
+
+		# Returns a list of `(localized, offset)` pairs in &zones order.
+		# Points are only adjusted once for each distinct offset magnitude.
+		"""
+		idx = search(self.transitions, pit) - 1
+		offsets = self.initial if idx < 0 else self.offsets[idx]
+
+		adjusted = {}
+		r = []
+		for o in offsets:
+			m = o[0]
+			if m not in adjusted:
+				adjusted[m] = pit.elapse(o)
+			r.append((adjusted[m], o))
+		return r
+
+	def localize_many(self, pits):
+		"""
+		# Localize each point in &pits into all of the zones.
+
+		# Returns a list of the results of &localize for each item.
+		"""
+		localize = self.localize
+		return [localize(x) for x in pits]
+	del bisect
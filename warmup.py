@@ -0,0 +1,162 @@
+"""
+# Eager initialization of the caches used by time operations.
+
+# Pre-fork servers can call &warm in the parent process so that workers inherit
+# initialized conversion ratios, date resolutions, zones, and format paths
+# instead of building them on their first requests. With `freeze`, the objects
+# are moved into the permanent generation with &gc.freeze so that the garbage
+# collector does not write to their pages in the workers, leaving them shared.
+
+#!/syntax/python
+	from fault.time import warmup
+	report = warmup.warm(zones=('UTC', 'America/New_York'), freeze=True)
+	os.fork()
+
+#!/syntax/sh
+	python -m fault.time.warmup UTC America/New_York
+"""
+import sys
+import gc
+import tracemalloc
+
+from . import types
+from . import sysclock
+
+#: Units whose ratios are composed by &ratios.
+units = (
+	'nanosecond', 'microsecond', 'millisecond', 'second',
+	'minute', 'hour', 'day', 'week',
+	'month', 'year', 'decade', 'century',
+)
+
+#: Zones loaded by &warm when none are given.
+default_zones = ('UTC',)
+
+#: Sample text used to exercise the parsers of the formats.
+samples = {
+	'iso': '2000-01-02T03:04:05.006007008',
+	'rfc': 'Sun, 02 Jan 2000 03:04:05 GMT',
+}
+
+def ratios(context=types.Context, units=units):
+	"""
+	# Compose the ratios between the like terms of &units.
+
+	# Returns the number of compositions performed.
+	"""
+	count = 0
+	for a in units:
+		for b in units:
+			if context.terms[a] == context.terms[b]:
+				context.compose(a, b)
+				count += 1
+	return count
+
+def dates(days=None, context=types.Context, now=sysclock.now):
+	"""
+	# Resolve the Gregorian dates of the days preceding and following the current day.
+
+	# When &days is &None, the size of the context's &.gregorian.DateCache is used.
+	# Returns the number of days resolved.
+	"""
+	cache = context.constants['date_cache']
+	if days is None:
+		days = cache.size
+
+	# Oldest first so that the current day is evicted last.
+	today = now().select('day')
+	for d in range(today - days + 2, today + 2):
+		cache.resolve(d)
+	return days
+
+def formats(context=types.Context, Types=(types.Timestamp, types.Date), samples=samples):
+	"""
+	# Format and parse points of &Types with each of the &samples.
+
+	# Returns the number of formats exercised.
+	"""
+	for id, text in samples.items():
+		for Type in Types:
+			pit = Type.of(**{id: text})
+			pit.select(id)
+		pit.elapse(hour=1).select('date')
+	return len(samples)
+
+def open_zones(names=default_zones, construct=types.from_unix_timestamp, Types=(types.Date,)):
+	"""
+	# Open the zones identified by &names and build their derived tables.
+
+	# Returns the list of &.views.Zone instances.
+	"""
+	from . import views
+	r = []
+	for name in names:
+		z = views.Zone.open(construct, name)
+		for Type in Types:
+			z.transitions_for(Type)
+		z.local_transitions(0)
+		r.append(z)
+	return r
+
+def warm(zones=default_zones, freeze=False, context=types.Context):
+	"""
+	# Initialize the caches used by time operations.
+
+	# Returns a list of `(name, count, bytes)` tuples describing each step; `count`
+	# is the number of items warmed and `bytes` the memory allocated by the step.
+	# The loaded zones are retained by the context's constants as `'warmed_zones'`.
+
+	# [ Parameters ]
+	# /zones/
+		# The names of the zones to load.
+	# /freeze/
+		# Whether to call &gc.freeze after the caches have been initialized.
+	"""
+	steps = [
+		('ratios', lambda: ratios(context)),
+		('dates', lambda: dates(context=context)),
+		('formats', lambda: formats(context)),
+		('zones', lambda: len(_load_zones(context, zones))),
+	]
+
+	tracing = tracemalloc.is_tracing()
+	if not tracing:
+		tracemalloc.start()
+
+	report = []
+	try:
+		for name, step in steps:
+			before = tracemalloc.get_traced_memory()[0]
+			count = step()
+			after = tracemalloc.get_traced_memory()[0]
+			report.append((name, count, after - before))
+	finally:
+		if not tracing:
+			tracemalloc.stop()
+
+	if freeze:
+		gc.freeze()
+		report.append(('frozen', gc.get_freeze_count(), 0))
+
+	return report
+
+def _load_zones(context, names):
+	loaded = context.constants.setdefault('warmed_zones', {})
+	for z in open_zones(names):
+		loaded[z.name] = z
+	return names
+
+def main(args):
+	import argparse
+	p = argparse.ArgumentParser(prog='python -m fault.time.warmup')
+	p.add_argument('zones', nargs='*', default=list(default_zones), metavar='zone',
+		help="zones to load")
+	p.add_argument('--freeze', action='store_true', default=False)
+	options = p.parse_args(args)
+
+	sys.stdout.write("%-10s %10s %12s\n" %('step', 'count', 'bytes'))
+	for name, count, size in warm(options.zones, options.freeze):
+		sys.stdout.write("%-10s %10d %12d\n" %(name, count, size))
+
+if __name__ == '__main__':
+	main(sys.argv[1:])
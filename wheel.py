@@ -0,0 +1,279 @@
+"""
+# Hierarchical timing wheel for deadlines.
+
+# &Wheel holds timers keyed by &types.Timestamp or by &types.Measure instances read
+# from &sysclock.elapsed. Scheduling and cancellation are constant time, and expired
+# timers are collected in batches by &Wheel.advance.
+
+#!/syntax/python
+	from fault.time import wheel, sysclock
+	w = wheel.Wheel('millisecond', origin=sysclock.elapsed())
+	t = w.schedule(sysclock.elapsed().increase(second=30), request)
+	...
+	for request in w.advance(sysclock.elapsed()):
+		request.timeout()
+
+# A wheel only compares integers, so all the deadlines given to a wheel must come from
+# the same clock. &Loop arms a single asyncio callback for the next occupied slot of
+# a wheel using the monotonic clock.
+"""
+from . import types
+from . import sysclock
+from .index import key
+
+class Timer(object):
+	"""
+	# Handle for a scheduled deadline. Returned by &Wheel.schedule and used to cancel.
+	"""
+	__slots__ = ('deadline', 'payload', '_tick', '_slot', '_level')
+
+	def __init__(self, deadline, payload, tick):
+		self.deadline = deadline
+		self.payload = payload
+		self._tick = tick
+		self._slot = None
+		self._level = None
+
+	def __repr__(self):
+		return '<%s: %r>' %(self.__class__.__name__, self.deadline)
+
+	@property
+	def scheduled(self) -> bool:
+		"""
+		# Whether the timer is still held by its wheel.
+		"""
+		return self._slot is not None
+
+class Wheel(object):
+	"""
+	# Hierarchical timing wheel.
+
+	# Level zero has one slot per tick; each subsequent level has slots covering a full
+	# rotation of the prior level. Timers beyond the last level are held in an overflow
+	# set that is redistributed once per rotation of the last level.
+
+	# [ Properties ]
+	# /resolution/
+		# The number of nanoseconds in a tick.
+	# /tick/
+		# The tick that the wheel has advanced to.
+	"""
+
+	def __init__(self, resolution='millisecond', origin=0, bits=8, levels=4):
+		if isinstance(resolution, str):
+			resolution = types.Context.convert(resolution, 'nanosecond', 1)
+		else:
+			resolution = key(resolution)
+		if int(resolution) != resolution or resolution < 1:
+			raise ValueError("resolution must be a whole number of nanoseconds")
+
+		self.resolution = int(resolution)
+		self.bits = bits
+		self.levels = levels
+		self._mask = (1 << bits) - 1
+		self._wheels = [[set() for x in range(1 << bits)] for l in range(levels)]
+		self._counts = [0] * levels
+		self._overflow = set()
+		self._due = set()
+		self.tick = key(origin) // self.resolution
+
+	def __len__(self):
+		return sum(self._counts) + len(self._overflow) + len(self._due)
+
+	def __repr__(self):
+		return '<%s: %d timers at tick %d>' %(self.__class__.__name__, len(self), self.tick)
+
+	def _place(self, timer):
+		e = timer._tick
+		diff = e - self.tick
+		level = None
+		if diff <= 0:
+			slot = self._due
+		else:
+			bits = self.bits
+			level = (diff.bit_length() - 1) // bits
+			if level >= self.levels:
+				slot = self._overflow
+				level = None
+			else:
+				slot = self._wheels[level][(e >> (level * bits)) & self._mask]
+				self._counts[level] += 1
+		slot.add(timer)
+		timer._slot = slot
+		timer._level = level
+
+	def schedule(self, deadline, payload=None) -> Timer:
+		"""
+		# Add a timer expiring at &deadline. The &payload is returned by &advance
+		# once the deadline has been reached.
+		"""
+		k = key(deadline)
+		# Round up so that timers never expire early.
+		t = Timer(deadline, payload, -((-k) // self.resolution))
+		self._place(t)
+		return t
+
+	def cancel(self, timer) -> bool:
+		"""
+		# Remove the &timer from the wheel. Returns &False if it was not scheduled.
+		"""
+		slot = timer._slot
+		if slot is None:
+			return False
+
+		if timer._level is not None:
+			self._counts[timer._level] -= 1
+		slot.discard(timer)
+		timer._slot = None
+		return True
+
+	def _cascade(self, level):
+		slot = self._wheels[level][(self.tick >> (level * self.bits)) & self._mask]
+		if not slot:
+			return
+		timers = list(slot)
+		slot.clear()
+		self._counts[level] -= len(timers)
+		for t in timers:
+			self._place(t)
+
+	def _expire(self, slot, expired):
+		for t in slot:
+			t._slot = None
+			expired.append(t.payload)
+		slot.clear()
+
+	def advance(self, now) -> list:
+		"""
+		# Advance the wheel to &now and collect the payloads of the expired timers.
+		"""
+		target = key(now) // self.resolution
+		bits = self.bits
+		mask = self._mask
+		counts = self._counts
+		levels = self.levels
+		expired = []
+
+		if self._due:
+			self._expire(self._due, expired)
+
+		while self.tick < target:
+			# Skip the ticks of empty levels.
+			l = 0
+			while l < levels and not counts[l]:
+				l += 1
+			if l == levels and not self._overflow:
+				self.tick = target
+				break
+			if l > 0:
+				boundary = ((self.tick >> (l * bits)) + 1) << (l * bits)
+				if boundary > target:
+					self.tick = target
+					break
+				self.tick = boundary - 1
+
+			self.tick += 1
+			t = self.tick
+
+			# Redistribute the higher levels whose slot boundary was reached.
+			if not (t & ((1 << (levels * bits)) - 1)) and self._overflow:
+				timers = list(self._overflow)
+				self._overflow.clear()
+				for x in timers:
+					self._place(x)
+			for l in range(levels - 1, 0, -1):
+				if not (t & ((1 << (l * bits)) - 1)):
+					self._cascade(l)
+
+			slot = self._wheels[0][t & mask]
+			if slot:
+				counts[0] -= len(slot)
+				self._expire(slot, expired)
+			if self._due:
+				self._expire(self._due, expired)
+
+		return expired
+
+	def horizon(self):
+		"""
+		# Get the earliest time, in the wheel's clock, that &advance may have timers
+		# to expire; &None when the wheel is empty.
+
+		# The result is exact for timers in the first level, and otherwise refers
+		# to the next redistribution of a higher level.
+		"""
+		if self._due:
+			return self.tick * self.resolution
+
+		bits = self.bits
+		mask = self._mask
+		t = self.tick
+		if self._counts[0]:
+			w = self._wheels[0]
+			for i in range(1, mask + 2):
+				if w[(t + i) & mask]:
+					return (t + i) * self.resolution
+
+		for l in range(1, self.levels):
+			if self._counts[l]:
+				return (((t >> (l * bits)) + 1) << (l * bits)) * self.resolution
+
+		if self._overflow:
+			return (((t >> (self.levels * bits)) + 1) << (self.levels * bits)) * self.resolution
+		return None
+
+class Loop(object):
+	"""
+	# Drive a &Wheel from an asyncio event loop using the monotonic clock.
+
+	# Timer payloads are `(callback, args)` pairs. A single loop handle is kept armed
+	# for the wheel's &Wheel.horizon; scheduling an earlier timer re-arms it.
+	"""
+
+	def __init__(self, wheel=None, loop=None, clock=sysclock._monotonic_clock_read):
+		import asyncio
+		self.clock = clock
+		self.wheel = wheel if wheel is not None else Wheel('millisecond', origin=clock())
+		self.loop = loop if loop is not None else asyncio.get_event_loop()
+		self._handle = None
+		self._armed = None
+
+	def call_at(self, deadline, callback, *args) -> Timer:
+		"""
+		# Call &callback with &args once the monotonic &deadline has been reached.
+		"""
+		t = self.wheel.schedule(deadline, (callback, args))
+		self._arm()
+		return t
+
+	def call_later(self, delay, callback, *args) -> Timer:
+		"""
+		# Call &callback with &args after the &types.Measure &delay.
+		"""
+		return self.call_at(self.clock() + key(delay), callback, *args)
+
+	def cancel(self, timer) -> bool:
+		"""
+		# Cancel the &timer. The armed loop handle is left in place.
+		"""
+		return self.wheel.cancel(timer)
+
+	def _arm(self):
+		h = self.wheel.horizon()
+		if h is None:
+			return
+		if self._armed is not None and self._armed <= h:
+			return
+
+		if self._handle is not None:
+			self._handle.cancel()
+		delay = max(0, h - self.clock()) / 1000000000
+		self._armed = h
+		self._handle = self.loop.call_later(delay, self._fire)
+
+	def _fire(self):
+		self._handle = None
+		self._armed = None
+		for callback, args in self.wheel.advance(self.clock()):
+			self.loop.call_soon(callback, *args)
+		self._arm()
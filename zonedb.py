@@ -0,0 +1,192 @@
+"""
+# Compact zone database bundled as a package resource.
+
+# The database is a single file holding the TZif data of each zone by name.
+# Zones with identical data, such as links, refer to the same payload. It is read
+# with &importlib.resources; when the package is installed on a file system,
+# the file is memory mapped and payloads are sliced without copying.
+
+# The resource is not distributed with the sources; it is built from a zoneinfo
+# directory when packaging:
+
+#!/syntax/sh
+	python -m fault.time.zonedb /usr/share/zoneinfo
+
+# &.views.Zone.open falls back to the bundled database when the system
+# does not provide the requested zone.
+
+# [ Format ]
+# The file starts with a header, `!4sHHI`, containing the &magic, the format
+# &version, a reserved field, and the number of entries. Each entry, `!HII`,
+# holds the length of the name, and the offset and length of the payload,
+# followed by the UTF-8 encoded name. The payloads follow the last entry
+# and offsets are relative to the first payload.
+"""
+import os
+import os.path
+import sys
+import struct
+import functools
+
+from . import tzif
+
+magic = b'FTZD'
+version = 1
+
+#: The name of the package resource.
+resource = 'zones.db'
+
+#: Directories in zoneinfo trees that are skipped by &build.
+excluded = ('posix', 'right')
+
+header_struct = struct.Struct('!4sHHI')
+entry_struct = struct.Struct('!HII')
+
+class Database(object):
+	"""
+	# A read-only view of a zone database.
+
+	# [ Properties ]
+	# /index/
+		# Mapping of zone names to the offset and length of their payloads.
+	"""
+
+	def __init__(self, buffer):
+		view = memoryview(buffer)
+		m, v, reserved, count = header_struct.unpack_from(view, 0)
+		if m != magic:
+			raise ValueError("not a zone database")
+		if v != version:
+			raise ValueError("unsupported zone database version: " + str(v))
+
+		index = {}
+		position = header_struct.size
+		for i in range(count):
+			namelen, offset, length = entry_struct.unpack_from(view, position)
+			position += entry_struct.size
+			name = bytes(view[position:position+namelen]).decode('utf-8')
+			position += namelen
+			index[name] = (offset, length)
+
+		self.index = index
+		self._data = view[position:]
+
+	def __repr__(self):
+		return '<%s: %d zones>' %(self.__class__.__name__, len(self.index))
+
+	def __len__(self):
+		return len(self.index)
+
+	def __contains__(self, name):
+		return name in self.index
+
+	def __iter__(self):
+		return iter(sorted(self.index))
+
+	def data(self, name) -> memoryview:
+		"""
+		# Get the TZif data of the zone identified by &name.
+		"""
+		offset, length = self.index[name]
+		return self._data[offset:offset+length]
+
+	def open(self, construct, name, Zone=None):
+		"""
+		# Construct the &.views.Zone identified by &name.
+		"""
+		if Zone is None:
+			from .views import Zone
+		return Zone.from_bytes(construct, bytes(self.data(name)), name = name)
+
+def scan(tzdir, excluded=excluded, _join=os.path.join):
+	"""
+	# Identify the TZif files in &tzdir.
+
+	# Returns an iterator producing pairs of the zone name and file path.
+	"""
+	prefixlen = len(tzdir.rstrip('/')) + 1
+	for dirpath, dirnames, filenames in os.walk(tzdir):
+		if dirpath == tzdir:
+			dirnames[:] = [x for x in dirnames if x not in excluded]
+		dirnames.sort()
+		for x in sorted(filenames):
+			path = _join(dirpath, x)
+			with open(path, 'rb') as f:
+				if f.read(len(tzif.magic)) != tzif.magic:
+					continue
+			yield (path[prefixlen:], path)
+
+def build(zones) -> bytes:
+	"""
+	# Serialize the database containing the &zones; pairs of names and TZif data.
+	"""
+	payloads = {}
+	chunks = []
+	size = 0
+	entries = []
+	for name, data in zones:
+		data = bytes(data)
+		if data not in payloads:
+			payloads[data] = size
+			chunks.append(data)
+			size += len(data)
+		entries.append((name.encode('utf-8'), payloads[data], len(data)))
+
+	parts = [header_struct.pack(magic, version, 0, len(entries))]
+	for name, offset, length in entries:
+		parts.append(entry_struct.pack(len(name), offset, length))
+		parts.append(name)
+	parts.extend(chunks)
+	return b''.join(parts)
+
+def load(package=__package__, resource=resource):
+	"""
+	# Load the database from the &resource of &package.
+	# &None when the resource is not present.
+	"""
+	import importlib.resources
+	import mmap
+
+	ref = importlib.resources.files(package).joinpath(resource)
+	if not ref.is_file():
+		return None
+
+	if isinstance(ref, os.PathLike):
+		with open(ref, 'rb') as f:
+			return Database(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+	# Zip archive or other loader; read the entire resource.
+	return Database(ref.read_bytes())
+
+@functools.lru_cache(1)
+def bundled():
+	"""
+	# Get the bundled &Database; &None when it was not built.
+	"""
+	try:
+		return load()
+	except (ImportError, OSError, ValueError):
+		return None
+
+def main(args):
+	import argparse
+	p = argparse.ArgumentParser(prog='python -m fault.time.zonedb')
+	p.add_argument('tzdir', nargs='?', default=tzif.tzdir,
+		help="zoneinfo directory to read the zones from")
+	p.add_argument('--output', default=os.path.join(os.path.dirname(__file__), resource),
+		help="path of the database to write; defaults to the package resource")
+	options = p.parse_args(args)
+
+	zones = []
+	for name, path in scan(options.tzdir):
+		with open(path, 'rb') as f:
+			zones.append((name, f.read()))
+
+	data = build(zones)
+	with open(options.output, 'wb') as f:
+		f.write(data)
+
+	sys.stderr.write("%d zones, %d bytes: %s\n" %(len(zones), len(data), options.output))
+
+if __name__ == '__main__':
+	main(sys.argv[1:])